@@ -0,0 +1,42 @@
+import time
+from pathlib import Path
+from typing import Any, Callable, Iterable
+
+FIXTURE_DIR = Path(__file__).parent.parent / "tests" / "fixture_data"
+
+
+def best_of(func: Callable[[], Any], repeat: int = 5) -> float:
+    """
+    Best wall-clock time in seconds over `repeat` runs of `func`.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def fixture_texts() -> list[str]:
+    """
+    All non-empty input texts from the csv fixture corpora.
+    """
+    import csv
+
+    texts: list[str] = []
+    for path in sorted(FIXTURE_DIR.glob("*.csv")):
+        with open(path, newline="", encoding="utf-8-sig") as f:
+            for row in csv.DictReader(f):
+                text = (row.get("Input Data") or "").strip()
+                if text:
+                    texts.append(text)
+    return texts
+
+
+def report(title: str, rows: Iterable[tuple[str, str]]) -> None:
+    rows = list(rows)
+    width = max(len(label) for label, _ in rows)
+    print(f"\n{title}")
+    print("-" * len(title))
+    for label, value in rows:
+        print(f"{label:<{width}}  {value}")
@@ -0,0 +1,92 @@
+"""
+Alphanumeric fast path benchmark.
+
+Tokenizes unit-dense lab text (70kg, 5.4mmol/L, T2N0M0, c4d17x1, ...),
+lines of alphanumeric shorthand only, and the fixture notes with the suffix and infix fast paths and with the plain spaCy patterns,
+with the tokenizer cache flushed before each run so every chunk is split
+from scratch, and checks both give the same tokens.
+"""
+import random
+
+from cava_nlp import CaVaLang
+from cava_nlp.tokenization.alnum import AlnumFastPath
+from cava_nlp.tokenization.tokenizer import CaVaTokenizer
+
+from ._common import best_of, fixture_texts, report
+
+N_TEXTS = 3_000
+
+
+def lab_texts(n: int, seed: int = 0) -> list[str]:
+    rng = random.Random(seed)
+    r = rng.randint
+    return [
+        f"Na {r(120, 160)}mmol/L K {r(25, 65) / 10}mmol/L Cr {r(30, 900)}umol/L "
+        f"Hb {r(60, 180)}g/L Plt {r(10, 900)}x10^9/L wt {r(300, 1500) / 10}kg ht {r(1400, 2000) / 10}cm "
+        f"BSA {r(120, 260) / 100}m2 T{r(1, 4)}N{r(0, 3)}M{r(0, 1)} c{r(1, 12)}d{r(1, 28)}x{r(1, 3)} "
+        f"dose {r(10, 2500)}mg q{r(1, 4)}w\n"
+        for _ in range(n)
+    ]
+
+
+def alnum_texts(n: int, seed: int = 0) -> list[str]:
+    """
+    Lines of mixed alphanumeric shorthand only, mostly distinct.
+    """
+    rng = random.Random(seed)
+    r = rng.randint
+    chunks = (
+        lambda: f"{r(10, 99999)}kg",
+        lambda: f"T{r(1, 4)}N{r(0, 3)}M{r(0, 1)}x{r(0, 999)}",
+        lambda: f"c{r(1, 99)}d{r(1, 99)}x{r(1, 999)}",
+    )
+    return [" ".join(rng.choice(chunks)() for _ in range(20)) for _ in range(n)]
+
+
+def with_patterns(nlp: CaVaLang, fast: bool) -> CaVaTokenizer:
+    """
+    A copy of the pipeline tokenizer, with or without the fast paths.
+    """
+    tok = nlp.tokenizer
+
+    def pattern(func):
+        return func if fast or not isinstance(func, AlnumFastPath) else func.method
+
+    return CaVaTokenizer(
+        nlp.vocab, rules=dict(tok.rules), prefix_search=tok.prefix_search,
+        suffix_search=pattern(tok.suffix_search), infix_finditer=pattern(tok.infix_finditer),
+        token_match=tok.token_match, url_match=tok.url_match,
+    )
+
+
+def main() -> None:
+    nlp = CaVaLang(sentencizer="clinical")
+    rows = []
+    corpora = (
+        ("lab text", lab_texts(N_TEXTS)),
+        ("alnum shorthand", alnum_texts(N_TEXTS)),
+        ("fixture notes", fixture_texts()),
+    )
+    for label, texts in corpora:
+        results = {}
+        for fast in (False, True):
+            tokenizer = with_patterns(nlp, fast)
+            results[fast] = [[t.text for t in tokenizer(text)] for text in texts]
+            n_tokens = sum(map(len, results[fast]))
+
+            def run() -> None:
+                tokenizer._flush_cache()
+                for text in texts:
+                    tokenizer(text)
+
+            t = best_of(run, repeat=5)
+            rows.append((
+                f"{label}, {'fast path' if fast else 'spaCy patterns'}",
+                f"{n_tokens / t:12,.0f} tokens/s",
+            ))
+        assert results[False] == results[True], f"{label}: token mismatch"
+    report(f"tokenizer, cold cache ({N_TEXTS} generated lines)", rows)
+
+
+if __name__ == "__main__":
+    main()
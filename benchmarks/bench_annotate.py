@@ -0,0 +1,85 @@
+"""
+Non-merging normalisation benchmark.
+
+Runs the clinical normaliser, then the ECOG rule engine, over long notes
+made of many lab reports, where the normaliser finds hundreds of dates,
+times, ranges and units per note. The normaliser merges them sequentially,
+merges them in one fused pass, or annotates them as spans without merging
+(``merge=False``). Each stage is timed separately.
+"""
+import time
+
+import cava_nlp.rule_engine  # noqa: F401 (registers the rule_engine factory)
+from cava_nlp import CaVaLang
+
+from ._common import report
+from .bench_literals import lab_reports
+
+N_TOKENS = 40_000
+REPORTS_PER_NOTE = (10, 100)
+REPEAT = 3
+MODES = (
+    ("merge, sequential", {"fused": False}),
+    ("merge, fused", {"fused": True}),
+    ("annotate", {"merge": False}),
+)
+REVIEW = "Review at 2:30pm on 14/03/2024: ECOG 0-1, dose 5-10 mg, BP 120/80.\n"
+
+
+def long_notes(reports_per_note: int, n_notes: int) -> list[str]:
+    reports = lab_reports(reports_per_note * n_notes)
+    return [
+        "".join(r + REVIEW for r in reports[i:i + reports_per_note])
+        for i in range(0, len(reports), reports_per_note)
+    ]
+
+
+def build_pipeline(config: dict) -> CaVaLang:
+    nlp = CaVaLang(sentencizer="clinical")
+    nlp.add_pipe("clinical_normalizer", config=config)
+    nlp.add_pipe(
+        "rule_engine",
+        name="ecog_value",
+        config={"engine_config_path": None, "component_name": "ecog_status"},
+    )
+    return nlp
+
+
+def time_stages(nlp: CaVaLang, texts: list[str]) -> tuple[float, float]:
+    """
+    Best times in seconds of the normaliser and of the engine over `texts`,
+    each run on freshly sentencized docs.
+    """
+    sentencizer = nlp.get_pipe("clinical_sentencizer")
+    normalizer = nlp.get_pipe("clinical_normalizer")
+    engine = nlp.get_pipe("ecog_value")
+    t_norm = t_engine = float("inf")
+    for _ in range(REPEAT):
+        docs = [sentencizer(nlp.make_doc(text)) for text in texts]
+        start = time.perf_counter()
+        docs = [normalizer(doc) for doc in docs]
+        mid = time.perf_counter()
+        for doc in docs:
+            engine(doc)
+        end = time.perf_counter()
+        t_norm = min(t_norm, mid - start)
+        t_engine = min(t_engine, end - mid)
+    return t_norm, t_engine
+
+
+def main() -> None:
+    for per_note in REPORTS_PER_NOTE:
+        probe = CaVaLang()
+        tokens_per_note = len(probe.make_doc(long_notes(per_note, 1)[0]))
+        texts = long_notes(per_note, max(1, N_TOKENS // tokens_per_note))
+        n_tokens = sum(len(probe.make_doc(text)) for text in texts)
+        rows = []
+        for label, config in MODES:
+            t_norm, t_engine = time_stages(build_pipeline(config), texts)
+            rows.append((f"{label}: normaliser", f"{n_tokens / t_norm:10,.0f} tokens/s"))
+            rows.append((f"{label}: ECOG engine", f"{n_tokens / t_engine:10,.0f} tokens/s"))
+        report(f"{len(texts)} notes of ~{n_tokens // len(texts):,} tokens", rows)
+
+
+if __name__ == "__main__":
+    main()
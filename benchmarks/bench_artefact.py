@@ -0,0 +1,37 @@
+"""
+Tokenizer artefact benchmark.
+
+Each construction runs in a fresh interpreter, as in a multi-worker
+deployment, and reports the median over several runs of CaVaLang()
+built from scratch, built while writing a tokenizer artefact, and built
+from that artefact.
+"""
+import tempfile
+from pathlib import Path
+
+from ._common import report
+from .bench_startup import RUNS, cold_time
+
+SETUP = "from cava_nlp import CaVaLang"
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "tokenizer.json"
+        build = f"CaVaLang(sentencizer='clinical', tokenizer_artefact={str(path)!r})"
+        steps = {
+            "from scratch": "CaVaLang(sentencizer='clinical')",
+            # the artefact is removed before each run, so every run writes it
+            "writing the artefact": f"import os; os.remove({str(path)!r}) if os.path.exists({str(path)!r}) else None; {build}",
+            "from the artefact": build,
+        }
+        rows = []
+        for label, step in steps.items():
+            step_time, _ = cold_time(SETUP, step)
+            rows.append((label, f"{step_time * 1000:8.1f} ms"))
+        rows.append(("artefact size", f"{path.stat().st_size / 1024:8.1f} KiB"))
+    report(f"CaVaLang(sentencizer='clinical') construction, median of {RUNS} fresh interpreters", rows)
+
+
+if __name__ == "__main__":
+    main()
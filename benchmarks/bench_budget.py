@@ -0,0 +1,41 @@
+"""
+Time budget benchmark.
+
+Mixes the fixture notes with a few pathological inputs (a run of dates
+through the date normaliser's dateparser fallback, a repeated ECOG phrase
+through the rule engine) and compares the batch time with and without ``TimeBudget``.
+"""
+import time
+
+from cava_nlp.pipeline import TimeBudget
+
+from ._common import fixture_texts, report
+from .bench_cache import build_pipeline
+
+PATHOLOGICAL = [
+    " ".join(f"12/0{i % 9 + 1}/20{i % 99:02d}" for i in range(300)),
+    "ECOG 1 " * 800,
+]
+
+
+def main() -> None:
+    nlp = build_pipeline()
+    texts = fixture_texts() * 2 + PATHOLOGICAL
+    rows = [("notes", f"{len(texts):,} ({len(PATHOLOGICAL)} pathological)")]
+
+    start = time.perf_counter()
+    list(nlp.pipe(texts))
+    rows.append(("nlp.pipe", f"{(time.perf_counter() - start) * 1000:8.1f} ms"))
+
+    budget = TimeBudget(nlp, per_doc=0.5, per_component=0.2)
+    start = time.perf_counter()
+    list(budget.pipe(texts))
+    rows.append(("TimeBudget.pipe", f"{(time.perf_counter() - start) * 1000:8.1f} ms"))
+    rows.append(("degraded docs", str(budget.degraded_docs)))
+    for name, count in budget.timeouts.most_common():
+        rows.append((f"  timeouts: {name}", str(count)))
+    report("per-document time budget (0.5 s doc, 0.2 s component)", rows)
+
+
+if __name__ == "__main__":
+    main()
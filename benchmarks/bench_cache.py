@@ -0,0 +1,64 @@
+"""
+Whole-document cache benchmark.
+
+Builds a copy-forward style corpus, where a share of the notes are exact
+repeats of earlier ones, and compares ``nlp.pipe`` with ``DocCache.pipe``
+(cold in-memory tier) on a pipeline with normalisation, rule engines and
+ConText.
+"""
+import random
+
+from cava_nlp import CaVaLang
+from cava_nlp.caching import DocCache
+from cava_nlp.context.hooks import enable_context
+from cava_nlp.rule_engine import RuleEngine # type: ignore
+from cava_nlp.structural import DocumentLayout # type: ignore
+
+from ._common import best_of, fixture_texts, report
+
+
+def build_pipeline() -> CaVaLang:
+    nlp = CaVaLang()
+    nlp.add_pipe("clinical_normalizer")
+    nlp.add_pipe("document_layout")
+    for name, component in (("ecog_value", "ecog_status"), ("variants", "variants_of_interest")):
+        nlp.add_pipe(
+            "rule_engine",
+            name=name,
+            config={"engine_config_path": None, "component_name": component},
+        )
+    enable_context(nlp)
+    nlp.add_pipe("resolve_closest_context", last=True)
+    return nlp
+
+
+def corpus(texts: list[str], notes: int, repeat_share: float) -> list[str]:
+    rng = random.Random(0)
+    out: list[str] = []
+    for _ in range(notes):
+        if out and rng.random() < repeat_share:
+            out.append(rng.choice(out))
+        else:
+            out.append("\n".join(rng.choice(texts) for _ in range(20)))
+    return out
+
+
+def main() -> None:
+    nlp = build_pipeline()
+    fixtures = fixture_texts()
+    for share in (0.0, 0.5, 0.8):
+        notes = corpus(fixtures, 300, share)
+        rows = [("unique notes", f"{len(set(notes)):,} / {len(notes):,}")]
+        t = best_of(lambda: list(nlp.pipe(notes)), repeat=3)
+        rows.append(("nlp.pipe", f"{t * 1000:8.1f} ms"))
+        t = best_of(lambda: list(DocCache(nlp).pipe(notes)), repeat=3)
+        rows.append(("DocCache.pipe (cold)", f"{t * 1000:8.1f} ms"))
+        cache = DocCache(nlp)
+        list(cache.pipe(notes))
+        t = best_of(lambda: list(cache.pipe(notes)), repeat=3)
+        rows.append(("DocCache.pipe (warm)", f"{t * 1000:8.1f} ms"))
+        report(f"repeat share {share:.0%}", rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""
+Column extraction benchmark.
+
+Builds low-cardinality "Performance status" and "Weight" style columns
+and compares running every row through ``short_text_pipeline`` with
+``extract_columns``, which processes each distinct value once.
+"""
+import random
+import time
+
+from cava_nlp.pipeline import extract_columns, short_text_pipeline
+
+from ._common import report
+
+ROWS = 20_000
+
+
+def column(rng: random.Random) -> list[str]:
+    distinct = (
+        [f"ECOG {i}" for i in range(5)]
+        + [f"PS {i}" for i in range(5)]
+        + [f"ecog {i}-{i + 1}" for i in range(4)]
+        + [f"{w}kg" for w in range(40, 120, 2)]
+        + ["not recorded", "see notes"]
+    )
+    return [rng.choice(distinct) for _ in range(ROWS)]
+
+
+def main() -> None:
+    nlp = short_text_pipeline(["ecog_status"])
+    values = column(random.Random(0))
+    rows = [("rows", f"{len(values):,}"), ("distinct", f"{len(set(values)):,}")]
+
+    start = time.perf_counter()
+    per_row = [
+        doc.spans["ecog"][0]._.value if doc.spans.get("ecog") else None
+        for doc in nlp.pipe(values, outputs=["ecog"])
+    ]
+    rows.append(("nlp.pipe per row", f"{(time.perf_counter() - start) * 1000:9.1f} ms"))
+
+    start = time.perf_counter()
+    columns = extract_columns(nlp, values)
+    rows.append(("extract_columns", f"{(time.perf_counter() - start) * 1000:9.1f} ms"))
+    assert columns["ecog"] == per_row
+    report("column extraction", rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Structural date parsing benchmark.
+
+Runs the clinical normaliser with the dateparser-based and the
+structural date normaliser over notes with a date in every supported
+shape, with the parse cache disabled so every date is parsed, and
+reports the throughput of each and how many dates differ.
+"""
+import random
+
+from cava_nlp import CaVaLang
+
+from ._common import best_of, report
+
+N_NOTES = 500
+MONTHS = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Sept",
+          "Oct", "Nov", "Dec", "January", "March", "September", "December"]
+
+
+def dated_notes(n: int, seed: int = 0) -> list[str]:
+    rng = random.Random(seed)
+
+    def one_date() -> str:
+        d, m = rng.randint(1, 31), rng.randint(1, 12)
+        y4 = rng.randint(1960, 2030)
+        y = rng.choice([str(y4), f"{y4 % 100:02d}"])
+        mon = rng.choice(MONTHS)
+        sep = rng.choice(["/", "-", "."])
+        return rng.choice([
+            f"{d}{sep}{m}{sep}{y}",
+            f"{d:02d}-{m:02d}-{y4} {rng.randint(0, 23):02d}:{rng.randint(0, 59):02d}:{rng.randint(0, 59):02d}",
+            f"{y4}-{m:02d}-{d:02d}",
+            f"{m}/{y4}",
+            f"{d}{sep}{mon}{sep}{y}",
+            f"{mon} {rng.randint(1, 19)}th {y4}",
+            f"{d} {mon} {y}",
+            f"{mon} {y4}",
+            f"{mon} '{y4 % 100:02d}",
+        ])
+
+    return [
+        f"Seen in clinic {one_date()}. Scan on {one_date()} showed stable disease.\n"
+        f"Next review {one_date()}, bloods {one_date()}."
+        for _ in range(n)
+    ]
+
+
+def main() -> None:
+    texts = dated_notes(N_NOTES)
+    rows = []
+    outputs = []
+    for label, structural in (("dateparser", False), ("structural", True)):
+        nlp = CaVaLang(sentencizer="clinical")
+        nlp.add_pipe("clinical_normalizer", config={
+            "structural_dates": structural, "parse_cache_size": 0,
+        })
+        docs = list(nlp.pipe(texts))
+        outputs.append([(t.text, t.norm_) for doc in docs for t in doc if t._.kind == "date"])
+        n_dates = len(outputs[-1])
+        t = best_of(lambda: list(nlp.pipe(texts)), repeat=3)
+        rows.append((label, f"{n_dates / t:12,.0f} dates/s"))
+    differ = sum(a != b for a, b in zip(*outputs))
+    rows.append(("differing dates", f"{differ} of {len(outputs[0])}"))
+    report(f"date normalisation ({N_NOTES} notes)", rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""
+Fused normalisation benchmark.
+
+Runs the clinical normaliser in its sequential and fused modes over the
+same pre-tokenized lab reports and fixture notes, and reports the
+throughput of each.
+"""
+from cava_nlp import CaVaLang
+
+from ._common import best_of, fixture_texts, report
+from .bench_literals import lab_reports
+
+N_REPORTS = 2_000
+
+
+def main() -> None:
+    texts = lab_reports(N_REPORTS) + fixture_texts()
+    rows = []
+    for label, fused in (("sequential", False), ("fused", True)):
+        nlp = CaVaLang(sentencizer="clinical")
+        nlp.add_pipe("clinical_normalizer", config={"fused": fused})
+        normalizer = nlp.get_pipe("clinical_normalizer")
+        sentencizer = nlp.get_pipe("clinical_sentencizer")
+        n_tokens = sum(len(sentencizer(nlp.tokenizer(text))) for text in texts)
+
+        def normalize(docs: list) -> None:
+            for doc in docs:
+                normalizer(doc)
+
+        t = min(
+            best_of(
+                lambda docs=[sentencizer(nlp.tokenizer(text)) for text in texts]: normalize(docs),
+                repeat=1,
+            )
+            for _ in range(3)
+        )
+        rows.append((label, f"{n_tokens / t:12,.0f} tokens/s"))
+    report(f"clinical_normalizer ({len(texts)} texts)", rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Paragraph-level incremental processing benchmark.
+
+Simulates longitudinal progress notes: each day's note carries forward the
+previous day's paragraphs, edits one of them and appends a new one. Compares
+``nlp`` on every note with ``ParagraphCache``.
+"""
+import random
+
+from cava_nlp.caching import ParagraphCache
+
+from ._common import best_of, fixture_texts, report
+from .bench_cache import build_pipeline
+
+
+def paragraph(texts: list[str], rng: random.Random) -> str:
+    return "\n".join(rng.choice(texts) for _ in range(rng.randint(2, 5)))
+
+
+def longitudinal(texts: list[str], patients: int, days: int) -> list[str]:
+    rng = random.Random(0)
+    notes = []
+    for _ in range(patients):
+        paragraphs = [paragraph(texts, rng) for _ in range(6)]
+        for _ in range(days):
+            paragraphs[rng.randrange(len(paragraphs))] = paragraph(texts, rng)
+            paragraphs.append(paragraph(texts, rng))
+            notes.append("\n\n".join(paragraphs))
+    return notes
+
+
+def main() -> None:
+    nlp = build_pipeline()
+    notes = longitudinal(fixture_texts(), patients=5, days=10)
+    rows = [
+        ("notes", f"{len(notes):,}"),
+        ("chars", f"{sum(len(n) for n in notes):,}"),
+    ]
+    t = best_of(lambda: [nlp(note) for note in notes], repeat=3)
+    rows.append(("nlp(note)", f"{t * 1000:8.1f} ms"))
+
+    def incremental() -> None:
+        cache = ParagraphCache(nlp)
+        for note in notes:
+            cache(note)
+
+    t = best_of(incremental, repeat=3)
+    rows.append(("ParagraphCache (cold)", f"{t * 1000:8.1f} ms"))
+    cache = ParagraphCache(nlp)
+    for note in notes:
+        cache(note)
+    rows.append(("blocks processed", f"{cache.blocks.misses:,}"))
+    rows.append(("blocks reused", f"{cache.blocks.hits:,}"))
+    report("longitudinal progress notes", rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Numeric literal benchmark.
+
+Runs the tokenizer and the clinical normaliser over number-heavy lab
+reports (decimals, x10^9/L counts, 1e3 titres, reference ranges and
+dates) and reports the throughput of each stage and of both together.
+"""
+import random
+
+from cava_nlp import CaVaLang
+
+from ._common import best_of, report
+
+N_REPORTS = 2_000
+
+
+def lab_reports(n: int, seed: int = 0) -> list[str]:
+    rng = random.Random(seed)
+    r = rng.randint
+    return [
+        f"FBC {r(1, 28)}.{r(1, 12)}.20{r(10, 25)}: Hb {r(60, 180)} g/L, "
+        f"WCC {r(10, 200) / 10}x10^9/L (4.0-11.0), Neut {r(5, 150) / 10} x10^9/L, "
+        f"Plt {r(10, 900)}x10^9/L, MCV {r(700, 1100) / 10} fL.\n"
+        f"UEC: Na {r(120, 160)}, K {r(25, 65) / 10} (3.5-5.2), Cr {r(30, 900)}, "
+        f"eGFR {r(10, 90)}, Mg {r(50, 120) / 100}, PO4 {r(50, 200) / 100}.\n"
+        f"CA-125 {r(5, 999)}, CEA {r(5, 500) / 10} ug/L, EBV titre {r(1, 9)}e{r(2, 5)}, "
+        f"temp {r(355, 395) / 10}, weight {r(300, 1500) / 10}kg.\n"
+        for _ in range(n)
+    ]
+
+
+def main() -> None:
+    nlp = CaVaLang(sentencizer="clinical")
+    nlp.add_pipe("clinical_normalizer")
+    normalizer = nlp.get_pipe("clinical_normalizer")
+    texts = lab_reports(N_REPORTS)
+    n_tokens = sum(len(doc) for doc in nlp.pipe(texts))
+
+    def tokenize() -> None:
+        for text in texts:
+            nlp.tokenizer(text)
+
+    def normalize(docs: list) -> None:
+        for doc in docs:
+            normalizer(doc)
+
+    t_tok = best_of(tokenize, repeat=3)
+    t_norm = min(
+        best_of(lambda docs=[nlp.tokenizer(text) for text in texts]: normalize(docs), repeat=1)
+        for _ in range(3)
+    )
+    t_all = best_of(lambda: list(nlp.pipe(texts)), repeat=3)
+    report(f"numeric literals ({N_REPORTS} lab reports, {n_tokens:,} tokens)", [
+        ("tokenizer", f"{n_tokens / t_tok:12,.0f} tokens/s"),
+        ("clinical_normalizer", f"{n_tokens / t_norm:12,.0f} tokens/s"),
+        ("full pipeline", f"{n_tokens / t_all:12,.0f} tokens/s"),
+    ])
+
+
+if __name__ == "__main__":
+    main()
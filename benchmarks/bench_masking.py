@@ -0,0 +1,63 @@
+"""
+Masking throughput on long notes full of adversarial near-miss strings.
+
+Compares the single-scan preprocessing stage (whitespace condensing plus all
+registered mask patterns) with one ``re.sub`` pass per rule, and with the
+previous email regex.
+"""
+import re
+
+from cava_nlp.tokenization.masking import MASK_PATTERNS, resolve_mask_patterns
+from cava_nlp.tokenization.preprocess import preprocess_text
+
+from ._common import best_of, report
+
+PREVIOUS_EMAIL = r"[A-Za-z0-9.\-_]+@[A-Za-z0-9\-.]+\.[A-Za-z]+"
+
+NOTE = (
+    "Reviewed in clinic. ECOG 1, weight 70.5kg, BP 120/80. "
+    "Call 0412 345 678 or email j.smith@clinic.org.au. MRN: 1234567.\n"
+)
+
+
+def adversarial(run: int) -> str:
+    # long runs that almost look like identifiers but never complete
+    return " ".join([
+        "a" * run,                  # local part with no '@'
+        "x@" + "b" * run,           # domain with no dot
+        "c." * (run // 2),          # dotted run with no '@'
+        "@a" * (run // 2),          # repeated '@'
+        "0412 345 67" * (run // 12),  # phone one digit short
+        "2" * run,                  # digit run longer than any id
+    ])
+
+
+def main() -> None:
+    masks = resolve_mask_patterns(MASK_PATTERNS)
+    for run in (1_000, 5_000, 20_000):
+        text = (NOTE * 200) + adversarial(run) + (NOTE * 200)
+        rows = [("chars", f"{len(text):,}")]
+
+        t = best_of(lambda: preprocess_text(text, masks=masks), repeat=3)
+        rows.append(("single scan, all masks", f"{t * 1000:8.1f} ms"))
+
+        def per_pattern() -> None:
+            out = re.sub(" {2,}", " ", text)
+            out = re.sub("\n{2,}", "\n", out)
+            for pattern in masks:
+                out = re.sub(pattern, lambda m: "x" * len(m.group()), out)
+
+        t = best_of(per_pattern, repeat=3)
+        rows.append(("re.sub per rule", f"{t * 1000:8.1f} ms"))
+
+        if run <= 5_000:
+            t = best_of(lambda: re.sub(PREVIOUS_EMAIL, "x", text), repeat=1)
+            rows.append(("previous email regex", f"{t * 1000:8.1f} ms"))
+        else:
+            rows.append(("previous email regex", "skipped (quadratic)"))
+
+        report(f"adversarial run length {run:,}", rows)
+
+
+if __name__ == "__main__":
+    main()
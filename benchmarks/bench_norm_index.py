@@ -0,0 +1,54 @@
+"""
+Normalisation index benchmark.
+
+Runs the clinical normaliser with span groups and with the columnar
+``doc._.norm_index`` over number-heavy lab reports, then answers "every
+numeric value with a unit" from both: by walking every token through
+``Token._``, and from the index arrays.
+"""
+import numpy as np
+
+from cava_nlp import CaVaLang
+
+from ._common import best_of, report
+from .bench_literals import lab_reports
+
+N_REPORTS = 2_000
+
+
+def main() -> None:
+    texts = lab_reports(N_REPORTS)
+    rows = []
+    docs = {}
+    for label, config in (("span groups", {}), ("norm_index", {"norm_index": True})):
+        nlp = CaVaLang(sentencizer="clinical")
+        nlp.add_pipe("clinical_normalizer", config={"fused": True, **config})
+        docs[label] = list(nlp.pipe(texts))
+        n_tokens = sum(len(doc) for doc in docs[label])
+        t = best_of(lambda: list(nlp.pipe(texts)), repeat=3)
+        rows.append((f"pipeline, {label}", f"{n_tokens / t:12,.0f} tokens/s"))
+
+    def walk_tokens() -> list:
+        return [
+            (tok._.value, tok._.unit)
+            for doc in docs["span groups"]
+            for tok in doc
+            if tok._.kind == "unit_norm" and isinstance(tok._.value, float)
+        ]
+
+    def read_index() -> list:
+        out = []
+        for doc in docs["norm_index"]:
+            index = doc._.norm_index
+            mask = index.with_units()
+            out.append((index.value[mask], np.take(index.units, index.unit[mask])))
+        return out
+
+    assert sum(len(v) for v, _ in read_index()) == len(walk_tokens())
+    rows.append(("values with units, Token._", f"{best_of(walk_tokens) * 1e3:10.1f} ms"))
+    rows.append(("values with units, index", f"{best_of(read_index) * 1e3:10.1f} ms"))
+    report(f"normalisation index ({N_REPORTS} lab reports)", rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+Date and time parse cache benchmark.
+
+Runs the clinical normaliser over the lab reports of ``bench_literals``
+plus nursing notes with a timed observation per line, with the parse
+cache disabled, with a warm in-memory tier, and with a fresh process's
+view of a populated on-disk tier, and reports throughput and hit rate.
+"""
+import random
+import tempfile
+
+from cava_nlp import CaVaLang
+
+from ._common import best_of, report
+from .bench_literals import lab_reports
+
+N_NOTES = 1_000
+
+
+def nursing_notes(n: int, seed: int = 0) -> list[str]:
+    rng = random.Random(seed)
+    r = rng.randint
+    return [
+        f"Obs {r(1, 28)}/{r(1, 12)}/2024 {r(6, 11)}am: T {r(355, 395) / 10}, HR {r(50, 130)}.\n"
+        f"Reviewed {r(1, 12)}:{r(0, 5)}{r(0, 9)}pm, repeat at {r(1, 12)}pm.\n"
+        for _ in range(n)
+    ]
+
+
+def normalizer(**config):
+    nlp = CaVaLang(sentencizer="clinical")
+    nlp.add_pipe("clinical_normalizer", config=config)
+    return nlp
+
+
+def main() -> None:
+    texts = lab_reports(N_NOTES) + nursing_notes(N_NOTES)
+    directory = tempfile.mkdtemp()
+    rows = []
+    for label, config in (
+        ("no cache", {"parse_cache_size": 0}),
+        ("memory", {}),
+        ("disk only", {"parse_cache_size": 0, "parse_cache_dir": directory}),
+    ):
+        nlp = normalizer(**config)
+        n_tokens = sum(len(doc) for doc in nlp.pipe(texts))
+        t = best_of(lambda: list(nlp.pipe(texts)), repeat=3)
+        rate = nlp.get_pipe("clinical_normalizer").parse_cache.hit_rate
+        rows.append((label, f"{n_tokens / t:12,.0f} tokens/s   hit rate {rate:.1%}"))
+    report(f"parse cache ({len(texts)} notes)", rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Normaliser pruning benchmark.
+
+Builds two pipelines over the fixture corpora, each once with every
+normaliser and once pruned to the normalisers its rule engines depend on:
+the ECOG and variant engines, and a keyword engine that only matches words.
+"""
+import tempfile
+from pathlib import Path
+
+import yaml
+
+from cava_nlp import CaVaLang
+from cava_nlp.pipeline import prune_normalizers
+from ._common import best_of, fixture_texts, report
+
+KEYWORDS = {"components": {"smoking_status": {
+    "factory": "rule_engine",
+    "config": {
+        "span_label": "smoking",
+        "patterns": {"smoker": {
+            "token_patterns": [[{"LOWER": {"IN": ["smoker", "smoking", "smokes"]}}]],
+            "value": "yes",
+        }},
+    },
+}}}
+
+
+def build_pipeline(components: list[str], engine_config_path=None) -> CaVaLang:
+    nlp = CaVaLang()
+    nlp.add_pipe("clinical_normalizer")
+    for component in components:
+        nlp.add_pipe(
+            "rule_engine",
+            name=component,
+            config={"engine_config_path": engine_config_path, "component_name": component},
+        )
+    return nlp
+
+
+def main() -> None:
+    texts = fixture_texts() * 5
+    rows = [("notes", f"{len(texts):,}")]
+    with tempfile.TemporaryDirectory() as tmp:
+        keywords = Path(tmp) / "keywords.yaml"
+        keywords.write_text(yaml.safe_dump(KEYWORDS))
+        for label, components, path in (
+            ("ecog + variants", ["ecog_status", "variants_of_interest"], None),
+            ("keywords", ["smoking_status"], str(keywords)),
+        ):
+            full = build_pipeline(components, path)
+            pruned = build_pipeline(components, path)
+            kept = prune_normalizers(pruned)
+            t_full = best_of(lambda: list(full.pipe(texts)), repeat=5)
+            t_pruned = best_of(lambda: list(pruned.pipe(texts)), repeat=5)
+            rows.append((f"{label}: all normalisers", f"{t_full * 1000:8.1f} ms"))
+            rows.append((f"{label}: pruned", f"{t_pruned * 1000:8.1f} ms"))
+            rows.append(("  kept", ", ".join(kept) or "(none)"))
+    report("normaliser pruning", rows)
+
+
+if __name__ == "__main__":
+    main()
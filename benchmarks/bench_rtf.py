@@ -0,0 +1,62 @@
+"""
+RTF decoding benchmark.
+
+Wraps the fixture corpora in RTF of the shape EHR exports produce (font and
+colour tables, a generator group, one paragraph per note with formatting
+runs and escaped characters) and compares ``cava_nlp.tokenization.rtf``
+with ``striprtf.rtf_to_text``.
+"""
+from striprtf.striprtf import rtf_to_text as striprtf_to_text  # type: ignore
+
+from cava_nlp.tokenization.rtf import rtf_to_text
+
+from ._common import best_of, fixture_texts, report
+
+HEADER = (
+    r"{\rtf1\ansi\ansicpg1252\deff0\nouicompat\deflang3081"
+    r"{\fonttbl{\f0\fnil\fcharset0 Calibri;}{\f1\fswiss\fcharset0 Arial;}}"
+    r"{\colortbl ;\red0\green0\blue0;\red255\green0\blue0;}"
+    r"{\*\generator Riched20 10.0.19041}\viewkind4\uc1 "
+)
+
+
+def _escape(text: str) -> str:
+    out = []
+    for ch in text:
+        if ch in "\\{}":
+            out.append("\\" + ch)
+        elif ch == "\n":
+            out.append("\\par\n")
+        elif ord(ch) > 127:
+            out.append(f"\\u{ord(ch)}?")
+        else:
+            out.append(ch)
+    return "".join(out)
+
+
+def build_rtf(texts: list[str], notes: int) -> str:
+    body = []
+    for i in range(notes):
+        text = _escape(texts[i % len(texts)])
+        body.append(
+            rf"\pard\sa200\sl276\slmult1\f0\fs22\lang9 {{\b Note {i}}}\par "
+            rf"{text} Caf\'e9 \f1 review\f0\par" "\n"
+        )
+    return HEADER + "".join(body) + "}"
+
+
+def main() -> None:
+    texts = fixture_texts()
+    for notes in (100, 1_000, 10_000):
+        rtf = build_rtf(texts, notes)
+        assert rtf_to_text(rtf) == striprtf_to_text(rtf)
+        rows = [("rtf chars", f"{len(rtf):,}")]
+        t = best_of(lambda: rtf_to_text(rtf), repeat=3)
+        rows.append(("cava_nlp rtf_to_text", f"{t * 1000:8.1f} ms"))
+        t = best_of(lambda: striprtf_to_text(rtf), repeat=3)
+        rows.append(("striprtf.rtf_to_text", f"{t * 1000:8.1f} ms"))
+        report(f"{notes:,} notes in one document", rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,27 @@
+"""
+Output selection benchmark.
+
+Runs the cache benchmark pipeline (normalisation, layout, two rule engines,
+ConText) over the fixture corpora, once in full and once per single
+output, and reports the components each selection keeps.
+"""
+from ._common import best_of, fixture_texts, report
+from .bench_cache import build_pipeline
+
+
+def main() -> None:
+    nlp = build_pipeline()
+    texts = fixture_texts() * 5
+    rows = [("notes", f"{len(texts):,}")]
+    t = best_of(lambda: list(nlp.pipe(texts)), repeat=3)
+    rows.append(("full pipeline", f"{t * 1000:8.1f} ms"))
+    for outputs in ({"ecog"}, {"variant"}):
+        t = best_of(lambda: list(nlp.pipe(texts, outputs=outputs)), repeat=3)
+        rows.append((f"outputs={sorted(outputs)}", f"{t * 1000:8.1f} ms"))
+        skipped = [name for name in nlp.pipe_names if name not in nlp.component_plan(outputs).components]
+        rows.append(("  skipped", ", ".join(skipped)))
+    report("output selection", rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Sentence segmentation benchmark.
+
+Compares ``clinical_sentencizer`` with ``medspacy_pysbd`` for speed and for
+agreement on sentence boundaries, over the fixture corpora and over longer
+synthetic notes built from them (line breaks, bullets and enumerators).
+"""
+import random
+
+from cava_nlp import CaVaLang
+
+from ._common import best_of, fixture_texts, report
+
+LINE_PREFIXES = ["", "", "- ", "• ", "1. ", "2) ", "(a) "]
+
+
+def synthetic_notes(texts: list[str], notes: int, lines: int = 30) -> list[str]:
+    rng = random.Random(0)
+    out = []
+    for _ in range(notes):
+        body = []
+        for _ in range(lines):
+            sentence = " ".join(rng.choice(texts) for _ in range(rng.randint(1, 3)))
+            body.append(rng.choice(LINE_PREFIXES) + sentence)
+        out.append("\n".join(body))
+    return out
+
+
+def boundaries(nlp: CaVaLang, texts: list[str]) -> list[set[int]]:
+    return [{s.start_char for s in doc.sents} for doc in nlp.pipe(texts)]
+
+
+def agreement(gold: list[set[int]], pred: list[set[int]]) -> dict[str, float]:
+    tp = sum(len(g & p) for g, p in zip(gold, pred))
+    n_pred = sum(len(p) for p in pred)
+    n_gold = sum(len(g) for g in gold)
+    return {
+        "precision": tp / n_pred if n_pred else 1.0,
+        "recall": tp / n_gold if n_gold else 1.0,
+        "identical docs": sum(g == p for g, p in zip(gold, pred)) / len(gold),
+    }
+
+
+def main() -> None:
+    fixtures = fixture_texts()
+    pysbd = CaVaLang(sentencizer="pysbd")
+    clinical = CaVaLang(sentencizer="clinical")
+    corpora = {
+        "fixture corpora": fixtures,
+        "synthetic notes": synthetic_notes(fixtures, 200),
+    }
+    for title, texts in corpora.items():
+        # tokenization is shared, so time the sentencizers on the same docs
+        docs = [clinical.make_doc(clinical.preprocess(t)) for t in texts]
+        rows = [("docs", f"{len(docs):,}"), ("tokens", f"{sum(len(d) for d in docs):,}")]
+        for name, nlp in (("medspacy_pysbd", pysbd), ("clinical_sentencizer", clinical)):
+            component = nlp.get_pipe(nlp.pipe_names[0])
+            t = best_of(lambda: [component(d.copy()) for d in docs], repeat=3)
+            rows.append((name, f"{t * 1000:8.1f} ms"))
+        scores = agreement(boundaries(pysbd, texts), boundaries(clinical, texts))
+        rows += [(f"agreement {k}", f"{v:8.3f}") for k, v in scores.items()]
+        report(title, rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""
+Short-text preset benchmark.
+
+Per-string latency for structured fields (ECOG, PG-SGA, weights, lab
+comments), comparing ``short_text_pipeline`` with the full cache
+benchmark pipeline restricted to the same rule engines.
+"""
+import time
+
+from cava_nlp.pipeline import short_text_pipeline
+from cava_nlp.rule_engine.rule_engine_factory import ENGINE_CONFIG_ROOT
+
+from ._common import report
+from .bench_cache import build_pipeline
+
+FIELDS = {
+    "ecog": ["ECOG 1", "ecog 0-1", "PS 2", "ECOG performance status 0"],
+    "pgsga": ["PG-SGA B", "pgsga score 4", "PGSGA A"],
+    "weight": ["70.5kg", "wt 82 kg", "68kg"],
+    "lab comment": ["Hb 120, plt 250", "repeat FBC next week", "Hb 120 on 12/03/2024"],
+}
+REPEAT = 500
+
+
+def per_string_us(func, texts: list[str]) -> float:
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        for text in texts:
+            func(text)
+    return (time.perf_counter() - start) / (REPEAT * len(texts)) * 1e6
+
+
+def main() -> None:
+    short = short_text_pipeline(
+        ["ecog_status", ("pgsga_value", ENGINE_CONFIG_ROOT / "dietetics.yaml")]
+    )
+    full = build_pipeline()
+    rows = []
+    for kind, texts in FIELDS.items():
+        for text in texts:
+            short(text)
+            full(text)
+        rows.append((f"{kind}: short_text_pipeline", f"{per_string_us(short, texts):8.1f} us"))
+        rows.append((f"{kind}: full pipeline", f"{per_string_us(full, texts):8.1f} us"))
+    report("per-string latency", rows)
+
+
+if __name__ == "__main__":
+    main()
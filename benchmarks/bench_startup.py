@@ -0,0 +1,66 @@
+"""
+Cold-start benchmark.
+
+Each step runs in a fresh interpreter, so module caches are cold, and
+reports the median over several runs of: importing cava_nlp, importing
+CaVaLang, constructing it with either sentencizer, and building the cache
+benchmark pipeline.
+"""
+import statistics
+import subprocess
+import sys
+
+from ._common import report
+
+RUNS = 5
+
+STEPS = {
+    "import cava_nlp": ("", "import cava_nlp"),
+    "from cava_nlp import CaVaLang": ("", "from cava_nlp import CaVaLang"),
+    "CaVaLang(sentencizer='clinical')": (
+        "from cava_nlp import CaVaLang",
+        "CaVaLang(sentencizer='clinical')",
+    ),
+    "CaVaLang()": ("from cava_nlp import CaVaLang", "CaVaLang()"),
+    "full pipeline": (
+        "from benchmarks.bench_cache import build_pipeline",
+        "build_pipeline()",
+    ),
+}
+
+SCRIPT = """
+import time
+start = time.perf_counter()
+{setup}
+ready = time.perf_counter()
+{step}
+print(time.perf_counter() - ready, ready - start)
+"""
+
+
+def cold_time(setup: str, step: str) -> tuple[float, float]:
+    """
+    Median (step, setup) seconds over ``RUNS`` fresh interpreters.
+    """
+    steps, setups = [], []
+    for _ in range(RUNS):
+        out = subprocess.run(
+            [sys.executable, "-c", SCRIPT.format(setup=setup, step=step)],
+            capture_output=True, text=True, check=True,
+        ).stdout.split()
+        steps.append(float(out[0]))
+        setups.append(float(out[1]))
+    return statistics.median(steps), statistics.median(setups)
+
+
+def main() -> None:
+    rows = []
+    for label, (setup, step) in STEPS.items():
+        step_time, setup_time = cold_time(setup, step)
+        total = step_time + setup_time
+        rows.append((label, f"{step_time * 1000:8.1f} ms  (cumulative {total * 1000:8.1f} ms)"))
+    report(f"cold start, median of {RUNS} fresh interpreters", rows)
+
+
+if __name__ == "__main__":
+    main()
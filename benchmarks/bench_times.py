@@ -0,0 +1,64 @@
+"""
+Time parsing benchmark.
+
+Runs ``normalize_time`` over the time spans of nursing observation charts
+(one timed row of vital signs per line, in the mix of time styles seen on
+the wards), and the clinical normaliser over the charts themselves.
+"""
+import random
+
+from cava_nlp import CaVaLang
+from cava_nlp.normalisation.normaliser import normalize_time
+
+from ._common import best_of, report
+
+N_CHARTS = 300
+ROWS = 24
+
+
+def observation_charts(n: int, seed: int = 0) -> list[str]:
+    rng = random.Random(seed)
+
+    def one_time() -> str:
+        h, m = rng.randint(0, 23), rng.choice([0, 15, 30, 45])
+        h12 = h % 12 or 12
+        ampm = "am" if h < 12 else "pm"
+        return rng.choice([
+            f"{h:02d}:{m:02d}",
+            f"{h}:{m:02d}",
+            f"{h:02d}{m:02d} hrs",
+            f"{h:02d}{m:02d}hrs",
+            f"{h12}{ampm}",
+            f"{h12}:{m:02d} {ampm[0]}.m.",
+            f"{h12} o'clock",
+        ])
+
+    return [
+        "\n".join(
+            f"{one_time()} T {rng.randint(355, 395) / 10} HR {rng.randint(50, 130)} "
+            f"BP {rng.randint(90, 170)}/{rng.randint(50, 100)} RR {rng.randint(12, 28)} "
+            f"SpO2 {rng.randint(88, 100)}%"
+            for _ in range(ROWS)
+        )
+        for _ in range(n)
+    ]
+
+
+def main() -> None:
+    charts = observation_charts(N_CHARTS)
+    nlp = CaVaLang(sentencizer="clinical")
+    nlp.add_pipe("clinical_normalizer", config={"parse_cache_size": 0})
+    docs = list(nlp.pipe(charts))
+    spans = [t.text for doc in docs for t in doc if t._.kind == "time"]
+    n_tokens = sum(len(doc) for doc in docs)
+
+    t_parse = best_of(lambda: [normalize_time(text) for text in spans], repeat=5)
+    t_all = best_of(lambda: list(nlp.pipe(charts)), repeat=3)
+    report(f"time parsing ({N_CHARTS} charts, {len(spans):,} times)", [
+        ("normalize_time", f"{len(spans) / t_parse:12,.0f} times/s"),
+        ("full pipeline", f"{n_tokens / t_all:12,.0f} tokens/s"),
+    ])
+
+
+if __name__ == "__main__":
+    main()
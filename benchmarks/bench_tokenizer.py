@@ -0,0 +1,44 @@
+"""
+Tokenizer benchmark.
+
+Reports the size of the CaVaLang tokenizer (special cases, serialised
+bytes, traced memory after construction and after tokenizing the corpus),
+its construction time, and tokens per second over the fixture corpora.
+"""
+import time
+import tracemalloc
+
+from cava_nlp import CaVaLang
+
+from ._common import best_of, fixture_texts, report
+
+
+def main() -> None:
+    nlp = CaVaLang(sentencizer="clinical")
+    texts = fixture_texts() * 20
+    rows = [("special cases", f"{len(nlp.tokenizer.rules):,}")]
+    rows.append(("serialised size", f"{len(nlp.tokenizer.to_bytes()) / 1024:8.1f} KiB"))
+
+    tracemalloc.start()
+    nlp = CaVaLang(sentencizer="clinical")
+    built = tracemalloc.get_traced_memory()[0]
+    for text in texts:
+        nlp.tokenizer(text)
+    used = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    rows.append(("memory: CaVaLang()", f"{built / 2**20:8.2f} MiB"))
+    rows.append(("memory: + tokenizer cache", f"{used / 2**20:8.2f} MiB"))
+
+    t = best_of(lambda: CaVaLang(sentencizer="clinical"), repeat=5)
+    rows.append(("CaVaLang() construction", f"{t * 1000:8.1f} ms"))
+
+    tokenizer = CaVaLang(sentencizer="clinical").tokenizer
+    n_tokens = sum(len(tokenizer(text)) for text in texts)
+    t = best_of(lambda: [tokenizer(text) for text in texts], repeat=5)
+    rows.append(("tokens", f"{n_tokens:,}"))
+    rows.append(("tokens per second", f"{n_tokens / t:,.0f}"))
+    report("tokenizer", rows)
+
+
+if __name__ == "__main__":
+    main()
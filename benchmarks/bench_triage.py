@@ -0,0 +1,33 @@
+"""
+Keyword triage benchmark.
+
+Runs the cache benchmark pipeline over the fixture notes, in full and
+behind ``KeywordTriage``, and reports how much text the triage kept out
+of the pipeline.
+"""
+from cava_nlp.pipeline import KeywordTriage
+
+from ._common import best_of, fixture_texts, report
+from .bench_cache import build_pipeline
+
+
+def main() -> None:
+    nlp = build_pipeline()
+    texts = fixture_texts() * 5
+    rows = [("notes", f"{len(texts):,}")]
+    t = best_of(lambda: list(nlp.pipe(texts)), repeat=3)
+    rows.append(("nlp.pipe", f"{t * 1000:8.1f} ms"))
+    t = best_of(lambda: list(KeywordTriage(nlp).pipe(texts)), repeat=3)
+    rows.append(("KeywordTriage.pipe", f"{t * 1000:8.1f} ms"))
+    triage = KeywordTriage(nlp)
+    t = best_of(lambda: [triage.outputs_for(text) for text in texts], repeat=3)
+    rows.append(("  of which scanning", f"{t * 1000:8.1f} ms"))
+    triage = KeywordTriage(nlp)
+    list(triage.pipe(texts))
+    rows.append(("skipped documents", f"{triage.skipped_docs:,} / {triage.docs:,}"))
+    rows.append(("skipped characters", f"{triage.skipped_chars:,} / {triage.chars:,}"))
+    report("keyword triage", rows)
+
+
+if __name__ == "__main__":
+    main()
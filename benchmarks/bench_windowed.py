@@ -0,0 +1,44 @@
+"""
+Windowed processing benchmark.
+
+Builds lab-dump style documents of increasing size from the fixture corpora
+and compares a single ``nlp`` call with ``WindowedProcessor`` on wall time.
+Several rule-engine components scale super-linearly with document length,
+so the gap widens with size.
+"""
+import random
+import time
+
+from cava_nlp.windowing import WindowedProcessor
+
+from ._common import fixture_texts, report
+from .bench_cache import build_pipeline
+
+
+def large_document(texts: list[str], chars: int) -> str:
+    rng = random.Random(0)
+    lines: list[str] = []
+    size = 0
+    while size < chars:
+        line = rng.choice(texts)
+        lines.append(line)
+        size += len(line) + 1
+    return "\n".join(lines)
+
+
+def main() -> None:
+    nlp = build_pipeline()
+    windowed = WindowedProcessor(nlp)
+    texts = fixture_texts()
+    for chars in (10_000, 20_000, 40_000):
+        text = large_document(texts, chars)
+        rows = [("chars", f"{len(text):,}")]
+        for name, func in (("nlp(text)", lambda: nlp(text)), ("windowed", lambda: windowed(text))):
+            start = time.perf_counter()
+            func()
+            rows.append((name, f"{(time.perf_counter() - start) * 1000:9.1f} ms"))
+        report(f"{chars:,} character document", rows)
+
+
+if __name__ == "__main__":
+    main()
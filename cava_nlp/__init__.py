@@ -1,8 +1,34 @@
-from .language import CaVaLang, CaVaLangDefaults 
-from .normalisation import create_clinical_normalizer
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .language import CaVaLang, CaVaLangDefaults
+    from .normalisation import create_clinical_normalizer
+
+# public name -> defining module. Resolved on first access, so importing
+# cava_nlp (or a light submodule such as tokenization.rtf) does not load
+# spaCy, medspacy or dateparser
+_LAZY_ATTRIBUTES = {
+    "CaVaLang": ".language",
+    "CaVaLangDefaults": ".language",
+    "create_clinical_normalizer": ".normalisation",
+}
 
 __all__ = [
-    "CaVaLang", 
-    "CaVaLangDefaults", 
+    "CaVaLang",
+    "CaVaLangDefaults",
     "create_clinical_normalizer"
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
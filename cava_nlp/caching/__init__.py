@@ -0,0 +1,16 @@
+from .doc_cache import DocCache
+from .fingerprint import pipeline_fingerprint
+from .incremental import ParagraphCache
+from .merge import StatePart, merge_states, register_doc_extension_merger
+from .serialise import doc_from_bytes, doc_to_bytes
+
+__all__ = [
+    "DocCache",
+    "ParagraphCache",
+    "StatePart",
+    "doc_from_bytes",
+    "doc_to_bytes",
+    "merge_states",
+    "pipeline_fingerprint",
+    "register_doc_extension_merger",
+]
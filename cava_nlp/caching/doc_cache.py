@@ -0,0 +1,167 @@
+import hashlib
+import os
+import tempfile
+from collections import OrderedDict
+from pathlib import Path
+from typing import Iterable, Iterator, Optional, Union
+
+from spacy.tokens import Doc
+
+from ..language import CaVaLang
+from .fingerprint import pipeline_fingerprint
+from .serialise import doc_from_bytes, doc_to_bytes
+
+
+class DocCache:
+    """
+    Content-addressed cache of fully processed docs.
+
+    Entries are keyed by a hash of the preprocessed text plus a fingerprint
+    of the pipeline, so byte-identical notes (after whitespace condensing
+    and masking) are processed once. Docs are stored serialised, with all
+    custom extension values, and every hit returns a fresh, independent
+    Doc.
+
+    The fingerprint is taken when the cache is created. Build a new cache
+    if the pipeline is changed afterwards.
+
+    Parameters
+    ----------
+    nlp : CaVaLang
+        The pipeline to run on cache misses.
+    max_entries : int
+        Size of the in-memory LRU tier. 0 disables it.
+    directory : str or Path, optional
+        Directory for the on-disk tier. Entries there are shared between
+        processes and runs with the same pipeline fingerprint. They contain
+        pickled data, so the directory must not be writable by untrusted
+        users.
+    """
+
+    def __init__(
+            self,
+            nlp: CaVaLang,
+            max_entries: int = 1024,
+            directory: Optional[Union[str, Path]] = None,
+        ):
+        if max_entries < 0:
+            raise ValueError("max_entries must be >= 0")
+        self.nlp = nlp
+        self.max_entries = max_entries
+        self.directory = Path(directory) if directory is not None else None
+        self.fingerprint = pipeline_fingerprint(nlp)
+        self._memory: "OrderedDict[str, bytes]" = OrderedDict()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    def key(self, text: str) -> str:
+        """
+        Cache key for an already preprocessed text.
+        """
+        h = hashlib.sha256(self.fingerprint.encode())
+        h.update(text.encode("utf-8", "surrogatepass"))
+        return h.hexdigest()
+
+    def _path(self, key: str) -> Path:
+        assert self.directory is not None
+        return self.directory / key[:2] / key
+
+    def get(self, key: str) -> Optional[bytes]:
+        data = self._memory.get(key)
+        if data is not None:
+            self._memory.move_to_end(key)
+            self.hits += 1
+            return data
+        if self.directory is not None:
+            try:
+                data = self._path(key).read_bytes()
+            except FileNotFoundError:
+                return None
+            self.disk_hits += 1
+            self._remember(key, data)
+            return data
+        return None
+
+    def put(self, key: str, data: bytes) -> None:
+        self._remember(key, data)
+        if self.directory is not None:
+            path = self._path(key)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # write-then-rename so concurrent readers never see partial entries
+            fd, tmp = tempfile.mkstemp(dir=path.parent)
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+
+    def _remember(self, key: str, data: bytes) -> None:
+        if not self.max_entries:
+            return
+        self._memory[key] = data
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def clear(self) -> None:
+        """
+        Empty the in-memory tier. The on-disk tier is left untouched.
+        """
+        self._memory.clear()
+
+    def _restore(self, doc: Doc, data: bytes) -> Doc:
+        cached = doc_from_bytes(self.nlp.vocab, data)
+        # identical processed text can come from differently spaced raw text
+        cached._.offset_map = doc._.offset_map
+        return cached
+
+    def __call__(self, text: str) -> Doc:
+        doc = self.nlp.make_preprocessed_doc(text)
+        key = self.key(doc.text)
+        data = self.get(key)
+        if data is not None:
+            return self._restore(doc, data)
+        self.misses += 1
+        doc = self.nlp(doc)
+        self.put(key, doc_to_bytes(doc))
+        return doc
+
+    def pipe(self, texts: Iterable[str], batch_size: Optional[int] = None) -> Iterator[Doc]:
+        """
+        Process texts as a stream. Cache misses within each batch are
+        de-duplicated and run through ``nlp.pipe`` together.
+        """
+        batch_size = batch_size or self.nlp.batch_size
+        batch: list[str] = []
+        for text in texts:
+            batch.append(text)
+            if len(batch) >= batch_size:
+                yield from self._pipe_batch(batch)
+                batch = []
+        if batch:
+            yield from self._pipe_batch(batch)
+
+    def _pipe_batch(self, texts: list[str]) -> Iterator[Doc]:
+        docs = [self.nlp.make_preprocessed_doc(text) for text in texts]
+        keys = [self.key(doc.text) for doc in docs]
+        found: dict[str, bytes] = {}
+        pending: dict[str, Doc] = {}
+        for key, doc in zip(keys, docs):
+            if key in found or key in pending:
+                continue
+            data = self.get(key)
+            if data is not None:
+                found[key] = data
+            else:
+                pending[key] = doc
+        self.misses += len(pending)
+
+        processed: dict[str, Doc] = {}
+        for key, doc in zip(pending, self.nlp.pipe(pending.values())):
+            data = doc_to_bytes(doc)
+            self.put(key, data)
+            found[key] = data
+            processed[key] = doc
+
+        for key, doc in zip(keys, docs):
+            fresh = processed.pop(key, None)
+            yield fresh if fresh is not None else self._restore(doc, found[key])
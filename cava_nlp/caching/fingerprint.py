@@ -0,0 +1,66 @@
+import hashlib
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Iterator
+
+from spacy.language import Language
+
+from .serialise import FORMAT_VERSION
+
+PACKAGE_DIR = Path(__file__).resolve().parent.parent
+
+# packaged rule data: rulesets, engine configs and context profiles
+PACKAGE_DATA_GLOBS = ("**/*.json", "**/*.yaml")
+
+
+@lru_cache(maxsize=1)
+def package_data_digest() -> str:
+    """
+    Digest of the rule data shipped with cava_nlp, which components load
+    by default when no explicit path is configured.
+    """
+    h = hashlib.sha256()
+    paths = sorted({p for pattern in PACKAGE_DATA_GLOBS for p in PACKAGE_DIR.glob(pattern)})
+    for path in paths:
+        h.update(str(path.relative_to(PACKAGE_DIR)).encode())
+        h.update(path.read_bytes())
+    return h.hexdigest()
+
+
+def _config_files(value: Any) -> Iterator[Path]:
+    """
+    Existing files referenced by string values in a component config,
+    e.g. ``engine_config_path`` or ConText ``rules``.
+    """
+    if isinstance(value, dict):
+        for v in value.values():
+            yield from _config_files(v)
+    elif isinstance(value, (list, tuple)):
+        for v in value:
+            yield from _config_files(v)
+    elif isinstance(value, str) and value:
+        try:
+            path = Path(value)
+            if path.is_file():
+                yield path
+        except (OSError, ValueError):
+            return
+
+
+def pipeline_fingerprint(nlp: Language) -> str:
+    """
+    Fingerprint everything that determines a pipeline's output for a given
+    preprocessed text: component names and configs, the contents of any
+    rule files they reference, packaged rule data, tokenizer rules and
+    preprocessing masks.
+    """
+    h = hashlib.sha256()
+    h.update(f"format:{FORMAT_VERSION}".encode())
+    h.update(nlp.config.to_str().encode())
+    for path in sorted(set(_config_files(dict(nlp.config["components"])))):
+        h.update(str(path).encode())
+        h.update(path.read_bytes())
+    h.update(package_data_digest().encode())
+    h.update(nlp.tokenizer.to_bytes())
+    h.update(repr(getattr(nlp, "mask_patterns", ())).encode())
+    return h.hexdigest()
@@ -0,0 +1,113 @@
+import re
+from typing import Any, Optional, Pattern, Union
+from pathlib import Path
+
+from spacy.tokens import Doc
+
+from ..language import CaVaLang
+from .doc_cache import DocCache
+from .merge import StatePart, merge_states
+from .serialise import doc_state, doc_to_bytes, state_from_bytes
+
+# a blank line, possibly holding spaces or tabs; the next block starts at the
+# first non-whitespace character after it
+BLANK_LINE = re.compile(r"\n[ \t]*\n\s*")
+
+
+def split_blocks(
+        raw: str,
+        processed: str,
+        offset_map: Any,
+        boundary: Pattern[str] = BLANK_LINE,
+    ) -> list[str]:
+    """
+    Split preprocessed text into blocks at ``boundary`` matches in the raw
+    text (preprocessing condenses blank lines away, so they are located in
+    the raw text and mapped across). Each block after the first starts at
+    the end of a match.
+    """
+    starts = [0]
+    for m in boundary.finditer(raw):
+        if m.end() >= len(raw):
+            continue
+        start = offset_map.to_processed(m.end())
+        if start > starts[-1]:
+            starts.append(start)
+    ends = starts[1:] + [len(processed)]
+    return [processed[s:e] for s, e in zip(starts, ends)]
+
+
+class ParagraphCache:
+    """
+    Incremental processing for notes that repeat most of their paragraphs,
+    such as copy-forward progress notes.
+
+    The text is split into blocks at blank lines (or any ``boundary``
+    pattern, e.g. section headers). Each block is processed on its own and
+    cached by content hash, so only new or edited blocks go through the
+    pipeline. The blocks are then stitched into one Doc with all offsets
+    corrected.
+
+    Components see one block at a time, so anything that would otherwise
+    link text across a boundary is not found: a rule-engine pattern or a
+    ConText modifier scope spanning a blank line. Sentence boundaries
+    already fall at line breaks, so this is rare at blank lines.
+
+    Parameters
+    ----------
+    nlp : CaVaLang
+        The pipeline to run on new blocks.
+    max_entries : int
+        Size of the in-memory LRU tier, in blocks.
+    directory : str or Path, optional
+        Directory for the on-disk tier, as for ``DocCache``.
+    boundary : str or Pattern
+        Regex matched against the raw text; a new block starts at the end
+        of each match.
+    """
+
+    def __init__(
+            self,
+            nlp: CaVaLang,
+            max_entries: int = 4096,
+            directory: Optional[Union[str, Path]] = None,
+            boundary: Union[str, Pattern[str]] = BLANK_LINE,
+        ):
+        self.nlp = nlp
+        self.blocks = DocCache(nlp, max_entries=max_entries, directory=directory)
+        self.boundary = re.compile(boundary) if isinstance(boundary, str) else boundary
+
+    def __call__(self, text: str) -> Doc:
+        processed, offset_map = self.nlp.preprocess_with_offsets(text)
+        blocks = split_blocks(text, processed, offset_map, self.boundary)
+        keys = [self.blocks.key(block) for block in blocks]
+
+        found: dict[str, bytes] = {}
+        pending: dict[str, str] = {}
+        for key, block in zip(keys, blocks):
+            if key in found or key in pending:
+                continue
+            data = self.blocks.get(key)
+            if data is None:
+                pending[key] = block
+            else:
+                found[key] = data
+        self.blocks.misses += len(pending)
+
+        states: dict[str, dict[str, Any]] = {}
+        new_docs = self.nlp.pipe(self.nlp.make_doc(block) for block in pending.values())
+        for key, doc in zip(pending, new_docs):
+            self.blocks.put(key, doc_to_bytes(doc))
+            states[key] = doc_state(doc)
+        for key, data in found.items():
+            states[key] = state_from_bytes(data)
+
+        parts = []
+        tokens = chars = 0
+        for block, key in zip(blocks, keys):
+            parts.append(StatePart(states[key], token_offset=tokens, char_offset=chars))
+            tokens += len(states[key]["words"])
+            chars += len(block)
+        doc = merge_states(self.nlp.vocab, parts)
+        doc._.offset_map = offset_map
+        return doc
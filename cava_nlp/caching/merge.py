@@ -0,0 +1,260 @@
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+from medspacy.context.context_graph import ConTextGraph # type: ignore[import-untyped]
+from medspacy.context.context_modifier import ConTextModifier # type: ignore[import-untyped]
+from spacy.tokens import Doc, Span
+from spacy.util import filter_spans
+from spacy.vocab import Vocab
+
+from ..normalisation.index import NormIndex
+from .serialise import load_user_data
+
+
+@dataclass(frozen=True)
+class StatePart:
+    """
+    One processed piece of a larger text, to be merged with ``merge_states``.
+
+    Attributes
+    ----------
+    state : dict
+        Doc state from ``doc_state`` / ``state_from_bytes``.
+    token_offset : int
+        Index in the merged doc of the piece's first token. Negative when the
+        piece starts with context owned by the previous piece.
+    char_offset : int
+        Character offset in the merged doc of the piece's first character.
+    start, end : int
+        Local token range this piece owns; tokens, spans and values that
+        start outside it are taken from the neighbouring pieces instead.
+        ``end=None`` means the end of the piece.
+    """
+    state: dict[str, Any]
+    token_offset: int
+    char_offset: int
+    start: int = 0
+    end: Optional[int] = None
+
+    @property
+    def stop(self) -> int:
+        return len(self.state["words"]) if self.end is None else self.end
+
+    @property
+    def owned(self) -> range:
+        """
+        Owned token range, in merged doc indices.
+        """
+        return range(self.start + self.token_offset, self.stop + self.token_offset)
+
+
+@dataclass(frozen=True)
+class ExtensionPart:
+    """
+    A doc-level extension value from one piece, passed to its merger,
+    with the piece's offsets and owned ranges in tokens and characters.
+    """
+    value: Any
+    token_offset: int
+    owned: range
+    char_offset: int = 0
+    owned_chars: range = range(0)
+
+
+# merges the values of one doc-level extension from consecutive pieces
+DocExtensionMerger = Callable[[list[ExtensionPart]], Any]
+
+
+def merge_token_ranges(parts: list[ExtensionPart]) -> list[tuple[int, int]]:
+    return [
+        (start + part.token_offset, end + part.token_offset)
+        for part in parts
+        for start, end in part.value
+        if start + part.token_offset in part.owned
+    ]
+
+
+def merge_context_graphs(parts: list[ExtensionPart]) -> ConTextGraph:
+    # spans inside each graph are already re-bound to the merged doc
+    targets, modifiers, edges = [], [], []
+    for part in parts:
+        graph = part.value
+        targets += [t for t in graph.targets if t.start in part.owned]
+        modifiers += [m for m in graph.modifiers if m.modifier_span[0] in part.owned]
+        edges += [e for e in graph.edges if e[0].start in part.owned]
+    return ConTextGraph(
+        targets=targets,
+        modifiers=modifiers,
+        edges=edges,
+        prune_on_modifier_overlap=parts[0].value.prune_on_modifier_overlap,
+    )
+
+
+def merge_flags(parts: list[ExtensionPart]) -> bool:
+    return any(part.value for part in parts)
+
+
+def merge_norm_indexes(parts: list[ExtensionPart]) -> NormIndex:
+    return NormIndex.from_rows(
+        (start + part.char_offset, end + part.char_offset, *rest)
+        for part in parts
+        for start, end, *rest in part.value.rows()
+        if start + part.char_offset in part.owned_chars
+    )
+
+
+DOC_EXTENSION_MERGERS: dict[str, DocExtensionMerger] = {
+    "parentheticals": merge_token_ranges,
+    "list_items": merge_token_ranges,
+    "context_graph": merge_context_graphs,
+    "norm_index": merge_norm_indexes,
+    "norm_annotated": merge_flags,
+}
+
+
+def register_doc_extension_merger(name: str, merger: DocExtensionMerger) -> None:
+    """
+    Declare how a custom doc-level extension is combined across pieces.
+    """
+    DOC_EXTENSION_MERGERS[name] = merger
+
+
+def shift_context_modifiers(user_data: dict[Any, Any], offset: int) -> None:
+    """
+    ConText modifiers keep their own token indices, which the span
+    re-binding in ``load_user_data`` cannot reach. Shift each one once
+    (the graph and the span ``modifiers`` extension share the objects).
+    """
+    seen: set[int] = set()
+    for value in user_data.values():
+        if isinstance(value, ConTextGraph):
+            modifiers = value.modifiers
+        elif isinstance(value, tuple):
+            modifiers = value
+        else:
+            continue
+        for modifier in modifiers:
+            if not isinstance(modifier, ConTextModifier) or id(modifier) in seen:
+                continue
+            seen.add(id(modifier))
+            modifier._start += offset
+            modifier._end += offset
+            if modifier._scope_start is not None:
+                modifier._scope_start += offset
+            if modifier._scope_end is not None:
+                modifier._scope_end += offset
+
+
+def _shifted(
+        doc: Doc,
+        offset: int,
+        start: int,
+        end: int,
+        label: str,
+        kb_id: str,
+        span_id: str,
+    ) -> Span:
+    return Span(doc, start + offset, end + offset, label=label, kb_id=kb_id, span_id=span_id)
+
+
+def merge_states(vocab: Vocab, parts: list[StatePart]) -> Doc:
+    """
+    Build one doc from processed pieces of its text.
+
+    The owned token ranges of the parts must tile the merged doc in order.
+    Tokens, spans, entities and extension values are taken from the part
+    that owns their first token (or character), and shifted onto the merged
+    doc. Doc-level extensions are combined with ``DOC_EXTENSION_MERGERS``.
+    """
+    words: list[str] = []
+    spaces: list[bool] = []
+    for part in parts:
+        if part.owned.start != len(words):
+            raise ValueError("State parts must tile the merged doc in order")
+        words.extend(part.state["words"][part.start:part.stop])
+        spaces.extend(part.state["spaces"][part.start:part.stop])
+
+    sent_starts: Optional[list[Any]] = None
+    if all(part.state["sent_starts"] is not None for part in parts):
+        sent_starts = [
+            s for part in parts for s in part.state["sent_starts"][part.start:part.stop]
+        ]
+
+    annotations: dict[str, list[Any]] = {}
+    for key in sorted({k for part in parts for k in part.state["annotations"]}):
+        values: list[Any] = []
+        for part in parts:
+            block = part.state["annotations"].get(key)
+            if key == "heads":
+                values.extend(
+                    [h + part.token_offset for h in block[part.start:part.stop]]
+                    if block else part.owned
+                )
+            else:
+                values.extend(block[part.start:part.stop] if block else [""] * len(part.owned))
+        annotations[key] = values
+
+    doc = Doc(vocab, words=words, spaces=spaces, sent_starts=sent_starts, **annotations)
+
+    ents: list[Span] = []
+    spans: dict[str, list[Span]] = {}
+    for part in parts:
+        offset = part.token_offset
+        for i, norm in part.state["norms"]:
+            if part.start <= i < part.stop:
+                doc[i + offset].norm_ = norm
+        ents.extend(
+            _shifted(doc, offset, *ent)
+            for ent in part.state["ents"] or ()
+            if part.start <= ent[0] < part.stop
+        )
+        for name, group in part.state["spans"].items():
+            spans.setdefault(name, []).extend(
+                _shifted(doc, offset, *span)
+                for span in group
+                if part.start <= span[0] < part.stop
+            )
+    if any(part.state["ents"] is not None for part in parts):
+        # an entity running past the end of one part can collide with one
+        # owned by the next
+        doc.ents = filter_spans(ents)
+    for name, group in spans.items():
+        doc.spans[name] = group
+
+    doc_level: dict[str, list[ExtensionPart]] = {}
+    for part in parts:
+        owned = part.owned
+        char_start = doc[owned.start].idx if len(owned) else 0
+        char_end = doc[owned.stop - 1].idx + len(doc[owned.stop - 1]) if len(owned) else 0
+        user_data = load_user_data(part.state, doc, part.token_offset)
+        if part.token_offset:
+            shift_context_modifiers(user_data, part.token_offset)
+        for key, value in user_data.items():
+            if isinstance(key, tuple) and len(key) == 4 and key[0] == "._.":
+                kind, name, start, end = key
+                if start is None and end is None:
+                    doc_level.setdefault(name, []).append(
+                        ExtensionPart(
+                            value, part.token_offset, owned,
+                            part.char_offset, range(char_start, char_end),
+                        )
+                    )
+                    continue
+                start += part.char_offset
+                if not char_start <= start < char_end:
+                    continue
+                key = (kind, name, start, end + part.char_offset if end is not None else None)
+            doc.user_data[key] = value
+
+    for name, values in doc_level.items():
+        if name == "offset_map":
+            # piece maps are relative to the piece; the caller sets the real one
+            continue
+        merger = DOC_EXTENSION_MERGERS.get(name)
+        if merger is None:
+            raise ValueError(
+                f"No merger registered for doc extension '{name}'. "
+                "Use register_doc_extension_merger to declare one."
+            )
+        doc.user_data[("._.", name, None, None)] = merger(values)
+    return doc
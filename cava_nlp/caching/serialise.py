@@ -0,0 +1,157 @@
+import io
+import pickle
+from typing import Any
+
+from spacy.tokens import Doc, Span
+from spacy.vocab import Vocab
+
+# bump when the byte layout changes, so that old disk entries are ignored
+FORMAT_VERSION = 1
+
+# token annotations restored through the Doc constructor when present
+_TOKEN_ANNOTATIONS = (
+    ("TAG", "tags", "tag_"),
+    ("POS", "pos", "pos_"),
+    ("MORPH", "morphs", "morph"),
+    ("LEMMA", "lemmas", "lemma_"),
+)
+
+
+class _UserDataPickler(pickle.Pickler):
+    """
+    Pickles ``doc.user_data``, replacing references to the doc and its spans
+    (e.g. ConText modifier targets and ``doc._.context_graph``) with token
+    offsets that are re-bound to the restored doc on load.
+    """
+
+    def persistent_id(self, obj: Any) -> Any:
+        if isinstance(obj, Span):
+            return ("span", *_span_state(obj))
+        if isinstance(obj, Doc):
+            return ("doc",)
+        return None
+
+
+class _UserDataUnpickler(pickle.Unpickler):
+    """
+    Loads user data written by ``_UserDataPickler`` onto ``doc``. Span
+    references are shifted by ``token_offset``, for docs that become part
+    of a larger one.
+    """
+
+    def __init__(self, data: bytes, doc: Doc, token_offset: int = 0):
+        super().__init__(io.BytesIO(data))
+        self.doc = doc
+        self.token_offset = token_offset
+
+    def persistent_load(self, pid: Any) -> Any:
+        if pid[0] == "doc":
+            return self.doc
+        if pid[0] == "span":
+            start, end, label, kb_id, span_id = pid[1:]
+            offset = self.token_offset
+            return _make_span(self.doc, (start + offset, end + offset, label, kb_id, span_id))
+        raise pickle.UnpicklingError(f"Unknown persistent id: {pid!r}")
+
+
+def _span_state(span: Span) -> tuple[int, int, str, str, str]:
+    return span.start, span.end, span.label_, span.kb_id_, span.id_
+
+
+def _make_span(doc: Doc, state: tuple[int, int, str, str, str]) -> Span:
+    start, end, label, kb_id, span_id = state
+    return Span(doc, start, end, label=label, kb_id=kb_id, span_id=span_id)
+
+
+def doc_state(doc: Doc) -> dict[str, Any]:
+    """
+    Picklable state of a processed doc, including all custom extension
+    values.
+
+    ``Doc.to_bytes`` cannot store user data that holds spans, which is the
+    case once ConText has run, and its msgpack round trip costs about as
+    much as running a short pipeline. Docs are stored instead as words,
+    the annotations the pipeline sets, and pickled user data.
+    """
+    annotations = {
+        kwarg: [str(getattr(tok, attr)) for tok in doc]
+        for name, kwarg, attr in _TOKEN_ANNOTATIONS
+        if doc.has_annotation(name)
+    }
+    if doc.has_annotation("DEP"):
+        annotations["heads"] = [tok.head.i for tok in doc]
+        annotations["deps"] = [tok.dep_ for tok in doc]
+    buffer = io.BytesIO()
+    _UserDataPickler(buffer, protocol=pickle.HIGHEST_PROTOCOL).dump(doc.user_data)
+    return {
+        "words": [tok.text for tok in doc],
+        "spaces": [bool(tok.whitespace_) for tok in doc],
+        "sent_starts": (
+            [tok.is_sent_start for tok in doc]
+            if doc.has_annotation("SENT_START") else None
+        ),
+        # only norms that differ from the lexeme default, e.g. normalised units
+        "norms": [(tok.i, tok.norm_) for tok in doc if tok.norm != tok.lex.norm],
+        "annotations": annotations,
+        "ents": (
+            [_span_state(ent) for ent in doc.ents]
+            if doc.has_annotation("ENT_IOB") else None
+        ),
+        "spans": {
+            name: [_span_state(span) for span in group]
+            for name, group in doc.spans.items()
+        },
+        "user_data": buffer.getvalue(),
+    }
+
+
+def load_user_data(state: dict[str, Any], doc: Doc, token_offset: int = 0) -> dict[Any, Any]:
+    """
+    Unpickle the user data of ``state`` with its spans bound to ``doc``.
+    """
+    return _UserDataUnpickler(state["user_data"], doc, token_offset).load()
+
+
+def doc_from_state(vocab: Vocab, state: dict[str, Any]) -> Doc:
+    """
+    Rebuild a doc from ``doc_state``.
+    """
+    doc = Doc(
+        vocab,
+        words=state["words"],
+        spaces=state["spaces"],
+        sent_starts=state["sent_starts"],
+        **state["annotations"],
+    )
+    for i, norm in state["norms"]:
+        doc[i].norm_ = norm
+    if state["ents"] is not None:
+        doc.ents = [_make_span(doc, ent) for ent in state["ents"]]
+    for name, spans in state["spans"].items():
+        doc.spans[name] = [_make_span(doc, span) for span in spans]
+    doc.user_data.update(load_user_data(state, doc))
+    return doc
+
+
+def doc_to_bytes(doc: Doc) -> bytes:
+    """
+    Serialise a processed doc, including all custom extension values.
+    """
+    return pickle.dumps((FORMAT_VERSION, doc_state(doc)), protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def state_from_bytes(data: bytes) -> dict[str, Any]:
+    """
+    Load the state written by ``doc_to_bytes`` without building a doc.
+    """
+    version, state = pickle.loads(data)
+    if version != FORMAT_VERSION:
+        raise ValueError(f"Unsupported cached doc format: {version!r}")
+    return state
+
+
+def doc_from_bytes(vocab: Vocab, data: bytes) -> Doc:
+    """
+    Restore a doc written by ``doc_to_bytes``.
+    """
+    return doc_from_state(vocab, state_from_bytes(data))
@@ -6,6 +6,7 @@ from typing import Protocol
 from spacy.language import Language
 from spacy.tokens import Doc, Span
 from ..context.registry import LOCAL_ATTRIBUTES
+from ..normalisation.annotation import splits_annotated_span
 
 REJECT_DISTANCE: int = 1_000_000
 
@@ -217,10 +218,20 @@ class ClosestModifierResolver:
         if graph is None or not graph.edges:
             return doc
 
+        cleared = set()
+        if doc._.norm_annotated:
+            # a modifier inside a normalised span would have been merged away
+            edges = [
+                (target, modifier) for target, modifier in graph.edges
+                if not splits_annotated_span(doc, *modifier.modifier_span)
+            ]
+            cleared = {target for target, _ in graph.edges} - {target for target, _ in edges}
+            graph.edges = edges
+
         parentheticals = getattr(doc._, "parentheticals", [])
         list_items = getattr(doc._, "list_items", [])
         resolved_graph = self.resolve(graph, parentheticals=parentheticals, list_items=list_items)
-        targets = {target for target, _ in resolved_graph.edges}
+        targets = {target for target, _ in resolved_graph.edges} | cleared
         # reset context state
         for target in targets:
             clear_context_attrs(target)
@@ -1,15 +1,36 @@
-import re
 from spacy.lang.en import English
 from spacy.tokens import Doc
-from typing import Any
-from spacy.util import registry
+from itertools import chain
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Optional, Tuple, TypeVar, Union
+from importlib import import_module
+from spacy.util import registry, SimpleFrozenList
 
 # unused imports required to register components
-from medspacy.sentence_splitting import PySBDSentenceSplitter # type: ignore
 from spacy.language import Language # type: ignore
+from .normalisation.normaliser_factory import create_clinical_normalizer # type: ignore
+from .structural.clinical_sentencizer_factory import create_clinical_sentencizer # type: ignore
 
+if TYPE_CHECKING:
+    from .pipeline.selection import ComponentPlan
 from .tokenization.defaults import CaVaLangDefaults
-from .tokenization.preprocess import whitespace_preprocess
+from .tokenization.masking import DEFAULT_MASKS, MaskPattern, resolve_mask_patterns
+from .tokenization.preprocess import OffsetMap, preprocess_text
+from .tokenization.rtf import rtf_to_text
+from .tokenization.tokenizer import create_cava_tokenizer
+
+_AnyContext = TypeVar("_AnyContext")
+
+# sentencizer option -> (pipeline factory, module registering it); medspacy
+# is only imported when its sentencizer is used
+SENTENCIZERS = {
+    "pysbd": ("medspacy_pysbd", "medspacy.sentence_splitting"),
+    "clinical": ("clinical_sentencizer", "cava_nlp.structural.clinical_sentencizer_factory"),
+    "single": ("single_sentence", "cava_nlp.structural.single_sentence_factory"),
+}
+
+# maps preprocessed character offsets back onto the raw input text
+Doc.set_extension("offset_map", default=None, force=True)
 
 @registry.languages('cava_lang')
 class CaVaLang(English):
@@ -17,30 +38,265 @@ class CaVaLang(English):
     Defaults = CaVaLangDefaults
 
     def __init__(
-            self, 
-            with_section_context: bool=False, 
-            with_dated_section_context: bool=False, 
-            *args: Any, 
+            self,
+            with_section_context: bool=False,
+            with_dated_section_context: bool=False,
+            *args: Any,
+            masks: Iterable[Union[str, MaskPattern]]=DEFAULT_MASKS,
+            sentencizer: str="pysbd",
+            tokenizer_artefact: Optional[Union[str, Path]]=None,
             **kwargs: Any
         ) -> None:
+        """
+        Parameters
+        ----------
+        sentencizer : str
+            ``"pysbd"`` (default) for the medspaCy pysbd splitter, or
+            ``"clinical"`` for the faster rule-based ``clinical_sentencizer``,
+            which splits on line breaks and sentence-final punctuation, or
+            ``"single"`` to treat each input as one sentence (short fields).
+        masks : Iterable[str | MaskPattern]
+            Identifiers to mask before tokenization, by registered name
+            (``"email"``, ``"phone"``, ``"mrn"``, ``"medicare"``) or as
+            ``MaskPattern`` instances. All of them are applied in the same
+            single scan as whitespace condensing.
+        tokenizer_artefact : str or Path, optional
+            Path of a tokenizer artefact, a JSON file holding the tokenizer
+            pattern sources and special cases. It is loaded if it matches
+            the current tokenizer rules and spaCy version, and (re)written
+            otherwise.
+        """
+        if sentencizer not in SENTENCIZERS:
+            raise ValueError(
+                f"Unknown sentencizer: {sentencizer!r}. "
+                f"Available: {sorted(SENTENCIZERS)}"
+            )
+        if tokenizer_artefact is not None:
+            kwargs["create_tokenizer"] = create_cava_tokenizer(str(tokenizer_artefact))
         super().__init__(*args, **kwargs)  # type: ignore[reportUnknownMemberType]
+        self.mask_patterns = resolve_mask_patterns(masks)
+        self._component_plans: dict[tuple[tuple[str, ...], frozenset[str]], "ComponentPlan"] = {}
+
+        # medSpaCy pysbd is better than pyrush for newlines but brings a python <3.12 dependency for pep701;
+        # clinical_sentencizer is a faster rule-based alternative tuned for line-oriented notes
+        factory, module = SENTENCIZERS[sentencizer]
+        import_module(module)
+        self.add_pipe(factory)
+
+    def preprocess_with_offsets(
+            self,
+            text: str,
+            whitespace_strip: tuple[str,str]=(' ', '\n'),
+        ) -> tuple[str, OffsetMap]:
+        """
+        Raw-text preprocessing applied before tokenization.
+
+        Whitespace condensing and identifier masking happen in a single scan
+        of the text. Shared by ``__call__`` and ``pipe`` so that single-document
+        and batch processing produce identical tokens.
 
-        # Use medSpaCy sentencizer - todo: this is better than pyrush for newlines but brings a python <3.12 dependency for pep701
-        self.add_pipe("medspacy_pysbd")
+        Returns
+        -------
+        tuple[str, OffsetMap]
+            The preprocessed text, and the map from its character offsets
+            back to ``text``.
+        """
+        return preprocess_text(
+            text,
+            condense=whitespace_strip or (),
+            masks=self.mask_patterns,
+        )
+
+    def preprocess(
+            self,
+            text: str,
+            whitespace_strip: tuple[str,str]=(' ', '\n'),
+        ) -> str:
+        """
+        Preprocess text without keeping the offset map.
+        """
+        return self.preprocess_with_offsets(text, whitespace_strip)[0]
+
+    def component_plan(self, outputs: Iterable[str]) -> "ComponentPlan":
+        """
+        The components needed for ``outputs`` (span-group names or entity
+        labels), cached per output set and pipeline layout.
+        """
+        # cava_nlp.pipeline builds on CaVaLang, so it is imported on use
+        from .pipeline.selection import plan_components
+
+        key = (tuple(self.pipe_names), frozenset(outputs))
+        plan = self._component_plans.get(key)
+        if plan is None:
+            plan = self._component_plans[key] = plan_components(self, key[1])
+        return plan
 
     def __call__(
-            self, 
-            text: str, 
-            whitespace_strip: tuple[str,str]=(' ', '\n'), 
-            *args: Any, 
+            self,
+            text: Union[str, Doc],
+            whitespace_strip: tuple[str,str]=(' ', '\n'),
+            *args: Any,
+            outputs: Optional[Iterable[str]] = None,
+            **kwargs: Any
+        ) -> Doc:
+        """
+        Parameters
+        ----------
+        outputs : Iterable[str], optional
+            Only produce these span groups or entity labels, e.g.
+            ``{"ecog"}``. Components they do not depend on are not run, and
+            ConText is skipped for docs without entities. Spans and
+            extensions of the other components are then absent.
+        """
+        if outputs is not None:
+            if not isinstance(text, Doc):
+                text = self.make_preprocessed_doc(text, whitespace_strip)
+            return self.component_plan(outputs).run(self, text)
+        if isinstance(text, Doc):
+            # already preprocessed and tokenized, e.g. by make_preprocessed_doc
+            return super().__call__(text, *args, **kwargs)
+        text, offset_map = self.preprocess_with_offsets(text, whitespace_strip)
+        doc = super().__call__(text, *args, **kwargs)
+        doc._.offset_map = offset_map
+        return doc
+
+    def from_rtf(
+            self,
+            rtf: Union[str, bytes],
+            whitespace_strip: tuple[str,str]=(' ', '\n'),
+            *args: Any,
             **kwargs: Any
         ) -> Doc:
-        # Whitespace preprocessing (optional)
-        if whitespace_strip:
-            text = whitespace_preprocess(text, whitespace_strip)
+        """
+        Process an RTF document, e.g. an EHR export, without stripping it
+        to plain text beforehand.
+
+        The RTF is decoded in one scan and fed directly into the usual
+        preprocessing. ``doc._.offset_map`` refers to the decoded text.
+        """
+        return self(rtf_to_text(rtf), whitespace_strip, *args, **kwargs)
+
+    def pipe(  # type: ignore[override]
+            self,
+            texts: Union[
+                Iterable[Union[str, Doc]],
+                Iterable[Tuple[Union[str, Doc], _AnyContext]],
+            ],
+            *,
+            as_tuples: bool = False,
+            batch_size: Optional[int] = None,
+            disable: Iterable[str] = SimpleFrozenList(),
+            component_cfg: Optional[dict[str, dict[str, Any]]] = None,
+            n_process: int = 1,
+            whitespace_strip: tuple[str,str]=(' ', '\n'),
+            rtf: bool = False,
+            outputs: Optional[Iterable[str]] = None,
+        ) -> Iterator[Union[Doc, Tuple[Doc, _AnyContext]]]:
+        """
+        Process texts as a stream, applying the same preprocessing as
+        ``__call__`` before handing the batch to spaCy.
+
+        Parameters
+        ----------
+        texts : Iterable[str | Doc] or Iterable[tuple[str | Doc, Any]]
+            Texts to process. Pre-built ``Doc`` objects are passed through
+            untouched, as their text has already been fixed.
+        as_tuples : bool
+            If True, ``texts`` yields ``(text, context)`` pairs and the
+            output yields ``(doc, context)`` pairs.
+        batch_size, disable, component_cfg, n_process
+            Passed through to ``spacy.Language.pipe``.
+        whitespace_strip : tuple[str, str]
+            Characters whose runs are condensed, as for ``__call__``.
+        rtf : bool
+            If True, texts are RTF and are decoded as for ``from_rtf``.
+        outputs : Iterable[str], optional
+            Only produce these outputs, as for ``__call__``. Docs then go
+            through the selected components one at a time, in this process.
+        """
+        if rtf:
+            if as_tuples:
+                texts = (
+                    (text if isinstance(text, Doc) else rtf_to_text(text), context)
+                    for text, context in texts  # type: ignore[misc]
+                )
+            else:
+                texts = (
+                    text if isinstance(text, Doc) else rtf_to_text(text)  # type: ignore[arg-type]
+                    for text in texts
+                )
+
+        if outputs is not None:
+            if n_process != 1:
+                raise ValueError("outputs cannot be combined with n_process > 1")
+            outputs = frozenset(outputs)
+            if as_tuples:
+                for text, context in texts:  # type: ignore[misc]
+                    yield self(text, whitespace_strip, outputs=outputs), context
+            else:
+                for text in texts:
+                    yield self(text, whitespace_strip, outputs=outputs)  # type: ignore[arg-type]
+            return
+
+        def _prep(text: Union[str, Doc], context: Any) -> Tuple[Union[str, Doc], Any]:
+            if isinstance(text, Doc):
+                return text, (context, None)
+            text, offset_map = self.preprocess_with_offsets(text, whitespace_strip)
+            return text, (context, offset_map)
 
-        # Mask emails before tokenization if needed
-        email_regex = r"[A-Za-z0-9.\-_]+@[A-Za-z0-9\-.]+\.[A-Za-z]+"
-        text = re.sub(email_regex, lambda m: "x" * len(m.group()), text)
+        pipe_kwargs: dict[str, Any] = {
+            "batch_size": batch_size,
+            "disable": disable,
+            "component_cfg": component_cfg,
+            "n_process": n_process,
+        }
 
-        return super().__call__(text, *args, **kwargs)
+        if as_tuples:
+            # offset maps travel alongside each text as part of its context,
+            # so they survive batching and multiprocessing
+            prepared = (_prep(text, context) for text, context in texts)  # type: ignore[misc]
+            for doc, (context, offset_map) in super().pipe(  # type: ignore[call-overload]
+                prepared, as_tuples=True, **pipe_kwargs
+            ):
+                if offset_map is not None:
+                    doc._.offset_map = offset_map
+                yield doc, context
+            return
+
+        stream = iter(texts)
+        first = next(stream, None)
+        if first is None:
+            return
+        stream = chain([first], stream)
+
+        if isinstance(first, Doc):
+            # already-built docs, including spaCy's own re-entry from the
+            # as_tuples path above, go straight to the pipeline
+            docs = (
+                text if isinstance(text, Doc) else self.make_preprocessed_doc(text, whitespace_strip)  # type: ignore[arg-type]
+                for text in stream
+            )
+            yield from super().pipe(docs, **pipe_kwargs)  # type: ignore[call-overload]
+            return
+
+        for doc, _ in self.pipe(  # type: ignore[misc]
+            ((text, None) for text in stream),
+            as_tuples=True,
+            whitespace_strip=whitespace_strip,
+            **pipe_kwargs,
+        ):
+            yield doc
+
+    def make_preprocessed_doc(
+            self,
+            text: str,
+            whitespace_strip: tuple[str,str]=(' ', '\n'),
+        ) -> Doc:
+        """
+        Preprocess and tokenize ``text`` without running the pipeline.
+        The result can be passed to ``__call__`` or ``pipe``.
+        """
+        text, offset_map = self.preprocess_with_offsets(text, whitespace_strip)
+        doc = self.make_doc(text)
+        doc._.offset_map = offset_map
+        return doc
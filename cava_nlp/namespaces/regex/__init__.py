@@ -1,4 +1,4 @@
-from .datetime import year_regex, numeric_month_regex, day_regex, months, ordinal, date_patterns, times
+from .datetime import year_regex, numeric_month_regex, day_regex, months, ordinal, date_patterns, date_roles, times
 from .numeric import scientific_notation, ordinal
 from .units import weight_units, units_num, units_denom, unit_suffix, units_regex
 from .common import abbv, no_whitespace, emails
\ No newline at end of file
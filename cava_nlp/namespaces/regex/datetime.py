@@ -19,6 +19,24 @@ date_patterns = [[{"IS_DIGIT": True, 'SPACY': False}, {"ORTH": "-", 'SPACY': Fal
                  [{"IS_DIGIT": True, 'OP': "?"}, {"LOWER": {"IN": months}},  {"ORTH": {"IN": ["/", "-", "\'"]}, "OP": "?", "SPACY": False}, {"TEXT": {"REGEX": year_regex}}], # Jan/2020, Jan 2020, Jan '20
                  [{"IS_DIGIT": True, 'OP': "?"}, {"LOWER": {"IN": months}},  {"ORTH": {"IN": ["/", "-", "\'"]}, "OP": "?", "SPACY": False}, {"TEXT": {"REGEX": numeric_month_regex}}, {"TEXT": {"REGEX": year_regex}, "OP": "?"}]] # September 4th
 
+# the role of each element of the matching ``date_patterns`` entry, for
+# building a date from the matched tokens without re-parsing the text. A
+# trailing ``?`` marks an optional element. A numeric date whose first part
+# has four digits is read year-first (2024-03-12).
+date_roles = [("day", "sep", "month", "sep", "year"),
+              ("day", "sep", "month", "sep", "year", "hour", "sep", "minute", "sep", "second"),
+              ("day", "sep", "month", "sep", "year"),
+              ("day", "sep", "month", "sep", "year"),
+              ("month", "sep", "year"),
+              ("day", "sep", "month_name", "sep", "year"),
+              ("day", "sep", "month_name", "sep", "year"),
+              ("day", "sep", "month_name", "sep", "year"),
+              ("day?", "month_name", "sep?", "day", "ordinal", "year?"),
+              ("day?", "month_name", "sep?", "year"),
+              ("day?", "month_name", "sep?", "day", "year?")]
+
+assert len(date_roles) == len(date_patterns)
+
 times = ['am', 'a.m.', 'a.m', 'pm', 'p.m.', 'p.m', 'hrs', 'hr', 'o\'clock', 'oclock']
 
 
@@ -1,7 +1,12 @@
+from .index import KINDS, NormIndex
 from .normaliser import ClinicalNormalizer
 from .normaliser_factory import create_clinical_normalizer
+from .parse_cache import ParseCache
 
 __all__ = [
     "ClinicalNormalizer",
+    "KINDS",
+    "NormIndex",
+    "ParseCache",
     "create_clinical_normalizer",
-]
\ No newline at end of file
+]
@@ -0,0 +1,204 @@
+from typing import Any, Optional, Union
+
+from spacy.matcher import Matcher
+from spacy.tokens import Doc, Span, Token
+from spacy.vocab import Vocab
+
+# set by ``clinical_normalizer`` with ``merge=False``
+Doc.set_extension("norm_annotated", default=False, force=True)
+# "head" and "inside" for the first and later tokens of an annotated span of
+# more than one token; the head also carries the span's text as
+# ``norm_text``, ``norm_lower`` and ``norm_length``. The defaults are not
+# None, as the matcher's extension predicates cannot compare with None.
+Token.set_extension("norm_part", default="", force=True)
+Token.set_extension("norm_text", default="", force=True)
+Token.set_extension("norm_lower", default="", force=True)
+Token.set_extension("norm_length", default=0, force=True)
+
+PART = "norm_part"
+# token attributes of a merged token, read from the head of an annotated span
+SPAN_ATTRS = {"ORTH": "norm_text", "TEXT": "norm_text", "LOWER": "norm_lower", "LENGTH": "norm_length"}
+# attributes of a merged token that the head shares: its extensions, and the
+# NORM written by the normaliser
+HEAD_ATTRS = {"_", "NORM"}
+
+Pattern = list[dict[str, Any]]
+
+
+def annotate_span(span: Span, norm: Optional[str] = None) -> None:
+    """
+    Mark ``span`` so that an ``AnnotationMatcher`` takes it as one token,
+    as if it had been merged, and give its head the merged ``NORM``.
+    """
+    head = span[0]
+    if norm is not None:
+        head.norm_ = norm
+    if len(span) == 1:
+        return
+    text = span.text
+    ext = head._
+    ext.norm_part = "head"
+    ext.norm_text = text
+    ext.norm_lower = text.lower()
+    ext.norm_length = len(text)
+    for token in span[1:]:
+        token._.norm_part = "inside"
+
+
+def splits_annotated_span(doclike: Union[Doc, Span], start: int, end: int) -> bool:
+    """
+    Whether tokens ``start:end`` of ``doclike`` begin or end inside an
+    annotated span, i.e. could not be told apart once it was merged.
+    """
+    return doclike[start]._.norm_part == "inside" or (
+        end < len(doclike) and doclike[end]._.norm_part == "inside"
+    )
+
+
+def _with_part(token: dict[str, Any], parts: dict[str, list[str]]) -> dict[str, Any]:
+    return {**token, "_": {**token.get("_", {}), PART: parts}}
+
+
+def _span_head(token: dict[str, Any]) -> Optional[dict[str, Any]]:
+    """
+    ``token`` matched against the span text on the head of an annotated
+    span, or None if it reads an attribute the head cannot stand in for.
+    """
+    underscore = {**token.get("_", {}), PART: {"IN": ["head"]}}
+    head = {}
+    for attr, value in token.items():
+        if attr in ("OP", *HEAD_ATTRS):
+            head[attr] = value
+        elif attr in SPAN_ATTRS:
+            if isinstance(value, str):
+                value = {"IN": [value]}
+            elif isinstance(value, int):
+                value = {"==": value}
+            underscore[SPAN_ATTRS[attr]] = value
+        else:
+            return None
+    head["_"] = underscore
+    return head
+
+
+def _may_be_span_text(token: dict[str, Any]) -> bool:
+    """
+    Whether ``token`` matches a literal text that could be that of an
+    annotated span, i.e. more than one token, such as "0-1" or "70kg".
+    """
+    for attr in ("ORTH", "TEXT", "LOWER"):
+        value = token.get(attr)
+        if isinstance(value, dict):
+            value = value.get("IN")
+        values = [value] if isinstance(value, str) else value or []
+        if any(
+            isinstance(v, str) and len(v) > 1 and not (v.isalpha() or v.isdigit())
+            for v in values
+        ):
+            return True
+    return False
+
+
+def element_variants(token: dict[str, Any]) -> list[tuple[Pattern, bool]]:
+    """
+    The token sequences standing in for pattern token ``token`` on an
+    annotated doc, each with whether it may match an annotated span.
+
+    A token that reads extensions (``"_"``) or is a wildcard matches an
+    annotated span as a whole: its head, then the rest of the span. Other
+    tokens are left as they are, and must not match inside an annotated
+    span, just as they could not match inside a merged token. A token that
+    reads extensions and also text or length, or that matches a literal
+    text of several tokens, matches either a single token or a span head
+    against the span text.
+    """
+    inside = {"_": {PART: {"IN": ["inside"]}}, "OP": "*"}
+    attrs = set(token) - {"OP"}
+    if not attrs or attrs <= HEAD_ATTRS and "_" in attrs:
+        return [([_with_part(token, {"NOT_IN": ["inside"]}), inside], True)]
+    if "_" not in attrs and not _may_be_span_text(token):
+        return [([token], False)]
+    head = _span_head(token)
+    return [([token], False)] + ([] if head is None else [([head, inside], True)])
+
+
+def span_patterns(pattern: Pattern) -> list[tuple[Pattern, list[bool]]]:
+    """
+    ``pattern`` rewritten for annotated docs, one pattern per combination
+    of the variants of its tokens (see ``element_variants``), each with
+    whether each of its tokens may match an annotated span.
+    """
+    variants: list[tuple[Pattern, list[bool]]] = [([], [])]
+    for token in pattern:
+        variants = [
+            (v + option, spans + [takes_span] * len(option))
+            for v, spans in variants
+            for option, takes_span in element_variants(token)
+        ]
+    return variants
+
+
+class AnnotationMatcher:
+    """
+    A spaCy ``Matcher`` that takes each annotated span of a doc normalised
+    with ``merge=False`` (see ``ClinicalNormalizer``) as a single pattern
+    token, so that the same patterns match with and without merging. Docs
+    that are not annotated are matched as they are.
+
+    On annotated docs the patterns are rewritten by ``span_patterns``, and
+    matches are dropped that start or end inside an annotated span, or in
+    which a pattern token that may not match a span took part of one.
+    Token attributes other than the text, length, ``NORM`` and extensions
+    are read from the head of a span, and a token repeated with ``*`` or
+    ``+`` only takes a span of several tokens as its last repetition.
+    """
+
+    def __init__(self, vocab: Vocab):
+        self.vocab = vocab
+        self.matcher = Matcher(vocab)
+        self.patterns: list[tuple[str, list[Pattern]]] = []
+        self._span_matcher: Optional[Matcher] = None
+        # span matcher key -> (key, whether each pattern token may match a span)
+        self._variants: dict[int, tuple[int, list[bool]]] = {}
+
+    def add(self, key: str, patterns: list[Pattern]) -> None:
+        self.matcher.add(key, patterns)
+        self.patterns.append((key, patterns))
+        self._span_matcher = None
+
+    @property
+    def span_matcher(self) -> Matcher:
+        if self._span_matcher is None:
+            self._span_matcher = Matcher(self.vocab)
+            self._variants = {}
+            strings = self.vocab.strings
+            for key, patterns in self.patterns:
+                variants = [v for pattern in patterns for v in span_patterns(pattern)]
+                # each variant is added under its own key, so that its
+                # alignments can be read against its tokens
+                for i, (variant, takes_span) in enumerate(variants):
+                    variant_key = f"{key}#{i}"
+                    self._span_matcher.add(variant_key, [variant])
+                    self._variants[strings[variant_key]] = (strings.add(key), takes_span)
+        return self._span_matcher
+
+    def __call__(self, doclike: Union[Doc, Span]) -> list[tuple[int, int, int]]:
+        if not doclike.doc._.norm_annotated:
+            return self.matcher(doclike)
+        matches = []
+        seen = set()
+        for variant_key, start, end, alignments in self.span_matcher(
+            doclike, with_alignments=True
+        ):
+            key, takes_span = self._variants[variant_key]
+            match = (key, start, end)
+            if match in seen or splits_annotated_span(doclike, start, end):
+                continue
+            if any(
+                doclike[i]._.norm_part and not takes_span[a]
+                for i, a in zip(range(start, end), alignments)
+            ):
+                continue
+            seen.add(match)
+            matches.append(match)
+        return matches
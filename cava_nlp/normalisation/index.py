@@ -0,0 +1,184 @@
+from dataclasses import dataclass
+from typing import Iterable, Optional
+
+import numpy as np
+from spacy.tokens import Doc, Span, SpanGroup
+
+# set by ``clinical_normalizer`` with ``norm_index=True``
+Doc.set_extension("norm_index", default=None, force=True)
+
+# kind codes of the built-in normalisers and numeric literals; kinds set by
+# other normalisers are appended per index
+KINDS = ("date", "time", "unit_norm", "range", "bullet", "decimal", "scientific")
+
+
+@dataclass(frozen=True)
+class NormIndex:
+    """
+    Column-wise record of the normalised tokens of one doc, one row per
+    token in doc order.
+
+    Tokens are recorded by character offsets, which stay valid when a later
+    component retokenizes the doc (a rule engine merging its entities, for
+    instance); ``tokens`` and ``span_group`` resolve them against the doc
+    as it is now.
+
+    Attributes
+    ----------
+    start, end : np.ndarray[int64]
+        Character offsets of the token.
+    kind : np.ndarray[int16]
+        Index into ``kinds``.
+    value : np.ndarray[float64]
+        ``_.value`` where it is a number, else NaN (dates and times keep
+        their string value on the token).
+    unit : np.ndarray[int32]
+        Index into ``units``, or -1.
+    low, high : np.ndarray[float64]
+        Bounds of ranges, else NaN.
+    kinds, units : tuple[str, ...]
+        Names behind the kind and unit codes.
+    """
+    start: np.ndarray
+    end: np.ndarray
+    kind: np.ndarray
+    value: np.ndarray
+    unit: np.ndarray
+    low: np.ndarray
+    high: np.ndarray
+    kinds: tuple[str, ...] = KINDS
+    units: tuple[str, ...] = ()
+
+    def __len__(self) -> int:
+        return len(self.start)
+
+    @classmethod
+    def from_rows(
+            cls,
+            rows: Iterable[tuple[int, int, str, Optional[float], Optional[str], Optional[float], Optional[float]]],
+        ) -> "NormIndex":
+        """
+        Build an index from ``(start, end, kind, value, unit, low, high)``
+        rows in doc order; None stands for a missing value.
+        """
+        kinds = list(KINDS)
+        kind_codes = {kind: code for code, kind in enumerate(kinds)}
+        units: list[str] = []
+        unit_codes: dict[str, int] = {}
+        columns: tuple[list, ...] = ([], [], [], [], [], [], [])
+        for start, end, kind, value, unit, low, high in rows:
+            code = kind_codes.get(kind)
+            if code is None:
+                code = kind_codes[kind] = len(kinds)
+                kinds.append(kind)
+            unit_code = -1
+            if unit is not None:
+                unit_code = unit_codes.get(unit, -1)
+                if unit_code < 0:
+                    unit_code = unit_codes[unit] = len(units)
+                    units.append(unit)
+            for column, item in zip(columns, (start, end, code, value, unit_code, low, high)):
+                column.append(item)
+        start_col, end_col, kind_col, value_col, unit_col, low_col, high_col = columns
+        return cls(
+            start=np.array(start_col, dtype=np.int64),
+            end=np.array(end_col, dtype=np.int64),
+            kind=np.array(kind_col, dtype=np.int16),
+            value=np.array(value_col, dtype=np.float64),
+            unit=np.array(unit_col, dtype=np.int32),
+            low=np.array(low_col, dtype=np.float64),
+            high=np.array(high_col, dtype=np.float64),
+            kinds=KINDS if len(kinds) == len(KINDS) else tuple(kinds),
+            units=tuple(units),
+        )
+
+    def rows(self):
+        """
+        The rows as ``(start, end, kind, value, unit, low, high)`` with
+        names for the codes and None for missing values.
+        """
+        def number(x: float) -> Optional[float]:
+            return None if np.isnan(x) else float(x)
+
+        for i in range(len(self)):
+            unit = int(self.unit[i])
+            yield (
+                int(self.start[i]),
+                int(self.end[i]),
+                self.kinds[self.kind[i]],
+                number(self.value[i]),
+                self.units[unit] if unit >= 0 else None,
+                number(self.low[i]),
+                number(self.high[i]),
+            )
+
+    def mask(self, kind: str) -> np.ndarray:
+        """
+        Boolean row mask for ``kind``.
+        """
+        if kind not in self.kinds:
+            return np.zeros(len(self), dtype=bool)
+        return self.kind == self.kinds.index(kind)
+
+    def with_units(self) -> np.ndarray:
+        """
+        Boolean row mask for numeric values that carry a unit.
+        """
+        return (self.unit >= 0) & ~np.isnan(self.value)
+
+    def spans(self, doc: Doc, mask: Optional[np.ndarray] = None, label: str = "") -> list[Span]:
+        """
+        The indexed tokens (or those of ``mask``) as spans of ``doc``. A
+        token since merged into a larger one resolves to the larger token.
+        """
+        rows = np.arange(len(self)) if mask is None else np.flatnonzero(mask)
+        return [
+            doc.char_span(int(self.start[i]), int(self.end[i]), label=label, alignment_mode="expand")
+            for i in rows
+        ]
+
+    def tokens(self, doc: Doc, mask: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Current token indices in ``doc`` of the indexed tokens (or those of
+        ``mask``).
+        """
+        return np.array([span.start for span in self.spans(doc, mask)], dtype=np.int64)
+
+    def span_group(self, doc: Doc, kind: str) -> SpanGroup:
+        """
+        The span group of ``kind`` tokens, built from the index on first
+        request and kept in ``doc.spans``.
+        """
+        group = doc.spans.get(kind)
+        if group is None:
+            group = SpanGroup(doc, name=kind, spans=self.spans(doc, self.mask(kind), kind))
+            doc.spans[kind] = group
+        return group
+
+
+def _number(value: object) -> Optional[float]:
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    return None
+
+
+def build_norm_index(doc: Doc, found: Iterable[tuple[int, str]]) -> NormIndex:
+    """
+    Index the tokens of ``found`` (``(token, kind)`` pairs in doc order)
+    from their extension values.
+    """
+    rows = []
+    for i, kind in found:
+        token = doc[i]
+        underscore = token._
+        unit = underscore.unit if kind == "unit_norm" else None
+        rows.append((
+            token.idx,
+            token.idx + len(token),
+            kind,
+            _number(underscore.value),
+            unit if isinstance(unit, str) else None,
+            _number(underscore.low) if kind == "range" else None,
+            _number(underscore.high) if kind == "range" else None,
+        ))
+    return NormIndex.from_rows(rows)
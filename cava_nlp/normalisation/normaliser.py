@@ -3,16 +3,29 @@ from spacy.util import filter_spans
 from spacy.tokens import Token, Doc, Span, SpanGroup
 from cava_nlp.namespaces.regex import (
     date_patterns,
+    date_roles,
+    months,
+    ordinal,
     times,
     units_regex
 )
-import dateparser
-from datetime import datetime
+import re
+from datetime import date, datetime
+from importlib import import_module
 from dataclasses import dataclass, field
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Sequence
+from .annotation import annotate_span
+from .index import build_norm_index
+from .parse_cache import ParseCache
 
 Token.set_extension("kind", default=None, force=True)
 
+
+def _dateparser() -> Any:
+    # dateparser takes ~0.2 s to import, so it is loaded by the normalisers
+    # that use it rather than by ``import cava_nlp``
+    return import_module("dateparser")
+
 @dataclass
 class NormalisationResult:
     """
@@ -73,10 +86,16 @@ class BaseNormalizer:
         self.matcher = Matcher(nlp.vocab)
         if self.NAME and self.PATTERNS:
             self.matcher.add(self.NAME, self.PATTERNS)
-            Token.set_extension(self.NAME, default=False, force=True)
-
-        for ext in self.EXTENSIONS:
+        self.register_extensions()
+
+    @classmethod
+    def register_extensions(cls):
+        """Register the token extensions the normaliser writes."""
+        if cls.NAME:
+            Token.set_extension(cls.NAME, default=False, force=True)
+        for ext in cls.EXTENSIONS:
             Token.set_extension(ext, default=None, force=True)
+            Span.set_extension(ext, default=None, force=True)
 
     def compute(self, span) -> NormalisationResult:
         """Override in subclass"""
@@ -86,7 +105,41 @@ class BaseNormalizer:
         matches = self.matcher(doc)
         spans = [doc[start:end] for _, start, end in matches]
         return filter_spans(spans)
-    
+
+    def pattern_sets(self):
+        """
+        The normaliser's patterns as ``(patterns, skip)`` pairs, where
+        ``skip`` is the number of leading matched tokens that are context
+        rather than part of the normalised span.
+        """
+        return [(self.PATTERNS, 0)] if self.NAME and self.PATTERNS else []
+
+    def merge(self, retok, span, res):
+        """Write the compute() result to the span's head and queue its merge."""
+        head = span[0]
+
+        if hasattr(head._, "kind"):
+            head._.kind = self.NAME
+
+        for attr, val in res.attrs.items():
+            setattr(head._, attr, val)
+
+        setattr(head._, self.NAME, True)  # type: ignore
+        retok.merge(span, attrs={"NORM": res.norm})
+
+    def annotate(self, span, res):
+        """
+        Write the compute() result to the span's head, as merge() does, and
+        to the span, and mark the span instead of merging it.
+        """
+        head, ext = span[0]._, span._
+        head.kind = self.NAME
+        for attr, val in res.attrs.items():
+            setattr(head, attr, val)
+            setattr(ext, attr, val)
+        setattr(head, self.NAME, True)  # type: ignore
+        annotate_span(span, res.norm)
+
     def apply(self, doc):
         """Run matcher on doc and merge spans."""
         spans = self.get_spans(doc)    
@@ -106,48 +159,10 @@ class BaseNormalizer:
 
         with doc.retokenize() as retok:
             for span, match in zip(spans, matches):
-                res = match["res"]
-
-                head = span[0]
-
-                if hasattr(head._, "kind"):
-                    head._.kind = self.NAME
-
-                for attr, val in res.attrs.items():
-                    setattr(head._, attr, val)
-
-                setattr(head._, self.NAME, True)  # type: ignore
-                retok.merge(span, attrs={"NORM": res.norm})
+                self.merge(retok, span, match["res"])
         return doc
     
 
-class DecimalNormalizer(BaseNormalizer):
-    """
-    This is required because of the harsh tokenization in this pipeline - otherwise would be core spaCy functionality.
-    "Temp is 36.9 today" 
-        token ["36.9"] norm="36.9", value=36.9, kind="decimal"
-    """
-    NAME = "decimal"
-    EXTENSIONS = ["value"]
-    PATTERNS = [
-            [ 
-                # strict about trailing spaces for reassembling decimal points
-                {"IS_DIGIT": True, "LIKE_NUM": True, "SPACY": False}, 
-                {"ORTH": {"IN": ['.']}, 'SPACY': False}, 
-                {"IS_DIGIT": True, "LIKE_NUM": True}
-            ]
-        ]
-
-    def compute(self, span):
-        text = span.text.replace(",", ".")
-        value = float(text)
-        return NormalisationResult(
-            norm=text,
-            attrs={
-                "value": value
-            }
-        )
-
 class BulletNormalizer(BaseNormalizer):
     NAME = "bullet"
     EXTENSIONS = ["is_bullet"]
@@ -184,55 +199,30 @@ class BulletNormalizer(BaseNormalizer):
             attrs={"is_bullet": True}
         )
 
-class SciNotNormalizer(BaseNormalizer):
+class DateNormalizer(BaseNormalizer):
     """
-    "WCC was 10^9 today"
-        token ["10^9"], norm="10.0^9", value=1_000_000_000, kind="scientific", base=10.0, exp=9
-    """    
-    NAME = "scientific"
-    EXTENSIONS = ["value", "base", "exp"]
-    PATTERNS = [
-            [
-                {"LOWER":"x", "OP": "?"},
-                {"TEXT": "10"}, 
-                {"LOWER":"x", "OP": "?"},
-                {"TEXT": {"IN":["^", "**"]}},
-                {"IS_DIGIT": True}
-            ],
-            [
-                {"IS_DIGIT": True, 'SPACY': False},
-                {"LOWER": "e", 'SPACY': False},
-                {"TEXT": "+", "OP": "?"},
-                {"IS_DIGIT": True}
-            ]
-        ]
-    
-    def compute(self, span):
-        try:
-            base = float([t.text for t in span if t.like_num][0])
-            raw_exp = span[-1].text.replace("^", "").replace("**", "")
-            exp = int(raw_exp)
-            value = base ** exp
-        except Exception:
-            return NormalisationResult(
-                norm=span.text,
-                attrs={}
-            )
-        return NormalisationResult(
-            norm=f"{base}^{exp}",
-            attrs={
-                "base": base,
-                "exp": exp,
-                "value": value
-            }
-        )
-
+    Dates, normalised to ``YYYY-MM-DD``.
 
-class DateNormalizer(BaseNormalizer):
+    Parsed strings are looked up in ``cache`` first. dateparser fills a
+    missing year (``September 4th``, ``Jan '20``) with the current one, so
+    the year is part of the cache namespace.
+    """
     NAME = "date"
     EXTENSIONS = ["value"]
-
-    def __init__(self, nlp):
+    SETTINGS = {"DATE_ORDER": "DMY", "PREFER_DAY_OF_MONTH": "first"}
+
+    def __init__(
+            self,
+            nlp,
+            cache: Optional[ParseCache] = None,
+            locales: Optional[Sequence[str]] = None,
+            date_order: str = "DMY",
+        ):
+        _dateparser()
+        self.cache = cache if cache is not None else ParseCache()
+        self.locales = list(locales) if locales else None
+        self.settings = {**self.SETTINGS, "DATE_ORDER": date_order}
+        self._namespace = f"{self.NAME}|{sorted(self.settings.items())}|{self.locales}"
         self.skip_matcher = Matcher(nlp.vocab)   # handles sentence-start patterns
         self._register_patterns()
         super().__init__(nlp)
@@ -251,8 +241,13 @@ class DateNormalizer(BaseNormalizer):
         patterns = self.patterns()
         assert len(patterns) == 2, "DateNormalizer patterns should return two lists."
         self.skip_matcher.add(self.NAME, patterns[0])
+        self.SKIP_PATTERNS = patterns[0]
         self.PATTERNS = patterns[1]
 
+    def pattern_sets(self):
+        # the skip patterns match the space or newline before the date too
+        return [(self.PATTERNS, 0), (self.SKIP_PATTERNS, 1)]
+
     def get_spans(self, doc):
         matches = self.matcher(doc)
         spans = [doc[start:end] for _, start, end in matches]
@@ -260,13 +255,19 @@ class DateNormalizer(BaseNormalizer):
         spans += [doc[start+1:end] for _, start, end in skip_matches]
         return filter_spans(spans)
     
-    def compute(self, span):
+    def parse(self, text: str) -> Optional[str]:
         try:
-            dt = datetime.strptime(span.text, "%Y-%m-%d")
+            dt = datetime.strptime(text, "%Y-%m-%d")
         except ValueError:
-            # todo: make this configurable for non-au users
-            dt = dateparser.parse(span.text, settings={'DATE_ORDER': 'DMY', "PREFER_DAY_OF_MONTH": 'first'})
-        norm=dt.strftime("%Y-%m-%d") if dt else span.text
+            dt = _dateparser().parse(text, settings=self.settings, locales=self.locales)
+        return dt.strftime("%Y-%m-%d") if dt else None
+
+    def parse_span(self, span) -> Optional[str]:
+        return self.parse(span.text)
+
+    def compute(self, span):
+        namespace = f"{self._namespace}|{date.today().year}"
+        norm = self.cache.lookup(namespace, span.text, lambda _: self.parse_span(span)) or span.text
         return NormalisationResult(
             norm=norm,
             attrs={"value": norm}
@@ -274,46 +275,231 @@ class DateNormalizer(BaseNormalizer):
     
 
 
-TIME_FORMATS = [
-    "%H:%M",       # 07:30
-    "%I:%M%p",     # 7:30pm
-    "%I%p",        # 7pm
-    "%H%M",        # 1330
-]
-
-def parse_single_time(text: str):
+MONTH_NUMBERS = {
+    name: ["jan", "feb", "mar", "apr", "may", "jun",
+           "jul", "aug", "sep", "oct", "nov", "dec"].index(name[:3]) + 1
+    for name in months
+}
+ORDINAL = re.compile(ordinal)
+SEPARATORS = {"/", "-", ".", "'", ":"}
+# the token each role takes
+ROLE_TOKENS = {
+    "day": str.isdigit,
+    "month": str.isdigit,
+    "year": str.isdigit,
+    "hour": str.isdigit,
+    "minute": str.isdigit,
+    "second": str.isdigit,
+    "month_name": lambda text: text.lower() in MONTH_NUMBERS,
+    "sep": lambda text: text in SEPARATORS,
+    "ordinal": lambda text: ORDINAL.match(text) is not None,
+}
+# marks a span whose roles do not settle the date
+_FREE_FORM = object()
+
+
+class StructuralDateNormalizer(DateNormalizer):
     """
-    Try strict time parsing first, then fallback to dateparser.
-    Return a datetime or None.
+    Dates built from the matched tokens rather than by re-parsing the text.
+
+    Each ``date_patterns`` entry has its roles in ``date_roles``. The span
+    is matched against the individual patterns again, the tokens are
+    assigned their roles, and the date is built from them: month names are
+    looked up, two-digit years below ``YEAR_PIVOT`` are 20xx and the rest
+    19xx, numeric day and month are read in ``date_order`` (``DMY`` or
+    ``MDY``), a missing day is the 1st and a missing year the current one.
+    An impossible date (31/02/2024, or 03/25/2024 under ``DMY``) is left
+    unnormalised, as dateparser leaves it.
+
+    dateparser is only called when the roles do not settle the date: when
+    two patterns read the span differently ("Sep-12" is the 12th of
+    September or September 2012), a numeric month comes with a two-digit
+    year ("4-11" may be a day and month), or a year has neither two nor
+    four digits.
+
+    Where dateparser misreads a pattern, the roles win: "3/2020" is
+    2020-03-01, not the 3rd of October 2020, and "Jan '20" is 2020-01-01,
+    not the 20th of January this year.
     """
-    for fmt in TIME_FORMATS:
+    NAME = "date"
+    YEAR_PIVOT = 69
+
+    def __init__(
+            self,
+            nlp,
+            cache: Optional[ParseCache] = None,
+            locales: Optional[Sequence[str]] = None,
+            date_order: str = "DMY",
+        ):
+        if date_order not in ("DMY", "MDY"):
+            raise ValueError(f"date_order must be 'DMY' or 'MDY', not {date_order!r}")
+        super().__init__(nlp, cache=cache, locales=locales, date_order=date_order)
+        self.date_order = date_order
+        self._namespace = f"structural_{self.NAME}|{sorted(self.settings.items())}|{self.locales}"
+        self.role_matcher = Matcher(nlp.vocab)
+        self._roles = {}
+        for i, (pattern, roles) in enumerate(zip(date_patterns, date_roles)):
+            key = f"{self.NAME}_roles_{i}"
+            self.role_matcher.add(key, [pattern])
+            self._roles[nlp.vocab.strings[key]] = roles
+
+    def assign(self, roles, span) -> Optional[Dict[str, str]]:
+        """
+        Token text for each role, or None if the tokens do not fit the roles,
+        a role other than a separator is filled twice, or an apostrophe is
+        followed by anything but a year ("Jan '20").
+        """
+        fields = {}
+        i = 0
+        for role in roles:
+            optional = role.endswith("?")
+            role = role.rstrip("?")
+            if i < len(span) and ROLE_TOKENS[role](span[i].text):
+                if role in fields and role not in ("sep", "ordinal"):
+                    return None
+                if i and span[i - 1].text == "'" and role != "year":
+                    return None
+                fields[role] = span[i].text
+                i += 1
+            elif not optional:
+                return None
+        return fields if i == len(span) else None
+
+    def build(self, fields: Dict[str, str]):
+        """
+        ``YYYY-MM-DD`` from the role fields, None for an impossible date, or
+        ``_FREE_FORM`` if the fields do not settle the date.
+        """
+        day = fields.get("day")
+        year = fields.get("year")
+        if "month_name" in fields:
+            month = MONTH_NUMBERS[fields["month_name"].lower()]
+        else:
+            if day is not None and len(day) == 4:
+                day, year = year, day
+            elif day is not None and self.date_order == "MDY":
+                day, fields["month"] = fields["month"], day
+            month = int(fields["month"])
+            if day is None and year is not None and len(year) == 2:
+                return _FREE_FORM
+        if year is None:
+            year_number = date.today().year
+        elif len(year) == 4:
+            year_number = int(year)
+        elif len(year) == 2:
+            year_number = int(year) + (2000 if int(year) < self.YEAR_PIVOT else 1900)
+        else:
+            return _FREE_FORM
         try:
-            return datetime.strptime(text, fmt)
-        except ValueError:
-            pass
-    
-    # fallback: let dateparser guess time
-    dt = dateparser.parse(
-        text,
-        settings={
-            "PREFER_DATES_FROM": "future",
-            "TIMEZONE": "UTC",
-            "RETURN_AS_TIMEZONE_AWARE": False
-        },
+            return date(year_number, month, int(day) if day else 1).isoformat()
+        except (ValueError, OverflowError):
+            return None
+
+    def parse_span(self, span) -> Optional[str]:
+        results = set()
+        for key, start, end in self.role_matcher(span):
+            if start != 0 or end != len(span):
+                continue
+            fields = self.assign(self._roles[key], span)
+            if fields is not None:
+                results.add(self.build(fields))
+        if len(results) == 1 and _FREE_FORM not in results:
+            return results.pop()
+        return self.parse(span.text)
+
+
+HOUR_WORDS = {
+    word: hour for hour, word in enumerate(
+        ["one", "two", "three", "four", "five", "six",
+         "seven", "eight", "nine", "ten", "eleven", "twelve"],
+        start=1,
+    )
+}
+
+# every form the time patterns match, in one pass:
+#   07:30, 7:30:15, 7:30pm, 7.30 p.m., 7pm, seven pm, 1330 hrs, 730pm, 7 o'clock
+TIME_GRAMMAR = re.compile(
+    r"""
+    \s*
+    (?:
+        (?P<hour>\d{1,2}|""" + "|".join(HOUR_WORDS) + r""")
+        (?:\s*(?P<sep>[:.])\s*(?P<minute>\d\d)(?:\s*:\s*(?P<second>\d\d))?)?
+      | (?P<compact>\d{3,4})
     )
-    return dt
+    \s*
+    (?:
+        (?P<meridiem>[ap])\.?\s?m\.?
+      | (?P<oclock>o'?clock)
+      | (?P<hrs>hrs?)
+    )?
+    \s*
+    """,
+    re.IGNORECASE | re.VERBOSE,
+)
+
+def parse_time_parts(text: str):
+    """
+    (hour, minute, second) on the 24 hour clock, or None if ``text`` is
+    not a time of day.
+
+    A bare hour with ``hrs`` ("8 hrs") is a duration, not a time, and
+    ``o'clock`` is taken as written ("7 o'clock" -> 07:00).
+    """
+    m = TIME_GRAMMAR.fullmatch(text)
+    if m is None:
+        return None
+    meridiem = m["meridiem"]
+    if m["compact"] is not None:
+        if m["oclock"]:
+            return None
+        hour, minute, second = int(m["compact"][:-2]), int(m["compact"][-2:]), 0
+    else:
+        word = m["hour"].lower()
+        hour = HOUR_WORDS[word] if word in HOUR_WORDS else int(word)
+        if m["minute"] is None:
+            if not (meridiem or m["oclock"]):
+                return None
+            minute = second = 0
+        else:
+            if m["sep"] == "." and not (meridiem or m["hrs"]):
+                return None  # a decimal, not a time
+            minute, second = int(m["minute"]), int(m["second"] or 0)
+        if word in HOUR_WORDS and not (meridiem or m["oclock"]):
+            return None
+    if m["oclock"] and not 1 <= hour <= 12:
+        return None
+    if meridiem:
+        if not 1 <= hour <= 12:
+            return None
+        hour = hour % 12 + (12 if meridiem.lower() == "p" else 0)
+    if hour > 23 or minute > 59 or second > 59:
+        return None
+    return hour, minute, second
+
+def parse_single_time(text: str):
+    """
+    Parse a time of day with ``TIME_GRAMMAR``.
+    Return a datetime (on 1900-01-01, as ``strptime``) or None.
+    """
+    parts = parse_time_parts(text)
+    if parts is None:
+        return None
+    return datetime(1900, 1, 1, *parts)
 
 def normalize_time(text: str):
     """
     Convert text to canonical HH:MM (24h).
     Return None if failed.
     """
-    dt = parse_single_time(text)
-    if not dt:
+    parts = parse_time_parts(text)
+    if parts is None:
         return None
-    return dt.strftime("%H:%M")
+    return f"{parts[0]:02d}:{parts[1]:02d}"
 
 class TimeNormalizer(BaseNormalizer):
+    """
+    Times of day, normalised to ``HH:MM`` by ``normalize_time``.
+    """
     NAME = "time"
     EXTENSIONS = ["value"]   
 
@@ -435,32 +621,206 @@ class RangeNormalizer(BaseNormalizer):
         )
 
 
+# the built-in normalisers in the order they run; each one only sees the
+# tokens left by the ones before it
+NORMALIZERS = {
+    "date": DateNormalizer,
+    "time": TimeNormalizer,
+    "unit_norm": UnitNormalizer,
+    "range": RangeNormalizer,
+    "bullet": BulletNormalizer,
+}
+
+
 class ClinicalNormalizer:
-    def __init__(self, nlp):
-        self.normalizers = [
-            DateNormalizer(nlp),
-            DecimalNormalizer(nlp),
-            SciNotNormalizer(nlp),
-            TimeNormalizer(nlp),
-            UnitNormalizer(nlp),
-            RangeNormalizer(nlp),
-            BulletNormalizer(nlp),
+    """
+    Runs the normalisers in order and collects the normalised tokens into
+    span groups by ``_.kind``.
+
+    Decimals and scientific notation are single tokens with their kind and
+    value from the tokenizer (see ``CaVaTokenizer``), so they are grouped
+    without a normaliser of their own.
+
+    With ``fused=True`` the patterns of all normalisers are matched in one
+    ``Matcher`` pass and all spans are merged in one ``retokenize``. The
+    normalisers keep their priority: a match is dropped if it overlaps a
+    span kept for an earlier normaliser, and the rest are filtered for
+    overlaps as before. The span groups are built from the kinds written
+    to the merged heads and by the tokenizer, not by scanning every token.
+
+    The one difference from the sequential mode is that a pattern element
+    never matches a token merged by an earlier normaliser: "5kg." at the
+    start of a sentence is a unit followed by a full stop, where the
+    sequential mode goes on to match the merged "5kg" as a bullet
+    enumerator.
+
+    The date normaliser looks its parses up in ``parse_cache`` (see
+    ``ParseCache``), and restricts dateparser to ``locales``. With
+    ``structural_dates=True`` dates are built from the roles of the matched
+    tokens (see ``StructuralDateNormalizer``); ``date_order`` applies to
+    both date normalisers.
+
+    With ``norm_index=True`` the normalised tokens are recorded once in
+    ``doc._.norm_index`` (see ``NormIndex``) instead of as span groups,
+    which ``NormIndex.span_group`` builds on demand.
+
+    With ``merge=False`` nothing is retokenized. The spans are chosen as in
+    the fused mode, their attributes are written to the span and to its
+    first token, and the spans of several tokens are marked (see
+    ``annotate_span``) so that an ``AnnotationMatcher``, which the rule
+    engines use, matches each of them as one token. The span groups hold
+    the whole spans. ``doc._.norm_annotated`` is set on the doc.
+
+    ``normalizers`` names the normalisers to run (see ``NORMALIZERS``),
+    all of them by default. The extensions of the others are still
+    registered, so components that read them see their defaults.
+    ``cava_nlp.pipeline.prune_normalizers`` picks the names from what the
+    later components consume.
+    """
+    def __init__(
+            self,
+            nlp,
+            fused: bool = False,
+            parse_cache: Optional[ParseCache] = None,
+            locales: Optional[Sequence[str]] = ("en-AU",),
+            structural_dates: bool = False,
+            date_order: str = "DMY",
+            norm_index: bool = False,
+            normalizers: Optional[Sequence[str]] = None,
+            merge: bool = True,
+        ):
+        if not merge and norm_index:
+            raise ValueError("norm_index records single tokens and needs merge=True")
+        if normalizers is None:
+            normalizers = list(NORMALIZERS)
+        unknown = set(normalizers) - set(NORMALIZERS)
+        if unknown:
+            raise ValueError(
+                f"Unknown normalizers: {sorted(unknown)}. Available: {list(NORMALIZERS)}"
+            )
+        self.norm_index = norm_index
+        self.parse_cache = parse_cache if parse_cache is not None else ParseCache()
+        self.normalizers = []
+        for name, normalizer in NORMALIZERS.items():
+            if name not in normalizers:
+                normalizer.register_extensions()
+            elif name == "date":
+                date_normalizer = StructuralDateNormalizer if structural_dates else DateNormalizer
+                self.normalizers.append(date_normalizer(
+                    nlp, cache=self.parse_cache, locales=locales, date_order=date_order,
+                ))
+            else:
+                self.normalizers.append(normalizer(nlp))
+        self.fused = fused
+        self.merge = merge
+        self.fused_matcher = Matcher(nlp.vocab)
+        # matcher key -> (priority, skip)
+        self._fused_keys = {}
+        for priority, norm in enumerate(self.normalizers):
+            for n, (patterns, skip) in enumerate(norm.pattern_sets()):
+                key = f"{norm.NAME}_{n}"
+                self.fused_matcher.add(key, patterns)
+                self._fused_keys[nlp.vocab.strings[key]] = (priority, skip)
+
+    def normalised_tokens(self, doc):
+        """``(token index, kind)`` of every token with a ``_.kind``."""
+        return [(token.i, token._.kind) for token in doc if token._.kind]
+
+    def create_span_groups(self, doc, found=None):
+        if found is None:
+            found = self.normalised_tokens(doc)
+        groups = {}
+        for i, label in found:
+            sp = Span(doc, i, i+1, label=label)
+            groups.setdefault(label, []).append(sp)
+        for label, spans in groups.items():
+            doc.spans[label] = SpanGroup(doc, spans=spans)
+
+    def fused_spans(self, doc):
+        """
+        Spans to merge for each normaliser, in normaliser order, from one
+        pass of the fused matcher.
+        """
+        candidates = [[] for _ in self.normalizers]
+        for key, start, end in self.fused_matcher(doc):
+            priority, skip = self._fused_keys[key]
+            candidates[priority].append(doc[start + skip:end])
+
+        taken = bytearray(len(doc))
+        selected = []
+        for spans in candidates:
+            kept = filter_spans([
+                span for span in spans
+                if not any(taken[span.start:span.end])
+            ])
+            for span in kept:
+                taken[span.start:span.end] = b"\x01" * len(span)
+            selected.append(kept)
+        return selected
+
+    def normalised_tokens_from_kinds(self, doc):
+        """
+        Same as ``normalised_tokens``, found from the ``kind`` values in
+        ``doc.user_data`` rather than by visiting every token. Values left
+        behind at offsets that are no longer a token start (the tail of a
+        merged span) are skipped.
+        """
+        found = []
+        for key, label in doc.user_data.items():
+            if not label or key[:2] != ("._.", "kind") or key[3] is not None:
+                continue
+            offset = key[2]
+            span = doc.char_span(offset, offset + 1, alignment_mode="expand")
+            if span is None or span[0].idx != offset:
+                continue
+            found.append((span.start, label))
+        found.sort()
+        return found
+
+    def collect(self, doc, found):
+        """Record the normalised tokens as the index or as span groups."""
+        if self.norm_index:
+            doc._.norm_index = build_norm_index(doc, found)
+        else:
+            self.create_span_groups(doc, found)
+
+    def apply_fused(self, doc):
+        selected = self.fused_spans(doc)
+        results = [
+            [(span, norm.compute(span)) for span in spans]
+            for norm, spans in zip(self.normalizers, selected)
         ]
+        if any(results):
+            with doc.retokenize() as retok:
+                for norm, merges in zip(self.normalizers, results):
+                    for span, res in merges:
+                        norm.merge(retok, span, res)
+        self.collect(doc, self.normalised_tokens_from_kinds(doc))
+        return doc
 
-    def create_span_groups(self, doc):
+    def apply_annotated(self, doc):
+        selected = self.fused_spans(doc)
+        ends = {}
+        for norm, spans in zip(self.normalizers, selected):
+            for span in spans:
+                norm.annotate(span, norm.compute(span))
+                ends[span.start] = span.end
+        doc._.norm_annotated = True
         groups = {}
-        for token in doc:
-            if token._.kind:
-                label = token._.kind
-                sp = Span(doc, token.i, token.i+1, label=label)
-                groups.setdefault(label, []).append(sp)
+        for i, label in self.normalised_tokens_from_kinds(doc):
+            # the tail of a span keeps any kind the tokenizer gave it
+            if doc[i]._.norm_part != "inside":
+                groups.setdefault(label, []).append(Span(doc, i, ends.get(i, i + 1), label=label))
         for label, spans in groups.items():
             doc.spans[label] = SpanGroup(doc, spans=spans)
+        return doc
 
     def __call__(self, doc):
+        if not self.merge:
+            return self.apply_annotated(doc)
+        if self.fused:
+            return self.apply_fused(doc)
         for norm in self.normalizers:
             doc = norm.apply(doc)
-        self.create_span_groups(doc)
+        self.collect(doc, self.normalised_tokens(doc))
         return doc
-
-
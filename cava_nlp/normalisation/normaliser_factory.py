@@ -1,6 +1,54 @@
+from typing import Optional
+
 from spacy.language import Language
 from .normaliser import ClinicalNormalizer
+from .parse_cache import ParseCache
 
-@Language.factory("clinical_normalizer")
-def create_clinical_normalizer(nlp, name):
-    return ClinicalNormalizer(nlp)
+@Language.factory(
+    "clinical_normalizer",
+    default_config={
+        "fused": False,
+        "parse_cache_size": 65536,
+        "parse_cache_dir": None,
+        "locales": ["en-AU"],
+        "structural_dates": False,
+        "date_order": "DMY",
+        "norm_index": False,
+        "normalizers": None,
+        "force_normalizers": [],
+        "merge": True,
+    },
+)
+def create_clinical_normalizer(
+        nlp,
+        name,
+        fused: bool,
+        parse_cache_size: int,
+        parse_cache_dir: Optional[str],
+        locales: Optional[list[str]],
+        structural_dates: bool,
+        date_order: str,
+        norm_index: bool,
+        normalizers: Optional[list[str]],
+        force_normalizers: list[str],
+        merge: bool,
+    ):
+    """
+    ``normalizers`` limits the normalisers run (None runs all of them);
+    ``force_normalizers`` are run whatever ``normalizers`` says, and are
+    kept by ``cava_nlp.pipeline.prune_normalizers``. ``merge=False``
+    annotates the normalised spans instead of merging them.
+    """
+    if normalizers is not None:
+        normalizers = [*normalizers, *force_normalizers]
+    return ClinicalNormalizer(
+        nlp,
+        fused=fused,
+        parse_cache=ParseCache(max_entries=parse_cache_size, directory=parse_cache_dir),
+        locales=locales,
+        structural_dates=structural_dates,
+        date_order=date_order,
+        norm_index=norm_index,
+        normalizers=normalizers,
+        merge=merge,
+    )
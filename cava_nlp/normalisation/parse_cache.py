@@ -0,0 +1,136 @@
+import hashlib
+import os
+import tempfile
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Optional, Union
+
+_MISSING = object()
+
+
+class ParseCache:
+    """
+    Memoises the canonical strings produced by the date parsers.
+
+    The same date strings recur across a corpus, and a ``dateparser`` call
+    costs a few milliseconds, so ``DateNormalizer`` looks each matched text
+    up here first. Entries are keyed by a namespace, which carries the
+    parser and its settings, plus the matched text. A failed parse is
+    cached too, as ``None``.
+
+    Parameters
+    ----------
+    max_entries : int
+        Size of the in-memory LRU tier. 0 disables it.
+    directory : str or Path, optional
+        Directory for the on-disk tier, shared by every process and run
+        that points at it. Each entry is one small text file, written
+        with write-then-rename so concurrent readers never see a partial
+        entry.
+
+    Attributes
+    ----------
+    hits, disk_hits, misses : int
+        Lookups answered from memory, from disk, and by running the parser.
+    """
+
+    def __init__(
+            self,
+            max_entries: int = 65536,
+            directory: Optional[Union[str, Path]] = None,
+        ):
+        if max_entries < 0:
+            raise ValueError("max_entries must be >= 0")
+        self.max_entries = max_entries
+        self.directory = Path(directory) if directory is not None else None
+        self._memory: "OrderedDict[tuple[str, str], Optional[str]]" = OrderedDict()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    def _path(self, namespace: str, text: str) -> Path:
+        assert self.directory is not None
+        h = hashlib.sha256(namespace.encode())
+        h.update(b"\0")
+        h.update(text.encode("utf-8", "surrogatepass"))
+        key = h.hexdigest()
+        return self.directory / key[:2] / key
+
+    def get(self, namespace: str, text: str) -> object:
+        """
+        The cached value, which may be ``None``, or ``_MISSING``.
+        """
+        key = (namespace, text)
+        value = self._memory.get(key, _MISSING)
+        if value is not _MISSING:
+            self._memory.move_to_end(key)
+            self.hits += 1
+            return value
+        if self.directory is not None:
+            try:
+                data = self._path(namespace, text).read_text(encoding="utf-8")
+            except FileNotFoundError:
+                return _MISSING
+            self.disk_hits += 1
+            value = data or None
+            self._remember(key, value)
+            return value
+        return _MISSING
+
+    def put(self, namespace: str, text: str, value: Optional[str]) -> None:
+        self._remember((namespace, text), value)
+        if self.directory is not None:
+            path = self._path(namespace, text)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=path.parent)
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(value or "")
+            os.replace(tmp, path)
+
+    def _remember(self, key: tuple[str, str], value: Optional[str]) -> None:
+        if not self.max_entries:
+            return
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def lookup(
+            self,
+            namespace: str,
+            text: str,
+            parse: Callable[[str], Optional[str]],
+        ) -> Optional[str]:
+        """
+        The cached result for ``text`` in ``namespace``, running and
+        caching ``parse(text)`` on a miss.
+        """
+        value = self.get(namespace, text)
+        if value is not _MISSING:
+            return value  # type: ignore[return-value]
+        self.misses += 1
+        result = parse(text)
+        self.put(namespace, text, result)
+        return result
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.disk_hits + self.misses
+        return (self.hits + self.disk_hits) / lookups if lookups else 0.0
+
+    def stats(self) -> dict[str, float]:
+        return {
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "entries": len(self._memory),
+            "hit_rate": self.hit_rate,
+        }
+
+    def clear(self) -> None:
+        """
+        Empty the in-memory tier and reset the counters. The on-disk tier
+        is left untouched.
+        """
+        self._memory.clear()
+        self.hits = self.disk_hits = self.misses = 0
@@ -0,0 +1,18 @@
+from .budget import ComponentTimeout, TimeBudget
+from .columns import extract_columns
+from .presets import short_text_pipeline
+from .pruning import consumed_normalizers, prune_normalizers
+from .selection import ComponentPlan, plan_components
+from .triage import KeywordTriage
+
+__all__ = [
+    "ComponentPlan",
+    "ComponentTimeout",
+    "KeywordTriage",
+    "TimeBudget",
+    "consumed_normalizers",
+    "extract_columns",
+    "plan_components",
+    "prune_normalizers",
+    "short_text_pipeline",
+]
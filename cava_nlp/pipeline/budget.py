@@ -0,0 +1,170 @@
+import signal
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from typing import Any, Iterable, Iterator, Mapping, Optional, Union
+
+from spacy.tokens import Doc
+
+from ..caching.serialise import doc_from_state, doc_state
+from ..language import CaVaLang
+
+# names of the components abandoned for a doc; empty if it ran in full
+Doc.set_extension("degraded", default=(), force=True)
+
+
+class ComponentTimeout(BaseException):
+    """
+    Raised inside a component that has used up its time budget. Like
+    ``KeyboardInterrupt``, it is not an ``Exception``, so that broad
+    ``except Exception`` handlers in components (dateparser has several)
+    do not swallow it.
+    """
+
+
+def _raise_timeout(signum: int, frame: Any) -> None:
+    raise ComponentTimeout()
+
+
+@contextmanager
+def _alarm(seconds: float) -> Iterator[None]:
+    """
+    Interrupt the block with ``ComponentTimeout`` after ``seconds``. Only
+    possible in the main thread on platforms with ``setitimer``; elsewhere
+    the block runs to completion and the caller checks the elapsed time.
+    """
+    if not hasattr(signal, "setitimer") or threading.current_thread() is not threading.main_thread():
+        yield
+        return
+    previous = signal.signal(signal.SIGALRM, _raise_timeout)
+    signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        yield
+    finally:
+        try:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+        finally:
+            # also reached if the alarm fires on the way out
+            signal.signal(signal.SIGALRM, previous)
+
+
+class TimeBudget:
+    """
+    Run a pipeline with per-document and per-component time limits.
+
+    A component that runs over its limit is abandoned for that document:
+    the doc is restored to its state before the component, the component's
+    name is added to ``doc._.degraded`` and processing continues with the
+    next component. Once the document budget is spent, the remaining
+    components are skipped and recorded the same way.
+
+    In the main thread on Unix, an over-running component is interrupted
+    with ``SIGALRM``. The signal is handled between Python bytecodes, so a
+    long call into C code (a regex, the spaCy matcher) finishes first.
+    Elsewhere the component runs to completion and its result is discarded.
+
+    Each limited component costs a snapshot of the doc, roughly 12% on
+    20-line notes with every component limited. Limiting only the
+    components known to misbehave, with a mapping and no ``per_doc``,
+    keeps the others snapshot-free.
+
+    Attributes
+    ----------
+    timeouts : Counter[str]
+        Number of documents each component was abandoned for.
+    degraded_docs : int
+        Number of documents with at least one abandoned component.
+
+    Parameters
+    ----------
+    nlp : CaVaLang
+        The pipeline to run.
+    per_doc : float, optional
+        Seconds allowed for a whole document.
+    per_component : float or Mapping[str, float], optional
+        Seconds allowed for each component, either one limit for all or a
+        limit per component name (components not listed are unlimited).
+    """
+
+    def __init__(
+            self,
+            nlp: CaVaLang,
+            per_doc: Optional[float] = None,
+            per_component: Union[float, Mapping[str, float], None] = None,
+        ):
+        if per_doc is not None and per_doc <= 0:
+            raise ValueError("per_doc must be > 0")
+        limits = per_component.values() if isinstance(per_component, Mapping) else [per_component]
+        if any(limit is not None and limit <= 0 for limit in limits):
+            raise ValueError("per_component limits must be > 0")
+        if isinstance(per_component, Mapping):
+            unknown = set(per_component) - set(nlp.pipe_names)
+            if unknown:
+                raise ValueError(f"Unknown components in per_component: {sorted(unknown)}")
+        self.nlp = nlp
+        self.per_doc = per_doc
+        self.per_component = per_component
+        self.timeouts: Counter[str] = Counter()
+        self.degraded_docs = 0
+
+    def component_limit(self, name: str) -> Optional[float]:
+        if isinstance(self.per_component, Mapping):
+            return self.per_component.get(name)
+        return self.per_component
+
+    def run(self, doc: Doc, outputs: Optional[Iterable[str]] = None) -> Doc:
+        """
+        Run the pipeline, or the components ``outputs`` need, on a tokenized
+        doc within the budget.
+        """
+        if outputs is not None:
+            plan = self.nlp.component_plan(outputs)
+            names, needs_targets = plan.components, plan.needs_targets
+        else:
+            names, needs_targets = tuple(self.nlp.pipe_names), frozenset()
+
+        deadline = None if self.per_doc is None else time.perf_counter() + self.per_doc
+        abandoned: list[str] = []
+        for name in names:
+            if name in needs_targets and not doc.ents:
+                continue
+            limit = self.component_limit(name)
+            if deadline is not None:
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    abandoned.append(name)
+                    continue
+                limit = remaining if limit is None else min(limit, remaining)
+            if limit is None:
+                doc = self.nlp.get_pipe(name)(doc)
+                continue
+
+            snapshot = doc_state(doc)
+            start = time.perf_counter()
+            try:
+                with _alarm(limit):
+                    result = self.nlp.get_pipe(name)(doc)
+                timed_out = time.perf_counter() - start > limit
+            except ComponentTimeout:
+                timed_out = True
+            if timed_out:
+                doc = doc_from_state(self.nlp.vocab, snapshot)
+                abandoned.append(name)
+                self.timeouts[name] += 1
+            else:
+                doc = result
+
+        if abandoned:
+            doc._.degraded = tuple(abandoned)
+            self.degraded_docs += 1
+        return doc
+
+    def __call__(self, text: Union[str, Doc], outputs: Optional[Iterable[str]] = None) -> Doc:
+        if not isinstance(text, Doc):
+            text = self.nlp.make_preprocessed_doc(text)
+        return self.run(text, outputs)
+
+    def pipe(self, texts: Iterable[Union[str, Doc]], outputs: Optional[Iterable[str]] = None) -> Iterator[Doc]:
+        for text in texts:
+            yield self(text, outputs)
@@ -0,0 +1,66 @@
+from typing import Any, Iterable, Optional
+
+from ..language import CaVaLang
+
+
+def extract_columns(
+        nlp: CaVaLang,
+        values: Iterable[Any],
+        engines: Optional[Iterable[str]] = None,
+    ) -> dict[str, list[Any]]:
+    """
+    Extract one value column per rule engine from a column of strings,
+    e.g. a "Weight" or "Performance status" EHR field.
+
+    Identical inputs are processed once: the unique strings are batched
+    through the pipeline, restricted to the requested engines, and the
+    results are scattered back in input order. For a low-cardinality
+    column this turns one pipeline call per row into one per distinct
+    value.
+
+    Parameters
+    ----------
+    nlp : CaVaLang
+        Pipeline holding the rule engines, e.g. ``short_text_pipeline``.
+    values : Iterable
+        The column: a list, a numpy array, a pandas Series, ... Entries that
+        are not strings (None, NaN) give None in every output column.
+    engines : Iterable[str], optional
+        Span labels of the engines to extract (``"ecog"``); all rule
+        engines in the pipeline if None.
+
+    Returns
+    -------
+    dict[str, list]
+        For each engine, the ``_.value`` of its first span in each row, or
+        None where it found nothing.
+    """
+    if engines is None:
+        engines = [
+            label for label in (
+                getattr(nlp.get_pipe(name), "span_label", None) for name in nlp.pipe_names
+            )
+            if label
+        ]
+    labels = list(dict.fromkeys(engines))
+    if not labels:
+        raise ValueError("extract_columns needs at least one rule engine")
+
+    # position of each row's value among the unique strings; -1 for non-strings
+    unique: dict[str, int] = {}
+    rows = [
+        unique.setdefault(value, len(unique)) if isinstance(value, str) else -1
+        for value in values
+    ]
+
+    extracted: list[tuple[Any, ...]] = []
+    for doc in nlp.pipe(unique, outputs=labels):
+        extracted.append(tuple(
+            doc.spans[label][0]._.value if doc.spans.get(label) else None
+            for label in labels
+        ))
+
+    return {
+        label: [extracted[row][i] if row >= 0 else None for row in rows]
+        for i, label in enumerate(labels)
+    }
@@ -0,0 +1,44 @@
+from pathlib import Path
+from typing import Any, Iterable, Optional, Union
+
+from ..language import CaVaLang
+from ..rule_engine.rule_engine_factory import create_rule_engine # type: ignore
+
+
+def short_text_pipeline(
+        engines: Iterable[Union[str, tuple[str, Union[str, Path]]]],
+        engine_config_path: Optional[Union[str, Path]] = None,
+        **kwargs: Any,
+    ) -> CaVaLang:
+    """
+    Pipeline tuned for short structured fields: weights, ECOG scores, lab
+    comments.
+
+    Each input is one sentence (no segmentation), and only the tokenizer,
+    the normaliser and the given rule engines run; there is no document
+    layout or ConText.
+
+    Parameters
+    ----------
+    engines : Iterable[str | tuple[str, str | Path]]
+        Rule engine components to add, by ``component_name`` in
+        ``engine_config_path``, or as ``(component_name, config_path)``.
+        Each is added under its component name.
+    engine_config_path : str or Path, optional
+        Engine config for engines given by name; the default config if None.
+    **kwargs
+        Passed to ``CaVaLang``, e.g. ``masks``.
+    """
+    nlp = CaVaLang(sentencizer="single", **kwargs)
+    nlp.add_pipe("clinical_normalizer")
+    for engine in engines:
+        name, path = (engine, engine_config_path) if isinstance(engine, str) else engine
+        nlp.add_pipe(
+            "rule_engine",
+            name=name,
+            config={
+                "engine_config_path": None if path is None else str(path),
+                "component_name": name,
+            },
+        )
+    return nlp
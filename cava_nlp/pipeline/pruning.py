@@ -0,0 +1,216 @@
+import re
+from typing import Any, Iterable, Iterator, Optional
+
+from spacy.language import Language
+from spacy.vocab import Vocab
+
+from ..namespaces.regex import date_patterns
+from ..normalisation.normaliser import NORMALIZERS
+
+# the normalisers that merge numbers, and so shape every pattern that reads
+# numbers or the tokens around them
+NUMBER_NORMALIZERS = frozenset(("date", "time", "unit_norm", "range"))
+# extensions also written by the tokenizer (``kind`` and ``value`` of
+# decimals and scientific notation) are not traced to a single normaliser
+SHARED_EXTENSIONS = {"kind", "value"}
+# token extension -> the normaliser that writes it
+EXTENSION_SOURCES = {
+    ext: name
+    for name, normalizer in NORMALIZERS.items()
+    for ext in (name, *normalizer.EXTENSIONS)
+    if ext not in SHARED_EXTENSIONS
+}
+# factories that read normaliser output other than through rule patterns
+FACTORY_CONSUMERS = {
+    "document_layout": frozenset(("bullet",)),
+    "resolve_closest_context": frozenset(("bullet",)),
+}
+# factories that read no normaliser output
+NON_CONSUMERS = {"medspacy_pysbd", "clinical_sentencizer", "single_sentence"}
+# token attributes matched against literal values
+LITERAL_ATTRS = ("ORTH", "TEXT", "LOWER")
+# pattern keys that narrow a literal token without selecting other tokens
+NARROWING_KEYS = {"OP", "IS_SENT_START", "SPACY"}
+
+
+def normalizer_patterns(name: str) -> list[list[dict[str, Any]]]:
+    """
+    The token patterns of the ``name`` normaliser, covering only the
+    tokens it merges.
+    """
+    if name == "date":
+        return date_patterns
+    return NORMALIZERS[name].PATTERNS
+
+
+def accepts(spec: dict[str, Any], word: str, vocab: Vocab) -> bool:
+    """
+    Whether a token with text ``word`` may match pattern token ``spec``.
+    Case is ignored and unknown attributes accept anything, so this errs
+    towards True.
+    """
+    lexeme = vocab[word]
+    for attr, value in spec.items():
+        if attr == "LIKE_NUM":
+            ok = lexeme.like_num == bool(value)
+        elif attr == "IS_DIGIT":
+            ok = lexeme.is_digit == bool(value)
+        elif attr in LITERAL_ATTRS and isinstance(value, str):
+            ok = value.lower() == word.lower()
+        elif attr in LITERAL_ATTRS and isinstance(value, dict) and "IN" in value:
+            ok = word.lower() in {str(v).lower() for v in value["IN"]}
+        elif attr in LITERAL_ATTRS and isinstance(value, dict) and "REGEX" in value:
+            ok = re.search(value["REGEX"], word, re.IGNORECASE) is not None
+        else:
+            ok = True
+        if not ok:
+            return False
+    return True
+
+
+def token_literals(token: dict[str, Any]) -> Optional[frozenset[str]]:
+    """
+    The texts pattern token ``token`` is limited to, or None if it is not
+    limited to literal values.
+    """
+    for attr in LITERAL_ATTRS:
+        value = token.get(attr)
+        if isinstance(value, dict):
+            value = value.get("IN") if set(value) == {"IN"} else None
+        if isinstance(value, str):
+            value = [value]
+        if value:
+            return frozenset(str(v) for v in value)
+    return None
+
+
+def extension_consumers(underscore: dict[str, Any]) -> tuple[frozenset[str], bool]:
+    """
+    Normalisers whose output a ``"_"`` pattern predicate reads, and
+    whether the predicate only matches tokens they wrote.
+    """
+    names: set[str] = set()
+    selective = False
+    for ext, value in underscore.items():
+        if ext in EXTENSION_SOURCES:
+            names.add(EXTENSION_SOURCES[ext])
+            selective |= value is not False and value is not None
+        elif ext == "kind":
+            if isinstance(value, dict):
+                kinds = [k for v in value.values() if isinstance(v, list) for k in v]
+                selective |= set(value) == {"IN"} and all(k in NORMALIZERS for k in kinds)
+            else:
+                kinds = [value]
+                selective |= value in NORMALIZERS
+            names.update(k for k in kinds if k in NORMALIZERS)
+    return frozenset(names), selective
+
+
+def token_consumers(token: dict[str, Any], vocab: Vocab) -> frozenset[str]:
+    """
+    Normalisers whose output pattern token ``token`` may depend on: those
+    that write an extension it reads, and, unless it only matches their
+    merged tokens or a set of literal values, every normaliser that merges
+    numbers, as it may match a token they would merge away. A literal only
+    depends on the number normalisers with a pattern token it could match.
+    """
+    names, selective = extension_consumers(token.get("_") or {})
+    names = set(names)
+    literals = token_literals(token)
+    if literals is not None:
+        names.update(
+            name for name in NUMBER_NORMALIZERS
+            if any(
+                accepts(spec, word, vocab)
+                for word in literals
+                for pattern in normalizer_patterns(name)
+                for spec in pattern
+            )
+        )
+    elif not selective or set(token) - NARROWING_KEYS != {"_"}:
+        names.update(NUMBER_NORMALIZERS)
+    return frozenset(names)
+
+
+def _rule_engine_patterns(component: Any) -> Iterator[list[dict[str, Any]]]:
+    for pat in component.cfg.patterns.values():
+        for patterns in (pat.token_patterns, pat.value_patterns, pat.exclusions):
+            yield from patterns or ()
+
+
+def _context_patterns(nlp: Language, component: Any) -> Iterator[list[dict[str, Any]]]:
+    for rule in component.rules:
+        if rule.max_scope is not None:
+            # a scope counted in tokens depends on every merge
+            yield [{}]
+        if isinstance(rule.pattern, list):
+            yield rule.pattern
+        elif isinstance(rule.pattern, str):
+            yield [{"TEXT": {"REGEX": rule.pattern}}]
+        else:
+            yield [{"LOWER": t.lower_} for t in nlp.make_doc(rule.literal)]
+
+
+def component_consumers(nlp: Language, name: str) -> frozenset[str]:
+    """
+    Normalisers whose output component ``name`` may depend on. Components
+    of unknown factories depend on all of them.
+    """
+    factory = nlp.get_pipe_meta(name).factory
+    component = nlp.get_pipe(name)
+    if factory in NON_CONSUMERS:
+        return frozenset()
+    if factory in FACTORY_CONSUMERS:
+        return FACTORY_CONSUMERS[factory]
+    if factory == "rule_engine":
+        patterns: Iterable[list[dict[str, Any]]] = _rule_engine_patterns(component)
+    elif factory == "medspacy_context":
+        patterns = _context_patterns(nlp, component)
+    else:
+        return frozenset(NORMALIZERS)
+    return frozenset().union(*(
+        token_consumers(token, nlp.vocab) for pattern in patterns for token in pattern
+    ))
+
+
+def consumed_normalizers(nlp: Language, name: str = "clinical_normalizer") -> frozenset[str]:
+    """
+    Normalisers of the ``name`` component whose output the components
+    after it may depend on.
+    """
+    names = nlp.pipe_names
+    return frozenset().union(*(
+        component_consumers(nlp, later) for later in names[names.index(name) + 1:]
+    ))
+
+
+def prune_normalizers(
+        nlp: Language,
+        name: str = "clinical_normalizer",
+        force: Iterable[str] = (),
+    ) -> tuple[str, ...]:
+    """
+    Rebuild the ``name`` normaliser to run only the normalisers the later
+    components depend on (see ``consumed_normalizers``), plus ``force``
+    and the component's ``force_normalizers``. Every normaliser ahead of
+    a kept one is kept too, as it decides which tokens the kept one sees.
+    Returns the names of the normalisers run.
+
+    Patterns are followed through their literal values, extension
+    predicates and the number normalisers' patterns; a pruned bullet
+    normaliser leaves a sentence-initial "KRAS." as two tokens, which a
+    literal pattern may then match. Force it on where that matters.
+    """
+    unknown = set(force) - set(NORMALIZERS)
+    if unknown:
+        raise ValueError(
+            f"Unknown normalizers: {sorted(unknown)}. Available: {list(NORMALIZERS)}"
+        )
+    config = {k: v for k, v in nlp.get_pipe_config(name).items() if k != "factory"}
+    needed = consumed_normalizers(nlp, name) | set(force) | set(config.get("force_normalizers", ()))
+    order = list(NORMALIZERS)
+    last = max((order.index(n) for n in needed), default=-1)
+    kept = tuple(order[:last + 1])
+    config["normalizers"] = list(kept)
+    nlp.replace_pipe(name, nlp.get_pipe_meta(name).factory, config=config)
+    return kept
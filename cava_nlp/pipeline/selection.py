@@ -0,0 +1,103 @@
+from dataclasses import dataclass
+from typing import Any, Iterable
+
+from spacy.language import Language
+from spacy.tokens import Doc
+
+# factories whose results every output relies on
+SENTENCIZER_FACTORIES = {"medspacy_pysbd", "clinical_sentencizer", "single_sentence"}
+# factories that rewrite tokens (merges, norms, ``_.kind``) for the rule engines
+TOKEN_FACTORIES = {"clinical_normalizer"}
+# factories that work on the entities, i.e. the ConText targets
+CONTEXT_FACTORIES = {"medspacy_context", "resolve_closest_context"}
+# factories only consumed by context resolution
+LAYOUT_FACTORIES = {"document_layout"}
+
+
+def provided_labels(component: Any) -> set[str]:
+    """
+    Span-group names and entity labels written by a component. Rule
+    engines expose them as ``span_label`` and ``entity_label``.
+    """
+    labels = (getattr(component, "span_label", None), getattr(component, "entity_label", None))
+    return {label for label in labels if label}
+
+
+@dataclass(frozen=True)
+class ComponentPlan:
+    """
+    The pipeline components needed for a set of outputs, in pipeline order.
+
+    Attributes
+    ----------
+    components : tuple[str, ...]
+        Names of the components to run.
+    needs_targets : frozenset[str]
+        Components skipped for any doc that has no entities by the time
+        they are reached, as ConText has nothing to work on.
+    """
+    components: tuple[str, ...]
+    needs_targets: frozenset[str]
+
+    def run(self, nlp: Language, doc: Doc) -> Doc:
+        for name in self.components:
+            if name in self.needs_targets and not doc.ents:
+                continue
+            doc = nlp.get_pipe(name)(doc)
+        return doc
+
+
+def plan_components(nlp: Language, outputs: Iterable[str]) -> ComponentPlan:
+    """
+    Work out which components ``outputs`` depend on.
+
+    ``outputs`` are span-group names (``"ecog"``) or entity labels
+    (``"ECOG"``). The plan keeps the sentencizer, the rule engines that
+    produce the outputs, any earlier rule engine that merges tokens, and
+    the normaliser ahead of them. ConText, its resolver and the document
+    layout are kept only when a kept engine produces entities. Components
+    of unknown factories are always kept.
+    """
+    wanted = set(outputs)
+    names = nlp.pipe_names
+    factories = [nlp.get_pipe_meta(name).factory for name in names]
+    components = [nlp.get_pipe(name) for name in names]
+
+    available = set().union(*(provided_labels(c) for c in components))
+    unknown = wanted - available
+    if unknown:
+        raise ValueError(
+            f"Unknown outputs: {sorted(unknown)}. Available: {sorted(available)}"
+        )
+
+    keep = [False] * len(names)
+    # walk backwards, so each engine knows whether a later kept engine
+    # matches over the tokens it merges
+    engine_kept_later = False
+    for i in reversed(range(len(names))):
+        labels = provided_labels(components[i])
+        if labels:
+            merges = bool(getattr(components[i], "merge_ents", False))
+            keep[i] = bool(labels & wanted) or (merges and engine_kept_later)
+            engine_kept_later |= keep[i]
+        elif factories[i] in TOKEN_FACTORIES:
+            keep[i] = engine_kept_later
+
+    with_targets = any(
+        keep[i] and getattr(components[i], "entity_label", None)
+        for i in range(len(names))
+    )
+    for i, factory in enumerate(factories):
+        if factory in SENTENCIZER_FACTORIES:
+            keep[i] = True
+        elif factory in CONTEXT_FACTORIES or factory in LAYOUT_FACTORIES:
+            keep[i] = with_targets
+        elif factory not in TOKEN_FACTORIES and not provided_labels(components[i]):
+            keep[i] = True
+
+    return ComponentPlan(
+        components=tuple(name for name, k in zip(names, keep) if k),
+        needs_targets=frozenset(
+            name for name, factory in zip(names, factories) if factory in CONTEXT_FACTORIES
+        ),
+    )
@@ -0,0 +1,163 @@
+import re
+from typing import Any, Iterable, Iterator, Optional, Pattern
+
+from spacy.tokens import Doc
+
+from ..language import CaVaLang
+from ..tokenization.preprocess import MASK_CHAR
+
+# token attributes whose literal values appear verbatim (up to case) in the
+# raw text of any matching token
+LITERAL_ATTRS = ("ORTH", "TEXT", "LOWER")
+# operators under which a pattern token must be present
+REQUIRED_OPS = (None, "1", "+")
+
+
+def token_literals(token: dict[str, Any]) -> Optional[frozenset[str]]:
+    """
+    Lower-cased literal alternatives one pattern token requires in the text,
+    or None if it does not require any (optional, negated, regex, ...).
+    """
+    if token.get("OP") not in REQUIRED_OPS:
+        return None
+    for attr in LITERAL_ATTRS:
+        value = token.get(attr)
+        if isinstance(value, dict):
+            value = value.get("IN") if set(value) == {"IN"} else None
+        if isinstance(value, str):
+            value = [value]
+        if not value:
+            continue
+        literals = frozenset(str(v).lower() for v in value)
+        # whitespace is condensed and mask characters are written by
+        # preprocessing, so neither can be looked for in the raw text
+        if all(lit.strip(MASK_CHAR) and not any(c.isspace() for c in lit) for lit in literals):
+            return literals
+    return None
+
+
+def pattern_anchors(pattern: list[dict[str, Any]]) -> Optional[frozenset[str]]:
+    """
+    The most selective set of literals (longest shortest alternative) that
+    every match of ``pattern`` contains, or None if there is none.
+    """
+    candidates = [lits for lits in map(token_literals, pattern) if lits]
+    if not candidates:
+        return None
+    return max(candidates, key=lambda lits: min(map(len, lits)))
+
+
+def compile_trie(words: Iterable[str]) -> Pattern[str]:
+    """
+    Compile literals into a regex shaped like their prefix trie, so each
+    position is tested against all of them in one pass, longest first.
+    """
+    trie: dict[str, Any] = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def _render(node: dict[str, Any]) -> str:
+        branches = [re.escape(char) + _render(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        return f"(?:{body})?" if "" in node else body
+
+    # zero-width, so anchors overlapping a previous match are still seen
+    return re.compile(f"(?=({_render(trie)}))")
+
+
+class KeywordTriage:
+    """
+    Raw-text prefilter that runs only the rule engines a note can match.
+
+    Each rule engine's token patterns are reduced to anchor literals that
+    any match must contain (``"ecog"``, ``"kras"``, ``"pgsga"``, ...), and
+    all anchors are compiled into one trie-shaped regex. A single
+    case-insensitive scan of the raw text finds the engines whose anchors
+    occur. The note is then run with ``outputs`` set to those engines, so
+    the components they do not need are skipped. A note with no anchors at
+    all is only preprocessed and tokenized.
+
+    Engines with a pattern that has no literal anchor (e.g. only
+    ``LIKE_NUM`` or regex tokens) are always run.
+
+    Attributes
+    ----------
+    docs, chars : int
+        Documents and characters seen.
+    skipped_docs, skipped_chars : int
+        Documents and characters that were not run through the pipeline.
+
+    Parameters
+    ----------
+    nlp : CaVaLang
+        Pipeline holding the rule engines.
+    """
+
+    def __init__(self, nlp: CaVaLang):
+        self.nlp = nlp
+        # anchor -> span labels of the engines it triggers
+        self.anchors: dict[str, set[str]] = {}
+        self.always: set[str] = set()
+        for name in nlp.pipe_names:
+            component = nlp.get_pipe(name)
+            cfg = getattr(component, "cfg", None)
+            label = getattr(component, "span_label", None)
+            if label is None or cfg is None:
+                continue
+            anchors = [
+                pattern_anchors(p)
+                for pat in cfg.patterns.values()
+                for p in pat.token_patterns
+            ]
+            if not anchors or any(a is None for a in anchors):
+                self.always.add(label)
+                continue
+            for lits in anchors:
+                for lit in lits:  # type: ignore[union-attr]
+                    self.anchors.setdefault(lit, set()).add(label)
+        if not self.anchors and not self.always:
+            raise ValueError("KeywordTriage needs a pipeline with rule engines")
+
+        # a match of the longest anchor at a position also covers the
+        # anchors that are prefixes of it
+        self._labels = {
+            anchor: frozenset().union(*(
+                labels for other, labels in self.anchors.items() if anchor.startswith(other)
+            ))
+            for anchor in self.anchors
+        }
+        self._wanted = frozenset().union(self.always, *self.anchors.values())
+        self._scanner = compile_trie(self.anchors)
+
+        self.docs = self.chars = 0
+        self.skipped_docs = self.skipped_chars = 0
+
+    def outputs_for(self, text: str) -> frozenset[str]:
+        """
+        Span labels of the rule engines that may match ``text``.
+        """
+        found = set(self.always)
+        for m in self._scanner.finditer(text.lower()):
+            found |= self._labels[m.group(1)]
+            if len(found) == len(self._wanted):
+                break
+        return frozenset(found)
+
+    def __call__(self, text: str) -> Doc:
+        outputs = self.outputs_for(text)
+        self.docs += 1
+        self.chars += len(text)
+        if not outputs:
+            self.skipped_docs += 1
+            self.skipped_chars += len(text)
+            return self.nlp.make_preprocessed_doc(text)
+        return self.nlp(text, outputs=outputs)
+
+    def pipe(self, texts: Iterable[str]) -> Iterator[Doc]:
+        for text in texts:
+            yield self(text)
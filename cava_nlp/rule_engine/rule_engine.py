@@ -1,10 +1,10 @@
 
-from spacy.matcher import Matcher
-from spacy.tokens import Span, Doc, SpanGroup
+from spacy.tokens import Span, Doc, SpanGroup, Token
 from spacy.util import filter_spans
 from spacy.language import Language
 from dataclasses import dataclass
 from .value_resolver import (CASTERS, AGGREGATORS, ValueResolver)
+from ..normalisation.annotation import AnnotationMatcher, annotate_span
 from ..namespaces.core.rule_config import RuleEngineConfig
 
 from typing import Any, Dict, List, TypeAlias, Optional, cast
@@ -14,10 +14,10 @@ SpacyMatcherPatterns: TypeAlias = List[List[SpacyTokenPattern]]
 
 @dataclass(frozen=True)
 class MatcherConfig:
-    matcher: Matcher
+    matcher: AnnotationMatcher
     literal_value: Optional[Any]
-    value_matcher: Optional[Matcher]
-    exclusion: Optional[Matcher]
+    value_matcher: Optional[AnnotationMatcher]
+    exclusion: Optional[AnnotationMatcher]
 
 Span.set_extension("value", default=None, force=True)
 
@@ -39,11 +39,12 @@ class RuleEngine:
     - patterns.value_patterns: Optional[list] # patterns to extract numeric portion within span
     - patterns.exclusions: Optional[list]     # patterns to suppress spans
     - merge_ents: Optional[bool]              # whether to merge matched span into a single token
+                                              # (annotated instead on docs normalised with merge=False)
     """
 
     def _build_matchers(self) -> None:
         for name, pat in self.cfg.patterns.items():
-            token_matcher = Matcher(self.vocab)
+            token_matcher = AnnotationMatcher(self.vocab)
 
             token_patterns = cast(
                 SpacyMatcherPatterns,
@@ -53,7 +54,7 @@ class RuleEngine:
 
             value_matcher = None
             if pat.value_patterns is not None:
-                value_matcher = Matcher(self.vocab)
+                value_matcher = AnnotationMatcher(self.vocab)
                 value_patterns = cast(
                     SpacyMatcherPatterns,
                     pat.value_patterns,
@@ -65,7 +66,7 @@ class RuleEngine:
 
             exclusion_matcher = None
             if pat.exclusions is not None:
-                exclusion_matcher = Matcher(self.vocab)
+                exclusion_matcher = AnnotationMatcher(self.vocab)
                 exclusion_patterns = cast(
                     SpacyMatcherPatterns,
                     pat.exclusions,
@@ -146,7 +147,7 @@ class RuleEngine:
     def _extract_raw_values(
         self,
         span: Span,
-        matcher: Optional[Matcher],
+        matcher: Optional[AnnotationMatcher],
     ) -> list[Span]:        
         if not matcher:
             return []
@@ -164,15 +165,20 @@ class RuleEngine:
         Assumption: Punctuation is never semantic at the span boundary.
         Impact: Significantly more likely to be a context factor match - 
         we only want the core text, and internal punctionation if any.
+        Tokens of an annotated span are not trimmed, as they would not
+        be once merged.
         """
         start, end = sp.start, sp.end
 
+        def trimmable(tok: Token) -> bool:
+            return tok.is_punct and not tok._.norm_part
+
         # Trim leading punctuation
-        while start < end and sp.doc[start].is_punct:
+        while start < end and trimmable(sp.doc[start]):
             start += 1
 
         # Trim trailing punctuation
-        while end > start and sp.doc[end - 1].is_punct:
+        while end > start and trimmable(sp.doc[end - 1]):
             end -= 1
 
         if start >= end:
@@ -185,15 +191,19 @@ class RuleEngine:
         collected: list[Span] = []
 
         for group_name, cfg in self.matchers.items():
+            # the exclusions are matched once per doc, on the first match
+            exclusions = None
             for _, start, end in cfg.matcher(doc):
                 sp = Span(doc, start, end, label=group_name)
                 sp = self._trim_punct_edges(sp)
                 if sp is None:
                     continue
                 if cfg.exclusion is not None:
+                    if exclusions is None:
+                        exclusions = cfg.exclusion(doc)
                     if any(
                         overlaps(start, end, ex_start, ex_end)
-                        for _, ex_start, ex_end in cfg.exclusion(doc)
+                        for _, ex_start, ex_end in exclusions
                     ):
                         continue
 
@@ -220,12 +230,18 @@ class RuleEngine:
             doc.spans[self.span_label] = SpanGroup(doc)
         group = cast(SpanGroup, doc.spans[self.span_label])
                 
+        # annotated docs are left unmerged; their entities are annotated
+        merge = self.merge_ents and not doc._.norm_annotated
         with doc.retokenize() as retok:
             for sp in spans:
-                if self.merge_ents:
+                if merge:
                     retok.merge(sp)        
+                elif self.merge_ents:
+                    annotate_span(sp)
                 group.append(sp)
-                if self.entity_label:
-                    new_ent = Span(doc, sp.start, sp.end, label=self.entity_label)
-                    doc.ents = tuple(doc.ents) + (new_ent,)
+            if self.entity_label:
+                # set once: each assignment to doc.ents walks the whole doc
+                doc.ents = tuple(doc.ents) + tuple(
+                    Span(doc, sp.start, sp.end, label=self.entity_label) for sp in spans
+                )
         return doc
\ No newline at end of file
@@ -1,7 +1,15 @@
+from .clinical_sentencizer import ClinicalSentencizer
+from .clinical_sentencizer_factory import create_clinical_sentencizer
 from .document_layout import DocumentLayout
 from .document_layout_factory import create_document_layout
+from .single_sentence import SingleSentence
+from .single_sentence_factory import create_single_sentence
 
 __all__ = [
+    "ClinicalSentencizer",
     "DocumentLayout",
+    "SingleSentence",
+    "create_clinical_sentencizer",
     "create_document_layout",
-]
\ No newline at end of file
+    "create_single_sentence",
+]
@@ -0,0 +1,109 @@
+import numpy
+from spacy.attrs import SENT_START
+from spacy.language import Language
+from spacy.tokens import Doc, Token
+from typing import Iterable, Optional
+
+# tokens that can end a sentence when followed by whitespace
+TERMINALS = frozenset({".", "!", "?", "…", "..", "..."})
+
+# closing characters that stay with the sentence they close, e.g. '"Stop." He'
+CLOSERS = frozenset({")", "]", "'", '"', "’", "”"})
+
+# lowercase abbreviations the tokenizer leaves split from their full stop,
+# e.g. "approx. 5cm" - a following lowercase word continues the sentence
+DEFAULT_ABBREVIATIONS = frozenset({
+    "approx", "cf", "eg", "etc", "ie", "incl", "max", "min", "mins",
+    "no", "nos", "ref", "resp", "vs", "wk", "wks", "yr", "yrs",
+})
+
+
+def is_enumerator(text: str) -> bool:
+    return (text.isdigit() and len(text) <= 3) or (len(text) == 1 and text.isalpha())
+
+
+def next_non_space(doc: Doc, i: int) -> Optional[Token]:
+    for tok in doc[i:]:
+        if not tok.is_space:
+            return tok
+    return None
+
+
+class ClinicalSentencizer:
+    """
+    Rule-based sentence boundaries for newline-heavy clinical notes.
+
+    A sentence starts
+    - at the first token of the doc
+    - after any whitespace token containing a newline, so each line, bullet
+      and enumerator starts its own sentence (which is what the bullet
+      patterns and ``DocumentLayout.list_items`` rely on)
+    - after a terminal ``.``, ``!`` or ``?`` (plus any closing bracket or
+      quote) that is followed by whitespace, unless it closes a line-start
+      enumerator (``1.``), or the next word is lowercase and follows ``!``,
+      ``?``, an ellipsis or a known abbreviation
+
+    Newlines and trailing whitespace stay with the sentence they end, as
+    with ``medspacy_pysbd``.
+    """
+
+    def __init__(
+            self,
+            nlp: Language,
+            name: str,
+            abbreviations: Iterable[str] = DEFAULT_ABBREVIATIONS,
+        ):
+        self.nlp = nlp
+        self.name = name
+        self.abbreviations = frozenset(a.lower() for a in abbreviations)
+
+    def _ends_sentence(self, doc: Doc, i: int, starts: list[bool]) -> Optional[int]:
+        """
+        If the terminal token at ``i`` ends a sentence, return the index of
+        the token that starts the next one.
+        """
+        tok = doc[i]
+        if i > 0 and starts[i - 1] and is_enumerator(doc[i - 1].text):
+            # "1. weight 70kg" - the full stop belongs to a list enumerator
+            return None
+        end = i
+        # absorb closing brackets/quotes written directly after the terminal
+        while not doc[end].whitespace_ and end + 1 < len(doc) and doc[end + 1].text in CLOSERS:
+            end += 1
+        if not doc[end].whitespace_ and not (end + 1 < len(doc) and doc[end + 1].is_space):
+            return None
+        nxt = next_non_space(doc, end + 1)
+        if nxt is None:
+            return None
+        if nxt.text[:1].islower():
+            if tok.text != ".":
+                return None
+            if i > 0 and not doc[i - 1].whitespace_ and doc[i - 1].lower_ in self.abbreviations:
+                return None
+        return nxt.i
+
+    def __call__(self, doc: Doc) -> Doc:
+        if not len(doc):
+            return doc
+
+        starts = [False] * len(doc)
+        starts[0] = True
+        pending = True
+        for tok in doc:
+            if tok.is_space:
+                if "\n" in tok.text:
+                    pending = True
+                continue
+            if pending:
+                starts[tok.i] = True
+                pending = False
+            if tok.text in TERMINALS:
+                start = self._ends_sentence(doc, tok.i, starts)
+                if start is not None:
+                    starts[start] = True
+
+        # one array write; the Token.is_sent_start setter re-checks the
+        # whole doc's annotation on every call, which is quadratic
+        values = numpy.array([1 if start else -1 for start in starts], dtype="int32")
+        doc.from_array([SENT_START], values.astype("uint64"))
+        return doc
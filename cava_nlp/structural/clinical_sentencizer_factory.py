@@ -0,0 +1,19 @@
+from spacy.language import Language
+from typing import Optional
+from .clinical_sentencizer import ClinicalSentencizer, DEFAULT_ABBREVIATIONS
+
+@Language.factory(
+    "clinical_sentencizer",
+    assigns=["token.is_sent_start", "doc.sents"],
+    default_config={"abbreviations": None},
+)
+def create_clinical_sentencizer(
+        nlp: Language,
+        name: str,
+        abbreviations: Optional[list[str]],
+    ) -> ClinicalSentencizer:
+    return ClinicalSentencizer(
+        nlp,
+        name,
+        abbreviations=DEFAULT_ABBREVIATIONS if abbreviations is None else abbreviations,
+    )
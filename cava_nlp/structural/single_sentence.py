@@ -0,0 +1,25 @@
+import numpy
+from spacy.attrs import SENT_START
+from spacy.language import Language
+from spacy.tokens import Doc
+
+
+class SingleSentence:
+    """
+    Mark the whole doc as one sentence.
+
+    For short structured fields (a weight, an ECOG score, a lab comment)
+    where sentence segmentation is pure overhead. The first token starts
+    the sentence, so ``IS_SENT_START`` patterns still match there.
+    """
+
+    def __init__(self, nlp: Language, name: str = "single_sentence"):
+        self.name = name
+
+    def __call__(self, doc: Doc) -> Doc:
+        if not len(doc):
+            return doc
+        values = numpy.full(len(doc), -1, dtype="int32")
+        values[0] = 1
+        doc.from_array([SENT_START], values.astype("uint64"))
+        return doc
@@ -0,0 +1,9 @@
+from spacy.language import Language
+from .single_sentence import SingleSentence
+
+@Language.factory(
+    "single_sentence",
+    assigns=["token.is_sent_start", "doc.sents"],
+)
+def create_single_sentence(nlp: Language, name: str) -> SingleSentence:
+    return SingleSentence(nlp, name)
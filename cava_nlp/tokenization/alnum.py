@@ -0,0 +1,59 @@
+import re
+from typing import Any, Callable
+
+from spacy.lang.char_classes import UNITS
+
+# infixes splitting mixed alphanumeric chunks such as 70kg or T2N0M0
+ALNUM_BOUNDARY_INFIXES = [
+    r"(?<=[A-Za-z])(?=\d)",
+    r"(?<=\d)(?=[A-Za-z])",
+]
+
+# the English unit suffixes (70kg -> 70, kg) that are plain ASCII letters
+# and digits, in their original order
+ALNUM_UNITS = [unit for unit in UNITS.split("|") if unit.isascii() and unit.isalnum()]
+
+ALNUM_INFIX = re.compile("|".join(ALNUM_BOUNDARY_INFIXES))
+ALNUM_SUFFIX = re.compile(r"(?<=[0-9])(?:" + "|".join(ALNUM_UNITS) + r")$")
+
+
+class AlnumFastPath:
+    """
+    Tokenizer affix callable with a fast path for ASCII alphanumeric
+    strings.
+
+    spaCy runs the full suffix and infix patterns, a few hundred
+    alternatives each, at every position of every chunk it has not seen
+    before. On a string of only ASCII letters and digits, all but a few of
+    them need a punctuation character and cannot match, so ``alnum_method``
+    (a pattern of just those few) gives the same result for a fraction of
+    the cost. Other strings go to the full ``method``.
+
+    ``__self__`` and ``__name__`` are those of ``method``, so spaCy
+    serialises the full pattern.
+    """
+
+    def __init__(self, method: Callable[[str], Any], alnum_method: Callable[[str], Any]):
+        self.__self__ = method.__self__  # type: ignore[attr-defined]
+        self.__name__ = method.__name__
+        self.method = method
+        self.alnum_method = alnum_method
+
+    def __call__(self, string: str) -> Any:
+        if string.isascii() and string.isalnum():
+            return self.alnum_method(string)
+        return self.method(string)
+
+
+def with_alnum_fast_path(
+        suffix_search: Callable[[str], Any],
+        infix_finditer: Callable[[str], Any],
+    ) -> tuple[AlnumFastPath, AlnumFastPath]:
+    """
+    Wrap the CaVa suffix and infix pattern methods with their alphanumeric
+    fast paths.
+    """
+    return (
+        AlnumFastPath(suffix_search, ALNUM_SUFFIX.search),
+        AlnumFastPath(infix_finditer, ALNUM_INFIX.finditer),
+    )
@@ -0,0 +1,144 @@
+import hashlib
+import json
+import os
+import re
+import tempfile
+from pathlib import Path
+from typing import Any, Callable, Optional, Union
+
+import spacy
+from spacy.attrs import IDS, NAMES
+from spacy.tokenizer import Tokenizer
+
+# bump when the layout of the saved data changes, so old artefacts are rebuilt
+ARTEFACT_VERSION = 2
+
+# tokenizer callables that are methods of compiled patterns
+PATTERN_ATTRS = ("prefix_search", "suffix_search", "infix_finditer", "token_match", "url_match")
+
+# the pattern methods an artefact may name
+PATTERN_METHODS = frozenset({"search", "match", "fullmatch", "finditer"})
+
+SpecialCases = dict[str, list[dict[int, str]]]
+
+
+def _source(entry: Any) -> Any:
+    if isinstance(entry, re.Pattern):
+        return (entry.pattern, entry.flags)
+    if hasattr(entry, "__self__") and isinstance(entry.__self__, re.Pattern):
+        return (entry.__name__, _source(entry.__self__))
+    return entry
+
+
+def tokenizer_fingerprint(defaults: Any) -> str:
+    """
+    Hash of everything the tokenizer is built from: the special cases, the
+    prefix, suffix and infix rules, ``token_match`` and ``url_match``, and
+    the spaCy version.
+    """
+    parts = [
+        ARTEFACT_VERSION,
+        spacy.__version__,
+        sorted(defaults.tokenizer_exceptions.items()),
+        [_source(p) for p in defaults.prefixes or ()],
+        [_source(p) for p in defaults.suffixes or ()],
+        [_source(p) for p in defaults.infixes or ()],
+        _source(defaults.token_match),
+        _source(defaults.url_match),
+    ]
+    return hashlib.sha256(repr(parts).encode()).hexdigest()
+
+
+def save_tokenizer_artefact(
+        tokenizer: Tokenizer,
+        path: Union[str, Path],
+        fingerprint: str,
+    ) -> None:
+    """
+    Save the prefix, suffix, infix and token patterns of ``tokenizer`` (as
+    pattern source and flags) and its special cases to ``path`` as JSON,
+    tagged with ``fingerprint``.
+    """
+    patterns: dict[str, Optional[tuple[str, str, int]]] = {}
+    for attr in PATTERN_ATTRS:
+        func = getattr(tokenizer, attr)
+        if func is None:
+            patterns[attr] = None
+        elif isinstance(getattr(func, "__self__", None), re.Pattern):
+            patterns[attr] = (func.__name__, func.__self__.pattern, func.__self__.flags)
+        else:
+            raise ValueError(f"Tokenizer {attr} is not a compiled pattern method: {func!r}")
+    # attribute IDs by name, as JSON keys are strings
+    rules = {
+        chunk: [{NAMES[attr]: value for attr, value in spec.items()} for spec in substrings]
+        for chunk, substrings in tokenizer.rules.items()
+    }
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # write-then-rename so concurrent readers never see a partial artefact
+    fd, tmp = tempfile.mkstemp(dir=path.parent)
+    try:
+        with os.fdopen(fd, "w", encoding="utf8") as f:
+            json.dump({
+                "version": ARTEFACT_VERSION,
+                "fingerprint": fingerprint,
+                "patterns": patterns,
+                "rules": rules,
+            }, f)
+        os.replace(tmp, path)
+    finally:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+
+
+def _load_pattern(entry: Optional[list[Any]]) -> Optional[Callable[..., Any]]:
+    if entry is None:
+        return None
+    method, source, flags = entry
+    if method not in PATTERN_METHODS or not isinstance(source, str) or not isinstance(flags, int):
+        raise ValueError(f"Not a saved pattern: {entry!r}")
+    return getattr(re.compile(source, flags), method)
+
+
+def _load_rules(rules: Any) -> SpecialCases:
+    if not isinstance(rules, dict) or not all(
+        isinstance(chunk, str) and isinstance(substrings, list) and all(
+            isinstance(spec, dict) and all(
+                attr in IDS and isinstance(value, str) for attr, value in spec.items()
+            )
+            for spec in substrings
+        )
+        for chunk, substrings in rules.items()
+    ):
+        raise ValueError("Not a saved special case table")
+    return {
+        chunk: [{IDS[attr]: value for attr, value in spec.items()} for spec in substrings]
+        for chunk, substrings in rules.items()
+    }
+
+
+def load_tokenizer_artefact(
+        path: Union[str, Path],
+        fingerprint: str,
+    ) -> Optional[tuple[dict[str, Optional[Callable[..., Any]]], SpecialCases]]:
+    """
+    Load the pattern methods saved by ``save_tokenizer_artefact``, keyed by
+    tokenizer attribute and recompiled with ``re.compile``, and its special
+    cases; or None if there is no artefact at ``path``, it was built from
+    other rules or by another spaCy version, or it is not a readable
+    artefact at all (truncated, corrupt, unrelated).
+    """
+    try:
+        with open(path, encoding="utf8") as f:
+            data = json.load(f)
+        if data["version"] != ARTEFACT_VERSION or data["fingerprint"] != fingerprint:
+            return None
+        patterns = {attr: _load_pattern(data["patterns"][attr]) for attr in PATTERN_ATTRS}
+        return patterns, _load_rules(data["rules"])
+    except FileNotFoundError:
+        return None
+    # what decoding (JSONDecodeError and UnicodeDecodeError are ValueErrors),
+    # unpacking and recompiling an unreadable file raise
+    except (ValueError, TypeError, KeyError, re.error):
+        return None
@@ -2,6 +2,9 @@ import spacy
 from spacy.lang.en import English
 from typing import Pattern, cast
 
+from .alnum import ALNUM_BOUNDARY_INFIXES
+from .literals import DOTTED_RUN_INFIXES, NUMERIC_LITERAL_PREFIXES
+
 
 def build_cava_prefixes() -> list[str | Pattern[str]]:
     """
@@ -12,7 +15,9 @@ def build_cava_prefixes() -> list[str | Pattern[str]]:
     extra = [
         "@", r"\?", "~", "<", ">", ";", r"\^",
         r"\(", r"\)", r"\|", "-", "=", ":",
-        r"\+\+\+", r"\+\+", r"\+", r"\.", r"\d+",
+        r"\+\+\+", r"\+\+", r"\+", r"\.",
+        # numbers, with decimals and scientific notation as one token
+        *NUMERIC_LITERAL_PREFIXES,
         "/", "SGA", "PGSGA"
     ]
 
@@ -45,8 +50,8 @@ def build_cava_infixes() -> list[str | Pattern[str]]:
         r"\?", r",", r"\(", r"\)", r"\|",
         "~", r"=", r"\+\+\+", r"\+\+", r"\+",
         # alpha-digit and digit-alpha boundaries
-        r"(?<=[A-Za-z])(?=\d)",
-        r"(?<=\d)(?=[A-Za-z])",
+        *ALNUM_BOUNDARY_INFIXES,
+        *DOTTED_RUN_INFIXES,
     ]
 
     # Add hyphens from char classes (e.g., unicode hyphens)
@@ -1,17 +1,38 @@
 # type: ignore
+import re
 import spacy
 from spacy.lang.en import English
+from spacy.attrs import NORM, intify_attr
+from spacy.lang.lex_attrs import LEX_ATTRS
 from spacy.language import Language
-from spacy.tokenizer import Tokenizer
+from thinc.api import Config
 from typing import Dict, List, Callable, Iterable, Pattern
-from spacy.util import compile_infix_regex, compile_prefix_regex, compile_suffix_regex
 from .builder import build_cava_prefixes, build_cava_suffixes, build_cava_infixes
 from .exceptions import (
     build_stage_exceptions,
     build_special_vocab_exceptions,
     build_clinical_symbol_exceptions,
-    build_cycle_day_exceptions
+    build_cycle_exceptions,
+    cycle_day_regex,
 )
+from .tokenizer import create_cava_tokenizer  # registers cava_nlp.Tokenizer.v1
+
+DEFAULT_CONFIG = """
+[nlp]
+
+[nlp.tokenizer]
+@tokenizers = "cava_nlp.Tokenizer.v1"
+"""
+
+cycle_day_match = re.compile(f'^(?:{cycle_day_regex})$').match
+
+
+def cava_norm(string: str) -> str:
+    """
+    Lexeme norm: ``cycle_day`` for cycle/day shorthand, else lower case.
+    """
+    return "cycle_day" if cycle_day_match(string) else LEX_ATTRS[NORM](string)
+
 
 def build_cava_exceptions(
         base_exceptions: Dict[str, List[Dict[str, str]]]
@@ -22,7 +43,9 @@ def build_cava_exceptions(
 
     # 1. Start with English defaults
     exc = {
-        rule: case
+        # without the string keys spaCy ignores (e.g. "number"), which it
+        # would otherwise pop from these shared dicts on first use
+        rule: [{k: v for k, v in spec.items() if not (isinstance(k, str) and intify_attr(k) is None)} for spec in case]
         for rule, case in base_exceptions.items()
         # drop emoji-like and colon/equals prefixes
         if not rule.startswith((':', '='))
@@ -36,38 +59,21 @@ def build_cava_exceptions(
     exc.update(build_clinical_symbol_exceptions())
     exc.update(build_stage_exceptions())
     exc.update(build_special_vocab_exceptions())
-    exc.update(build_cycle_day_exceptions())
+    exc.update(build_cycle_exceptions())
     return exc
 
 
-def create_cava_tokenizer(nlp: Language) -> Tokenizer:
-    """
-    Core tokenizer factory.
-    Uses custom infix/prefix/suffix and pruned exceptions.
-    """
-    prefixes = compile_prefix_regex(nlp.Defaults.prefixes).search
-    suffixes = compile_suffix_regex(nlp.Defaults.suffixes).search
-    infixes = compile_infix_regex(nlp.Defaults.infixes).finditer
-
-    return Tokenizer(
-        nlp.vocab,
-        nlp.Defaults.tokenizer_exceptions,
-        prefix_search=prefixes,
-        suffix_search=suffixes,
-        infix_finditer=infixes,
-        token_match=nlp.Defaults.token_match,
-        url_match=nlp.Defaults.url_match,
-    )
-
-
 class CaVaLangDefaults(English.Defaults):
     """
     Defaults for CaVaLang, with:
     - pruned special cases
     - brutal infix/prefix/suffix splitting
     - URL recognition disabled
+    - cycle/day shorthand matched and normed by pattern
     """
 
+    config = Config().from_str(DEFAULT_CONFIG)
+
     tokenizer_exceptions: dict[str, list[dict[str, str]]] = (
         build_cava_exceptions(English.Defaults.tokenizer_exceptions)
     )
@@ -77,5 +83,6 @@ class CaVaLangDefaults(English.Defaults):
     infixes: Iterable[str | Pattern[str]] = build_cava_infixes()
 
 
+    lex_attr_getters = {**English.Defaults.lex_attr_getters, NORM: cava_norm}
+    token_match: Callable[[str], bool] | None = cycle_day_match
     url_match: Callable[[str], bool] | None = None
-    create_tokenizer: Callable[[Language], Tokenizer] = create_cava_tokenizer
\ No newline at end of file
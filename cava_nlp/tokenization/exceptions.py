@@ -30,13 +30,18 @@ special_cases: List[SpecialCase] = [
 units_num: List[str] = ['mg', 'mcg', 'g', 'units', 'u', 'mgs', 'mcgs', 'gram', 'grams', 'mG', 'mL', 'mol']
 units_denom: List[str] = ['mg', 'mgc', 'g', 'kg', 'ml', 'l', 'm2', 'm^2', 'hr', 'liter', 'gram', 'L', 'mL', 'KG', 
                           'mG', 'kG', 'kilogram', 'lb', 'pounds', 'lbs', 'kilos', 'Kg']
+# the infix rules already split 'mg/kg' into 'mg', '/', 'kg' and CaVaTokenizer
+# sets the unit norms on the pieces, so special cases are only needed for the
+# denominators the infix rules would split further
+split_units_denom: List[str] = ['m2', 'm^2']
 unit_suffix: List[str] = []
 
 for a in units_num:
     for b in units_denom:
         if a != b:
-            special_cases.append([f'{a}/{b}', [{ORTH: a, NORM: 'unit_num'}, {ORTH: '/'}, {ORTH: b, NORM: 'unit_denom'}]])
             unit_suffix.append(f'{a}/{b}')
+            if b in split_units_denom:
+                special_cases.append([f'{a}/{b}', [{ORTH: a, NORM: 'unit_num'}, {ORTH: '/'}, {ORTH: b, NORM: 'unit_denom'}]])
 
 units_regex = '|'.join([f'{u}' for u in units_denom])
 units_regex = f'^(\\d+)?({units_regex})$'
@@ -62,34 +67,21 @@ def build_clinical_symbol_exceptions() -> Dict[str, TokenizerException]:
     return exc
 
 
-# def build_unit_slash_exceptions():
-#     return {
-#         f"{a}/{b}": [
-#             {ORTH: a, NORM: "unit_num"},
-#             {ORTH: "/"},
-#             {ORTH: b, NORM: "unit_denom"},
-#         ]
-#         for a in units_num
-#         for b in units_denom
-#         if a != b
-#     }
+# cycle/day shorthand used in oncology notes, such as c1d1 or C12D28, is
+# matched by the tokenizer's token_match and the lexeme norm rather than
+# enumerated special cases;
+# bare cycles (c1, C3) stay special cases, as the special case matcher also
+# picks them out of longer strings
+cycle_day_regex = r'c[1-9]\d?d[1-9]\d?|C[1-9]\d?D[1-9]\d?'
 
 
-
-def build_cycle_day_exceptions(max_cycle: int = 6, max_day: int = 21) -> Dict[str, TokenizerException]:
+def build_cycle_exceptions(max_cycle: int = 6) -> Dict[str, TokenizerException]:
     """
-    Build a list of cycle/day shorthand tokens used in oncology notes,
-    such as c1d1, c2d7, etc.
+    Build the bare cycle shorthand tokens used in oncology notes, such as
+    c1 or C3.
     """
-
     tokens = [f'c{i}' for i in range(1, max_cycle + 1)]
     tokens += [f'C{i}' for i in range(1, max_cycle + 1)]
-
-    for c in range(1, max_cycle + 1):
-        for d in range(1, max_day + 1):
-            lower = f"c{c}d{d}"
-            tokens.append(lower)
-            tokens.append(lower.upper())
     return {
         term: [{ORTH: term, NORM: "cycle_day"}]
         for term in tokens
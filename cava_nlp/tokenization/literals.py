@@ -0,0 +1,62 @@
+import re
+from typing import Any, Optional
+
+# 10^9, x10^9, 10**9
+SCIENTIFIC_POWER = r"[xX]?10[xX]?(?:\^|\*\*)(?P<power>\d+)"
+# 1e3, 5E+4
+SCIENTIFIC_E = r"(?P<mantissa>\d+)[eE]\+?(?P<e_exp>\d+)"
+DECIMAL = r"\d+\.\d+"
+
+# prefixes that take a numeric literal off the front of a chunk in one
+# piece. A run of three or more dot-separated numbers (12.03.2024) is not a
+# decimal, and is left to ``DOTTED_RUN_INFIXES``: split from the front it
+# would leave 03.2024 behind as one.
+NUMERIC_LITERAL_PREFIXES = [
+    r"[xX]?10[xX]?(?:\^|\*\*)\d+",
+    r"\d+[eE]\+?\d+",
+    r"\d+\.\d+(?!\.?\d)",
+    r"\d+(?!\d|\.\d+\.\d)",
+]
+
+# split every dot of a dotted number run (12.03.2024 -> 12 . 03 . 2024),
+# but not the dot of a single decimal
+DOTTED_RUN_INFIXES = [
+    r"(?<=\d)\.(?=\d+\.\d)",
+    r"(?<=\d\.\d)\.(?=\d)",
+    r"(?<=\d\.\d\d)\.(?=\d)",
+    r"(?<=\d\.\d{3})\.(?=\d)",
+    r"(?<=\d\.\d{4})\.(?=\d)",
+]
+
+NUMERIC_LITERAL = re.compile(f"{SCIENTIFIC_POWER}|{SCIENTIFIC_E}|{DECIMAL}")
+
+# token extensions set on every numeric literal token
+LITERAL_EXTENSIONS = ("kind", "value", "base", "exp", "decimal", "scientific")
+
+
+def numeric_literal(match: "re.Match[str]") -> Optional[tuple[str, str, dict[str, Any]]]:
+    """
+    Kind, norm and extension values of a ``NUMERIC_LITERAL`` match, or
+    None if its value is out of range (``10^400``, ``2E400``).
+
+    "36.9"  -> "decimal", "36.9", value=36.9
+    "x10^9" -> "scientific", "10.0^9", value=1e9, base=10.0, exp=9
+    "5e3"   -> "scientific", "5.0e3", value=5000.0, base=10.0, exp=3
+    """
+    try:
+        power: Optional[str] = match["power"]
+        if power is not None:
+            exp = int(power)
+            return "scientific", f"10.0^{exp}", {"value": 10.0 ** exp, "base": 10.0, "exp": exp}
+        mantissa: Optional[str] = match["mantissa"]
+        if mantissa is not None:
+            exp = int(match["e_exp"])
+            return "scientific", f"{float(mantissa)}e{exp}", {
+                "value": float(mantissa) * 10.0 ** exp, "base": 10.0, "exp": exp,
+            }
+    # OverflowError from the power; ValueError from int() on an exponent
+    # longer than Python's int string limit
+    except (OverflowError, ValueError):
+        return None
+    text = match.group()
+    return "decimal", text, {"value": float(text)}
@@ -0,0 +1,93 @@
+from dataclasses import dataclass
+from typing import Dict, Iterable, Union
+
+# All mask patterns are compiled into one alternation with the whitespace
+# condensing rules (see preprocess.compile_scanner) and scanned once.
+#
+# Because the scanner is tried at every character position, each pattern
+# must be linear-time on text that *nearly* matches:
+# - anchor the start with a lookbehind so a long run is only entered once
+# - use possessive quantifiers (py3.11+) on unbounded character runs so a
+#   failed match cannot backtrack through the run
+# - keep any remaining repetition bounded, e.g. {8}
+#
+# Masks see the raw text, before whitespace runs are condensed, so a
+# separator must accept a run ("0412  345 678"): ``[ -]*+``, not ``[ -]?``.
+
+# local part starts at a run boundary, so a long run of address characters
+# without an '@' is scanned once rather than once per position
+SAFE_EMAIL = r"(?<![A-Za-z0-9._-])[A-Za-z0-9._-]++@[A-Za-z0-9.-]+\.[A-Za-z]+"
+
+# australian landline / mobile, optionally with +61 or an area code in brackets
+# e.g. 0412 345 678, (02) 9123 4567, +61 412 345 678
+PHONE = r"(?<![\w+])(?:\+?61[ -]*+[2-478]|\(0[2-478]\)|0[2-478])(?:[ -]*+\d){8}(?!\w)"
+
+# labelled medical record / unit record numbers, e.g. MRN: 1234567, URN#00123456
+# (explicit case classes rather than (?i:...) - they fail faster at each position)
+MRN = (
+    r"(?<![A-Za-z0-9_])(?:[Mm][Rr][Nn]|[Uu][Rr][Nn]?)(?![A-Za-z0-9_])"
+    r"[ \t]*+(?:[Nn][Oo]\.?|[Nn]umber|#)?+[ \t]*+[:#]?+[ \t]*+\d{5,10}(?!\d)"
+)
+
+# medicare card numbers: 10 digits (leading 2-6) with optional IRN, e.g. 2123 45670 1/2
+MEDICARE = r"(?<!\d)[2-6]\d{3} *+\d{5} *+\d(?:[/-][1-9])?(?!\d)"
+
+
+@dataclass(frozen=True)
+class MaskPattern:
+    """
+    A named regex whose matches are masked before tokenization.
+
+    Attributes
+    ----------
+    name : str
+        Identifier used to select the pattern, e.g. ``"email"``.
+    pattern : str
+        Regular expression. The whole match is overwritten, one mask
+        character per matched character, so it must not rely on capture
+        groups. It must also be safe from catastrophic backtracking, since
+        it is tried at every position of every document, and it is matched
+        against the raw text, so separators should accept whitespace runs.
+    """
+    name: str
+    pattern: str
+
+
+MASK_PATTERNS: Dict[str, MaskPattern] = {}
+
+DEFAULT_MASKS: tuple[str, ...] = ("email",)
+
+
+def register_mask_pattern(mask: MaskPattern) -> None:
+    """
+    Register a mask pattern so that it can be selected by name.
+    """
+    MASK_PATTERNS[mask.name] = mask
+
+
+for _mask in (
+    MaskPattern("email", SAFE_EMAIL),
+    MaskPattern("phone", PHONE),
+    MaskPattern("mrn", MRN),
+    MaskPattern("medicare", MEDICARE),
+):
+    register_mask_pattern(_mask)
+
+
+def resolve_mask_patterns(masks: Iterable[Union[str, MaskPattern]]) -> tuple[str, ...]:
+    """
+    Resolve mask names and ``MaskPattern`` instances into regex strings,
+    preserving order (earlier patterns win when two match at one position).
+    """
+    resolved: list[str] = []
+    for mask in masks:
+        if isinstance(mask, MaskPattern):
+            resolved.append(mask.pattern)
+            continue
+        if mask not in MASK_PATTERNS:
+            raise ValueError(
+                f"Unknown mask pattern: {mask!r}. "
+                f"Available: {sorted(MASK_PATTERNS)}"
+            )
+        resolved.append(MASK_PATTERNS[mask].pattern)
+    return tuple(resolved)
@@ -1,30 +1,152 @@
-from typing import Iterable
+import re
+from bisect import bisect_right
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Iterable, Pattern
+from .masking import SAFE_EMAIL
+
+# emails are masked before tokenization so that their fragments cannot
+# trigger clinical rules (e.g. dates or units inside an address)
+EMAIL_MASK = SAFE_EMAIL
+
+MASK_CHAR = "x"
+
+
+@dataclass(frozen=True)
+class OffsetMap:
+    """
+    Compact character offset map between raw and preprocessed text.
+
+    Preprocessing only ever deletes characters (condensed runs) or replaces
+    them one-for-one (masking), so the mapping is piecewise linear. Only the
+    breakpoints are stored: ``processed[k]`` is the first processed index
+    after the k-th deletion, and ``original[k]`` is the raw index it came from.
+
+    Attributes
+    ----------
+    processed : tuple[int, ...]
+        Breakpoints in the preprocessed text, strictly increasing.
+    original : tuple[int, ...]
+        Matching breakpoints in the raw text, strictly increasing.
+    """
+    processed: tuple[int, ...] = ()
+    original: tuple[int, ...] = ()
+
+    def to_original(self, index: int) -> int:
+        """
+        Map a preprocessed character index back to the raw text.
+        """
+        k = bisect_right(self.processed, index)
+        if k == 0:
+            return index
+        return self.original[k - 1] + (index - self.processed[k - 1])
+
+    def to_processed(self, index: int) -> int:
+        """
+        Map a raw character index onto the preprocessed text.
+
+        Characters that were removed by condensing map onto the character
+        that was kept in their place.
+        """
+        k = bisect_right(self.original, index)
+        if k == 0:
+            mapped = index
+        else:
+            mapped = self.processed[k - 1] + (index - self.original[k - 1])
+        if k < len(self.processed):
+            mapped = min(mapped, self.processed[k] - 1)
+        return mapped
+
+    def original_span(self, start: int, end: int) -> tuple[int, int]:
+        """
+        Map a preprocessed ``[start, end)`` character span to the raw text.
+        """
+        if end <= start:
+            return self.to_original(start), self.to_original(start)
+        return self.to_original(start), self.to_original(end - 1) + 1
+
+
+@lru_cache(maxsize=32)
+def compile_scanner(condense: tuple[str, ...], masks: tuple[str, ...]) -> Pattern[str]:
+    """
+    Compile condensing rules and mask patterns into one alternation, so that
+    preprocessing is a single left-to-right scan of the text.
+
+    Condense groups are named ``c<i>`` and mask groups ``m<i>``.
+    """
+    parts = [f"(?P<c{i}>(?:{re.escape(c)}){{2,}})" for i, c in enumerate(condense)]
+    parts += [f"(?P<m{i}>{m})" for i, m in enumerate(masks)]
+    if not parts:
+        # never matches - keeps the scan loop uniform
+        return re.compile(r"(?!)")
+    return re.compile("|".join(parts))
+
+
+def preprocess_text(
+        text: str,
+        condense: Iterable[str] = (' ', '\n'),
+        masks: Iterable[str] = (EMAIL_MASK,),
+        mask_char: str = MASK_CHAR,
+    ) -> tuple[str, OffsetMap]:
+    """
+    Condense character runs and mask sensitive strings in a single pass.
+
+    Parameters
+    ----------
+    text : str
+        Raw input text.
+    condense : Iterable[str]
+        Characters whose consecutive runs are reduced to one instance.
+    masks : Iterable[str]
+        Regex patterns whose matches are overwritten with ``mask_char``.
+        Masking is length-preserving.
+    mask_char : str
+        Single replacement character used for masking.
+
+    Returns
+    -------
+    tuple[str, OffsetMap]
+        The preprocessed text and the offset map back to ``text``.
+    """
+    scanner = compile_scanner(tuple(condense), tuple(masks))
+    pieces: list[str] = []
+    processed: list[int] = []
+    original: list[int] = []
+    pos = 0
+    removed = 0
+    for m in scanner.finditer(text):
+        start, end = m.span()
+        pieces.append(text[pos:start])
+        group = m.lastgroup or ""
+        if group.startswith("c"):
+            pieces.append(text[start])
+            removed += end - start - 1
+            processed.append(end - removed)
+            original.append(end)
+        else:
+            pieces.append(mask_char * (end - start))
+        pos = end
+    if pos == 0:
+        # nothing matched - avoid copying the text
+        return text, OffsetMap()
+    pieces.append(text[pos:])
+    return "".join(pieces), OffsetMap(tuple(processed), tuple(original))
+
 
 def condense_char_runs(text: str, char: str) -> str:
     """
     Replace multiple consecutive occurrences of `char`
     with a single instance.
     """
-    result: list[str] = []
-    last = None
-    for c in text:
-        if c == char:
-            if last != char:
-                result.append(c)
-        else:
-            result.append(c)
-        last = c
-    return "".join(result)
+    return preprocess_text(text, condense=(char,), masks=())[0]
 
 
 def whitespace_preprocess(text: str, chars: Iterable[str]) -> str:
     """
     Apply whitespace/linebreak condensing rules before tokenization.
-    We preserve breaks but avoids false emphasis - in practice, this 
+    We preserve breaks but avoids false emphasis - in practice, this
     is especially important for date attribution and sectionising.
 
     This works by stabilising sentence, date and section boundary heuristics.
     """
-    for c in chars:
-        text = condense_char_runs(text, c)
-    return text
+    return preprocess_text(text, condense=chars, masks=())[0]
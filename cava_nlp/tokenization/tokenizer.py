@@ -0,0 +1,123 @@
+# type: ignore
+from typing import Optional
+
+from spacy.language import Language
+from spacy.tokenizer import Tokenizer
+from spacy.tokens import Doc, Token
+from spacy.util import compile_infix_regex, compile_prefix_regex, compile_suffix_regex, registry
+
+from .alnum import with_alnum_fast_path
+from .artefact import load_tokenizer_artefact, save_tokenizer_artefact, tokenizer_fingerprint
+from .exceptions import units_denom, units_num
+from .literals import LITERAL_EXTENSIONS, NUMERIC_LITERAL, numeric_literal
+
+UNITS_NUM = frozenset(units_num)
+UNITS_DENOM = frozenset(units_denom)
+
+for ext in LITERAL_EXTENSIONS:
+    Token.set_extension(ext, default=False if ext in ("decimal", "scientific") else None, force=True)
+
+
+class CaVaTokenizer(Tokenizer):
+    """
+    spaCy tokenizer that sets the unit norms without enumerated special
+    cases, and the attributes of numeric literals.
+
+    The infix rules split a unit ratio such as ``mg/kg`` into ``mg``, ``/``
+    and ``kg``. After tokenizing, every ``/`` token directly between two
+    known units gets ``NORM`` ``unit_num`` on its left and ``unit_denom``
+    on its right, as the former ``units_num x units_denom`` special cases
+    did.
+
+    The prefix rules keep decimals (``36.9``) and scientific notation
+    (``x10^9``, ``1e3``) in one token. Each such token gets ``_.kind``
+    ``decimal`` or ``scientific``, ``_.value`` (and ``_.base`` and ``_.exp``
+    for scientific notation) and its ``NORM`` here, so the normaliser does
+    not have to match and merge them.
+    """
+
+    def __call__(self, text: str) -> Doc:
+        doc = super().__call__(text)
+        pos = text.find("/")
+        while pos != -1:
+            slash = doc.char_span(pos, pos + 1)
+            pos = text.find("/", pos + 1)
+            if slash is None or len(slash) != 1:
+                continue
+            i = slash.start
+            if i == 0 or i + 1 == len(doc) or doc[i - 1].whitespace_ or doc[i].whitespace_:
+                continue
+            num, denom = doc[i - 1], doc[i + 1]
+            if num.text in UNITS_NUM and denom.text in UNITS_DENOM and num.text != denom.text:
+                num.norm_ = "unit_num"
+                denom.norm_ = "unit_denom"
+        user_data = doc.user_data
+        for match in NUMERIC_LITERAL.finditer(text):
+            start = match.start()
+            span = doc.char_span(start, match.end())
+            if span is None or len(span) != 1:
+                continue
+            literal = numeric_literal(match)
+            if literal is None:
+                # out of range: left as a plain token, as the
+                # scientific notation normaliser used to leave it
+                continue
+            kind, norm, attrs = literal
+            # the user_data keys ``token._`` writes to, without building an
+            # Underscore per attribute
+            user_data[("._.", "kind", start, None)] = kind
+            user_data[("._.", kind, start, None)] = True
+            for attr, value in attrs.items():
+                user_data[("._.", attr, start, None)] = value
+            span[0].norm_ = norm
+        return doc
+
+
+@registry.tokenizers("cava_nlp.Tokenizer.v1")
+def create_cava_tokenizer(artefact: Optional[str] = None):
+    """
+    Core tokenizer factory.
+    Uses custom infix/prefix/suffix and pruned exceptions, with the suffix
+    and infix patterns on an alphanumeric fast path (see ``AlnumFastPath``).
+
+    Parameters
+    ----------
+    artefact : str, optional
+        Path of a tokenizer artefact. If it was built from the same rules
+        by the same spaCy version, the patterns are recompiled from their
+        saved sources and the special cases read from it; otherwise the
+        tokenizer is built from the language defaults and the artefact is
+        (re)written.
+    """
+    def tokenizer_factory(nlp: Language) -> CaVaTokenizer:
+        fingerprint = tokenizer_fingerprint(nlp.Defaults) if artefact else None
+        saved = load_tokenizer_artefact(artefact, fingerprint) if artefact else None
+        if saved is not None:
+            patterns, rules = saved
+        else:
+            rules = nlp.Defaults.tokenizer_exceptions
+            prefixes = nlp.Defaults.prefixes
+            suffixes = nlp.Defaults.suffixes
+            infixes = nlp.Defaults.infixes
+            patterns = {
+                "prefix_search": compile_prefix_regex(prefixes).search if prefixes else None,
+                "suffix_search": compile_suffix_regex(suffixes).search if suffixes else None,
+                "infix_finditer": compile_infix_regex(infixes).finditer if infixes else None,
+                "token_match": nlp.Defaults.token_match,
+                "url_match": nlp.Defaults.url_match,
+            }
+        if patterns["suffix_search"] is not None and patterns["infix_finditer"] is not None:
+            patterns["suffix_search"], patterns["infix_finditer"] = with_alnum_fast_path(
+                patterns["suffix_search"], patterns["infix_finditer"]
+            )
+
+        tokenizer = CaVaTokenizer(
+            nlp.vocab,
+            rules=rules,
+            **patterns,
+        )
+        if artefact and saved is None:
+            save_tokenizer_artefact(tokenizer, artefact, fingerprint)
+        return tokenizer
+
+    return tokenizer_factory
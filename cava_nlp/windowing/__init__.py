@@ -0,0 +1,6 @@
+from .windowed import WindowedProcessor, plan_windows
+
+__all__ = [
+    "WindowedProcessor",
+    "plan_windows",
+]
@@ -0,0 +1,130 @@
+import re
+from dataclasses import dataclass
+from typing import Iterator
+
+from spacy.tokens import Doc
+
+from ..caching.merge import StatePart, merge_states
+from ..caching.serialise import doc_state
+from ..language import CaVaLang
+
+# preferred places to cut, best first: the start of a line, the start of a
+# sentence, the start of any word
+CUT_POINTS = (
+    re.compile(r"\n\s*(?=\S)"),
+    re.compile(r"[.!?]\s+(?=\S)"),
+    re.compile(r"\s+(?=\S)"),
+)
+
+
+@dataclass(frozen=True)
+class Window:
+    """
+    Character ranges of one window over the preprocessed text. Results are
+    kept for ``[core_start, core_end)``; the rest is context.
+    """
+    start: int
+    core_start: int
+    core_end: int
+    end: int
+
+
+def next_cut(text: str, pos: int, slack: int) -> int:
+    """
+    First cut point at or after ``pos``, preferring line starts, then
+    sentence starts, then word starts, within ``slack`` characters. Past
+    the slack, the next word start however far away, or the end of the
+    text, so that a long token is never cut.
+    """
+    if pos <= 0:
+        return 0
+    if pos >= len(text):
+        return len(text)
+    for pattern in CUT_POINTS:
+        m = pattern.search(text, pos - 1, min(len(text), pos + slack))
+        if m is not None and m.end() >= pos:
+            return m.end()
+    m = CUT_POINTS[-1].search(text, pos - 1)
+    return len(text) if m is None else m.end()
+
+
+def plan_windows(text: str, window_chars: int, overlap_chars: int) -> Iterator[Window]:
+    """
+    Split ``text`` into consecutive cores of roughly ``window_chars``, each
+    extended by up to ``overlap_chars`` of context on either side. All
+    cuts fall on cut points, so each window tokenizes like the whole text.
+    """
+    slack = max(window_chars // 4, 1)
+    core_start = 0
+    while True:
+        core_end = next_cut(text, core_start + window_chars, slack)
+        start = min(next_cut(text, core_start - overlap_chars, overlap_chars), core_start)
+        end = next_cut(text, core_end + overlap_chars, slack) if core_end < len(text) else core_end
+        yield Window(start, core_start, core_end, end)
+        if core_end >= len(text):
+            return
+        core_start = core_end
+
+
+class WindowedProcessor:
+    """
+    Process very large documents in overlapping windows.
+
+    The preprocessed text is cut into cores of about ``window_chars``, at
+    line starts where possible, falling back to sentence or word starts.
+    Each core is run through the pipeline with up to ``overlap_chars`` of
+    surrounding text, so components see context across the seam. Only
+    results that start inside the core are kept, and they are merged into
+    one Doc: tokens, span groups, entities, extension values, ConText and
+    layout structures. Nothing is duplicated at the seams.
+
+    Components only ever hold one window. Peak working memory therefore
+    depends on ``window_chars``, not on the document size. Only the
+    compact serialised results are kept between windows.
+
+    Parameters
+    ----------
+    nlp : CaVaLang
+        The pipeline to run on each window.
+    window_chars : int
+        Target core size in characters.
+    overlap_chars : int
+        Context added on each side of a core.
+    """
+
+    def __init__(self, nlp: CaVaLang, window_chars: int = 5_000, overlap_chars: int = 500):
+        if window_chars <= 0:
+            raise ValueError("window_chars must be > 0")
+        if overlap_chars < 0:
+            raise ValueError("overlap_chars must be >= 0")
+        self.nlp = nlp
+        self.window_chars = window_chars
+        self.overlap_chars = overlap_chars
+
+    def __call__(self, text: str) -> Doc:
+        processed, offset_map = self.nlp.preprocess_with_offsets(text)
+        if len(processed) <= self.window_chars + self.overlap_chars:
+            doc = self.nlp(self.nlp.make_doc(processed))
+            doc._.offset_map = offset_map
+            return doc
+
+        parts: list[StatePart] = []
+        owned_tokens = 0
+        for window in plan_windows(processed, self.window_chars, self.overlap_chars):
+            doc = self.nlp(self.nlp.make_doc(processed[window.start:window.end]))
+            core_start = window.core_start - window.start
+            core_end = window.core_end - window.start
+            first = next((t.i for t in doc if t.idx >= core_start), len(doc))
+            stop = next((t.i for t in doc if t.idx >= core_end), len(doc))
+            parts.append(StatePart(
+                doc_state(doc),
+                token_offset=owned_tokens - first,
+                char_offset=window.start,
+                start=first,
+                end=stop,
+            ))
+            owned_tokens += stop - first
+
+        doc = merge_states(self.nlp.vocab, parts)
+        doc._.offset_map = offset_map
+        return doc
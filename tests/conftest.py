@@ -1,6 +1,59 @@
 import pytest
 from pathlib import Path
 from cava_nlp import CaVaLang
+from cava_nlp.context.hooks import enable_context
+from cava_nlp.rule_engine import RuleEngine  # noqa: F401 (registers the rule_engine factory)
+from cava_nlp.structural.document_layout import DocumentLayout  # noqa: F401 (registers document_layout)
+
+# rule engine component name -> engine config component
+ENGINES = {
+    "ecog_value": "ecog_status",
+    "variants_of_interest": "variants_of_interest",
+}
+
+
+def build_pipeline(engines=ENGINES, context_profile=None, **normalizer_config):
+    """
+    Normaliser, layout, the given rule engines, ConText and the closest
+    modifier resolver: the full pipeline the end-to-end tests run.
+    """
+    n = CaVaLang()
+    n.add_pipe("clinical_normalizer", config=normalizer_config)
+    n.add_pipe("document_layout")
+    for name, component in engines.items():
+        n.add_pipe(
+            "rule_engine",
+            name=name,
+            config={"engine_config_path": None, "component_name": component},
+        )
+    enable_context(n, profile=context_profile)
+    n.add_pipe("resolve_closest_context", last=True)
+    return n
+
+
+def doc_summary(doc):
+    """
+    Everything the full pipeline writes to ``doc``, for comparing docs
+    built in different ways.
+    """
+    return (
+        doc.text,
+        [(t.text, t.norm_, t.is_sent_start, t._.kind, t._.value) for t in doc],
+        [
+            (e.start, e.end, e.label_, e._.value, e._.is_negated, e._.is_current,
+             [str(m) for m in e._.modifiers])
+            for e in doc.ents
+        ],
+        {name: [(s.start, s.end, s.label_) for s in group] for name, group in doc.spans.items()},
+        doc._.parentheticals,
+        doc._.list_items,
+        str(doc._.context_graph),
+    )
+
+
+@pytest.fixture(scope="session")
+def nlp_full():
+    return build_pipeline()
 
 @pytest.fixture
 def temp_rules_dir(tmp_path: Path) -> Path:
@@ -0,0 +1,116 @@
+import pytest
+from cava_nlp import CaVaLang
+from cava_nlp.caching import (
+    DocCache,
+    ParagraphCache,
+    doc_from_bytes,
+    doc_to_bytes,
+    pipeline_fingerprint,
+)
+from .conftest import doc_summary
+
+NOTE = "- Patient is currently ECOG 2 (stable)\nNo KRAS today, weight 70.5kg on 12/03/2024"
+
+
+def test_doc_round_trip(nlp_full):
+    doc = nlp_full(NOTE)
+    restored = doc_from_bytes(nlp_full.vocab, doc_to_bytes(doc))
+    assert doc_summary(restored) == doc_summary(doc)
+    assert restored._.context_graph.targets[0].doc is restored
+
+
+def test_cache_hit_matches_fresh_run(nlp_full):
+    cache = DocCache(nlp_full)
+    first = cache(NOTE)
+    second = cache(NOTE)
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert second is not first
+    assert doc_summary(second) == doc_summary(first) == doc_summary(nlp_full(NOTE))
+
+
+def test_cache_keys_on_preprocessed_text(nlp_full):
+    cache = DocCache(nlp_full)
+    cache(NOTE)
+    spaced = NOTE.replace(" ", "   ")
+    doc = cache(spaced)
+    assert cache.hits == 1
+    # offset map still refers to the text that was passed in
+    tok = doc[-1]
+    start, end = doc._.offset_map.original_span(tok.idx, tok.idx + len(tok))
+    assert spaced[start:end] == tok.text
+
+
+def test_disk_tier_shared_between_caches(nlp_full, tmp_path):
+    DocCache(nlp_full, directory=tmp_path)(NOTE)
+    cache = DocCache(nlp_full, max_entries=0, directory=tmp_path)
+    doc = cache(NOTE)
+    assert (cache.disk_hits, cache.misses) == (1, 0)
+    assert doc_summary(doc) == doc_summary(nlp_full(NOTE))
+
+
+def test_memory_tier_evicts_oldest(nlp_full):
+    cache = DocCache(nlp_full, max_entries=1)
+    cache("ECOG 1")
+    cache("ECOG 2")
+    cache("ECOG 1")
+    assert (cache.hits, cache.misses) == (0, 3)
+
+
+def test_pipe_deduplicates_and_keeps_order(nlp_full):
+    cache = DocCache(nlp_full)
+    texts = ["ECOG 1", NOTE, "ECOG 1", "KRAS detected", NOTE]
+    docs = list(cache.pipe(texts, batch_size=4))
+    assert [d.text for d in docs] == [nlp_full(t).text for t in texts]
+    assert cache.misses == 3
+    assert doc_summary(docs[4]) == doc_summary(docs[1])
+
+
+def test_fingerprint_tracks_pipeline(nlp_full):
+    assert pipeline_fingerprint(nlp_full) == pipeline_fingerprint(nlp_full)
+    assert pipeline_fingerprint(nlp_full) != pipeline_fingerprint(CaVaLang())
+    assert pipeline_fingerprint(CaVaLang()) != pipeline_fingerprint(CaVaLang(masks=("phone",)))
+
+
+PARAGRAPHS = [
+    "- Patient is currently ECOG 2 (stable)\nNo KRAS today",
+    "Weight 70.5kg on 12/03/2024\nEGFR negative",
+    "Plan:\n1. ECOG 1 on review (good)",
+]
+
+
+def test_paragraph_cache_matches_full_run(nlp_full):
+    cache = ParagraphCache(nlp_full)
+    text = "\n\n".join(PARAGRAPHS)
+    doc = cache(text)
+    assert doc_summary(doc) == doc_summary(nlp_full(text))
+    modifiers = [m for e in doc.ents for m in e._.modifiers]
+    assert all(doc[m.modifier_span[0]:m.modifier_span[1]].doc is doc for m in modifiers)
+
+
+def test_paragraph_cache_reuses_unchanged_blocks(nlp_full):
+    cache = ParagraphCache(nlp_full)
+    cache("\n\n".join(PARAGRAPHS))
+    edited = [PARAGRAPHS[0], "EGFR positive", PARAGRAPHS[2]]
+    text = "\n\n".join(edited)
+    doc = cache(text)
+    assert (cache.blocks.hits, cache.blocks.misses) == (2, 4)
+    assert doc_summary(doc) == doc_summary(nlp_full(text))
+    tok = doc[-2]
+    start, end = doc._.offset_map.original_span(tok.idx, tok.idx + len(tok))
+    assert text[start:end] == tok.text
+
+
+def test_paragraph_cache_custom_boundary(nlp_full):
+    cache = ParagraphCache(nlp_full, boundary=r"\n(?=Plan:)")
+    text = PARAGRAPHS[0] + "\n" + PARAGRAPHS[2]
+    assert doc_summary(cache(text)) == doc_summary(nlp_full(text))
+    assert cache.blocks.misses == 2
+
+
+def test_paragraph_cache_merges_norm_index():
+    n = CaVaLang()
+    n.add_pipe("clinical_normalizer", config={"norm_index": True})
+    text = "\n\n".join(PARAGRAPHS + ["Hb 120 g/L, WCC 4.0-11.0"])
+    merged = ParagraphCache(n)(text)._.norm_index
+    assert list(merged.rows()) == list(n(text)._.norm_index.rows())
+    assert merged.units == ("kg", "g/l")
@@ -7,8 +7,7 @@ from spacy.language import Language
 from cava_nlp.normalisation.normaliser import ClinicalNormalizer
 from .load_fixtures import load_csv_rows
 from dataclasses import dataclass
-from cava_nlp.rule_engine import RuleEngine
-from cava_nlp.context.hooks import enable_context
+from .conftest import ENGINES, build_pipeline
 
 @dataclass
 class RuleEngineTestCase:
@@ -18,40 +17,18 @@ class RuleEngineTestCase:
     test_pipes: list[str]
     expected_attributes: dict
     doc: object  # processed spaCy Doc to avoid re-handling
+    xfail: bool = False  # the expected entities are known not to be found yet
+
+# rule engine component name -> engine config component
+ENTITY_ENGINES = {**ENGINES, "pgsga_value": "pgsga_value"}
 
 @pytest.fixture(scope="session")
 def nlp():
-    n = CaVaLang()
-    n.add_pipe("clinical_normalizer")
-    n.add_pipe("document_layout") 
-    # todo: iterate csv and pull in all in-scope rule engines to validate
-    n.add_pipe(
-        "rule_engine",
-        name="ecog_value",
-        config={
-            "engine_config_path": None,      
-            "component_name": "ecog_status",   
-        },
-    )
-    n.add_pipe(
-        "rule_engine",
-        name="variants_of_interest",
-        config={
-            "engine_config_path": None,      
-            "component_name": "variants_of_interest",   
-        },
-    )
-    n.add_pipe(
-        "rule_engine",
-        name="pgsga_value",
-        config={
-            "engine_config_path": None,       
-            "component_name": "pgsga_value",   
-        },
-    )
-    enable_context(n, profile="tests")
-    n.add_pipe("resolve_closest_context", last=True)
-    return n
+    return build_pipeline(ENTITY_ENGINES, context_profile="tests")
+
+@pytest.fixture(scope="session")
+def annotated_nlp():
+    return build_pipeline(ENTITY_ENGINES, context_profile="tests", merge=False)
 
 @pytest.fixture(params=load_csv_rows("entity_fixtures.csv"))
 def scenario(request, nlp):
@@ -71,7 +48,6 @@ def scenario(request, nlp):
     expected_attributes = ast.literal_eval(attr_raw) if attr_raw and attr_raw != "{}" else {}
     xfail_raw = row.get("XFail", "").strip().lower()
     xfail = xfail_raw in ("1", "true", "yes", "xfail")
-    request.applymarker(pytest.mark.xfail(reason=row["Test Case"])) if xfail else None
     doc = nlp(input_text)
 
     return RuleEngineTestCase(
@@ -80,14 +56,18 @@ def scenario(request, nlp):
         expected_entities=expected_entities,
         test_pipes=test_pipes,
         expected_attributes=expected_attributes,
-        doc=doc
+        doc=doc,
+        xfail=xfail,
     )
 
 def extract_ents(doc, label):
     return {sp: sp.label_ for sp in doc.ents if sp.label_==label}
 
-def test_rule_engine_from_csv(scenario):
+def test_rule_engine_from_csv(scenario, request):
     sc = scenario
+    # marked here rather than in the fixture, so that tests comparing
+    # pipelines on the same scenarios do not inherit the mark
+    request.applymarker(pytest.mark.xfail(reason=sc.name)) if sc.xfail else None
 
     for pipe in sc.test_pipes:
         spans = extract_ents(sc.doc, pipe)
@@ -152,4 +132,15 @@ def test_rule_engine_from_csv(scenario):
                     f"INPUT:       {sc.input!r}\n"
                     f"EXPECTED:    {expected_val}\n"
                     f"ACTUAL:      {actual_val}\n"
-                )
\ No newline at end of file
+                )
+
+def _entities(doc):
+    return [
+        (e.text, e.label_, e._.value, e._.is_negated, e._.is_current)
+        for e in doc.ents
+    ]
+
+def test_annotated_matches_merged(scenario, annotated_nlp):
+    doc = annotated_nlp(scenario.input)
+    assert len(doc) == len(annotated_nlp.make_doc(annotated_nlp.preprocess(scenario.input)))
+    assert _entities(doc) == _entities(scenario.doc)
@@ -6,6 +6,16 @@ from cava_nlp.tokenization.exceptions import (
     build_clinical_symbol_exceptions
 )
 
+def test_import_is_lazy():
+    import subprocess, sys
+    code = (
+        "import sys, cava_nlp; "
+        "assert not {'spacy', 'medspacy', 'dateparser'} & set(sys.modules); "
+        "cava_nlp.CaVaLang(sentencizer='clinical'); "
+        "assert not {'medspacy', 'dateparser'} & set(sys.modules)"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
 def test_language_registered():
     nlp = spacy.blank("cava_lang")
     assert nlp.lang == "cava_lang"
@@ -51,6 +61,112 @@ def test_unit_slash_exceptions(nlp_cava):
     assert doc[0].norm_ == "unit_num"
     assert doc[2].norm_ == "unit_denom"
 
+@pytest.mark.parametrize("text", ["mcg/m2", "10mg/kg/day", "(mL/hr)"])
+def test_unit_slash_norms_in_context(nlp_cava, text):
+    doc = nlp_cava(text)
+    norms = [t.norm_ for t in doc]
+    assert "unit_num" in norms and "unit_denom" in norms
+
+def test_unit_slash_needs_units_on_both_sides(nlp_cava):
+    doc = nlp_cava("mg/day and xmg/kg and mg / kg")
+    assert not {"unit_num", "unit_denom"} & {t.norm_ for t in doc}
+
+@pytest.mark.parametrize("text", ["c1", "C6", "c1d1", "C3D21", "c12d28", "C8D15"])
+def test_cycle_day_tokens(nlp_cava, text):
+    doc = nlp_cava(f"due {text}.")
+    assert doc[1].text == text
+    assert doc[1].norm_ == "cycle_day"
+
+def test_cava_tokenizer_in_config(nlp_cava):
+    from cava_nlp.tokenization.tokenizer import CaVaTokenizer
+
+    assert nlp_cava.config["nlp"]["tokenizer"]["@tokenizers"] == "cava_nlp.Tokenizer.v1"
+    assert isinstance(nlp_cava.tokenizer, CaVaTokenizer)
+
+def test_tokenizer_artefact_roundtrip(tmp_path):
+    from cava_nlp.tokenization.artefact import load_tokenizer_artefact, tokenizer_fingerprint
+
+    path = tmp_path / "tokenizer.json"
+    text = "Cisplatin 75mg/m2 C3D8, ECOG 1 (good)."
+    built = CaVaLang(sentencizer="clinical", tokenizer_artefact=path)
+    assert path.exists()
+    loaded = CaVaLang(sentencizer="clinical", tokenizer_artefact=path)
+
+    saved = load_tokenizer_artefact(path, tokenizer_fingerprint(CaVaLang.Defaults))
+    assert saved is not None
+    patterns, rules = saved
+    for attr in ("prefix_search", "suffix_search", "infix_finditer", "token_match"):
+        assert patterns[attr].__self__ == getattr(built.tokenizer, attr).__self__
+    assert loaded.tokenizer.rules == built.tokenizer.rules
+    assert [(t.text, t.norm_) for t in loaded(text)] == [(t.text, t.norm_) for t in built(text)]
+
+def test_tokenizer_artefact_stale_fingerprint(tmp_path):
+    from cava_nlp.tokenization.artefact import load_tokenizer_artefact, save_tokenizer_artefact
+
+    path = tmp_path / "tokenizer.json"
+    save_tokenizer_artefact(CaVaLang(sentencizer="clinical").tokenizer, path, "other rules")
+    assert load_tokenizer_artefact(path, "current rules") is None
+    assert load_tokenizer_artefact(tmp_path / "missing.json", "current rules") is None
+
+@pytest.mark.parametrize(
+    "content", ["truncated", "unrelated", "binary", "shape", "pattern", "method", "rules"],
+)
+def test_tokenizer_artefact_unreadable_is_rebuilt(tmp_path, content):
+    import json
+    from cava_nlp.tokenization.artefact import (
+        ARTEFACT_VERSION, load_tokenizer_artefact, tokenizer_fingerprint,
+    )
+
+    path = tmp_path / "tokenizer.json"
+    fingerprint = tokenizer_fingerprint(CaVaLang.Defaults)
+    CaVaLang(tokenizer_artefact=path)
+    saved = json.loads(path.read_text())
+
+    def edited(**changes):
+        return json.dumps({**saved, **changes}).encode()
+
+    data = {
+        "truncated": path.read_bytes()[:100],
+        "unrelated": b"not an artefact",
+        "binary": b"\x80\x04\x95",
+        "shape": json.dumps([ARTEFACT_VERSION, fingerprint]).encode(),
+        "pattern": edited(patterns={**saved["patterns"], "prefix_search": ["search", "(", 32]}),
+        "method": edited(patterns={**saved["patterns"], "prefix_search": ["__class__", "a", 32]}),
+        "rules": edited(rules={"mg": [{"NOT_AN_ATTR": "mg"}]}),
+    }[content]
+    path.write_bytes(data)
+    assert load_tokenizer_artefact(path, fingerprint) is None
+    # a stale artefact is rebuilt and rewritten
+    nlp = CaVaLang(tokenizer_artefact=path)
+    assert [t.text for t in nlp("ECOG 1 (good).")] == ["ECOG", "1", "(", "good", ")", "."]
+    assert load_tokenizer_artefact(path, fingerprint) is not None
+
+def test_tokenizer_artefact_invalid_special_case_is_rejected(tmp_path):
+    import json
+    from cava_nlp.tokenization.artefact import save_tokenizer_artefact, tokenizer_fingerprint
+
+    path = tmp_path / "tokenizer.json"
+    save_tokenizer_artefact(CaVaLang().tokenizer, path, tokenizer_fingerprint(CaVaLang.Defaults))
+    saved = json.loads(path.read_text())
+    saved["rules"]["mg"] = [{"ORTH": "m"}]
+    path.write_text(json.dumps(saved))
+    # loaded special cases still go through spaCy's validation
+    with pytest.raises(ValueError):
+        CaVaLang(tokenizer_artefact=path)
+
+def test_tokenizer_artefact_failed_save_leaves_no_file(tmp_path, monkeypatch):
+    import json
+    from cava_nlp.tokenization.artefact import save_tokenizer_artefact
+
+    def fail(*args, **kwargs):
+        raise OSError("boom")
+
+    tokenizer = CaVaLang().tokenizer
+    monkeypatch.setattr(json, "dump", fail)
+    with pytest.raises(OSError):
+        save_tokenizer_artefact(tokenizer, tmp_path / "tokenizer.json", "rules")
+    assert list(tmp_path.iterdir()) == []
+
 def test_prefix_suffix_pruning():
     from cava_nlp.tokenization.builder import build_cava_prefixes, build_cava_suffixes
 
@@ -88,3 +204,19 @@ def test_roundtrip(nlp_cava, text):
     assert doc.text.replace(" ", "") == text.replace(" ", "")
 
 
+
+def test_pipe_matches_call(nlp_cava, raw_text):
+    texts = [raw_text, "Hello   world", "contact a@b.org\n\n\nnow"]
+    piped = list(nlp_cava.pipe(texts, batch_size=2))
+    for text, doc in zip(texts, piped):
+        single = nlp_cava(text)
+        assert doc.text == single.text
+        assert [t.text for t in doc] == [t.text for t in single]
+        assert doc._.offset_map == single._.offset_map
+
+
+def test_pipe_as_tuples(nlp_cava):
+    piped = list(nlp_cava.pipe([("mail x@y.com", 1), ("a  b", 2)], as_tuples=True))
+    assert [ctx for _, ctx in piped] == [1, 2]
+    assert "@" not in piped[0][0].text
+    assert piped[1][0].text == "a b"
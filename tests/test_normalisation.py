@@ -5,6 +5,8 @@ import os
 from cava_nlp import CaVaLang
 from spacy.language import Language
 from cava_nlp.normalisation.normaliser import ClinicalNormalizer
+from cava_nlp.normalisation import ParseCache
+from cava_nlp.normalisation.normaliser import normalize_time
 from .load_fixtures import parse_token_list, load_csv_rows
 
 from dataclasses import dataclass
@@ -101,3 +103,276 @@ def test_extensions_from_csv(scenario):
         f"EXPECTED:    {expected_ext}\n"
         f"ACTUAL:      {actual_ext}\n"
     )
+
+@pytest.fixture(scope="session")
+def fused_nlp():
+    n = CaVaLang()
+    n.add_pipe("clinical_normalizer", config={"fused": True})
+    return n
+
+def _normalised(doc):
+    tokens = [
+        (t.text, t.norm_, t._.kind, t._.value, t._.unit, t._.low, t._.high)
+        for t in doc
+    ]
+    groups = {
+        label: [(s.start, s.end) for s in group]
+        for label, group in doc.spans.items()
+    }
+    return tokens, groups
+
+def test_fused_matches_sequential(scenario, fused_nlp):
+    assert _normalised(fused_nlp(scenario.input)) == _normalised(scenario.doc)
+
+def test_fused_keeps_normaliser_priority(fused_nlp):
+    # 4-11 is also a range match, but dates come first
+    doc = fused_nlp("Reviewed 12/03/2024 at 7:30pm on 4-11, WCC 4.0-11.0 x10^9/L, weight 70kg.")
+    kinds = {t.text: t._.kind for t in doc if t._.kind}
+    assert kinds == {
+        "12/03/2024": "date",
+        "4-11": "date",
+        "7:30pm": "time",
+        "4.0-11.0": "range",
+        "x10^9": "scientific",
+        "70kg": "unit_norm",
+    }
+    assert [s.text for s in doc.spans["date"]] == ["12/03/2024", "4-11"]
+    assert [s.text for s in doc.spans["range"]] == ["4.0-11.0"]
+
+def test_parse_cache_is_bounded_and_caches_failures():
+    cache = ParseCache(max_entries=2)
+    calls = []
+
+    def parse(text):
+        calls.append(text)
+        return None if text == "bad" else text.upper()
+
+    assert cache.lookup("ns", "a", parse) == "A"
+    assert cache.lookup("ns", "bad", parse) is None
+    assert cache.lookup("ns", "bad", parse) is None
+    assert cache.lookup("other", "a", parse) == "A"
+    assert calls == ["a", "bad", "a"]
+    assert cache.stats()["entries"] == 2
+    assert cache.lookup("ns", "a", parse) == "A"  # evicted
+    assert (cache.hits, cache.misses) == (1, 4)
+
+def test_parse_cache_disk_tier_is_shared(tmp_path):
+    text = "Seen 12/03/2024 at 7:30pm"
+    first = CaVaLang()
+    first.add_pipe("clinical_normalizer", config={"parse_cache_dir": str(tmp_path)})
+    second = CaVaLang()
+    second.add_pipe("clinical_normalizer", config={"parse_cache_dir": str(tmp_path)})
+
+    norms = [t.norm_ for t in first(text)]
+    assert [t.norm_ for t in second(text)] == norms
+    assert "2024-03-12" in norms and "19:30" in norms
+
+    cache = second.get_pipe("clinical_normalizer").parse_cache
+    assert (cache.disk_hits, cache.misses) == (1, 0)
+    assert cache.hit_rate == 1.0
+
+@pytest.fixture(scope="session")
+def structural_nlp():
+    n = CaVaLang()
+    n.add_pipe("clinical_normalizer", config={"structural_dates": True})
+    return n
+
+def test_structural_dates_match_dateparser(scenario, structural_nlp):
+    assert _normalised(structural_nlp(scenario.input)) == _normalised(scenario.doc)
+
+@pytest.mark.parametrize("text,expected", [
+    ("seen 12/03/2024", "2024-03-12"),
+    ("seen 2024-03-12", "2024-03-12"),
+    ("seen 1/1/68", "2068-01-01"),
+    ("seen 1/1/69", "1969-01-01"),
+    ("seen 12-03-2024 10:22:11", "2024-03-12"),
+    ("seen 1-Jan-85", "1985-01-01"),
+    ("seen 4 Sept 2020", "2020-09-04"),
+    ("seen Sep 2020", "2020-09-01"),
+    ("seen 3/2020", "2020-03-01"),
+    ("seen Jan '20", "2020-01-01"),
+    ("seen 31/02/2024", "31/02/2024"),
+    ("seen 03/25/2024", "03/25/2024"),
+])
+def test_structural_dates(structural_nlp, text, expected):
+    dates = [t.norm_ for t in structural_nlp(text) if t._.kind == "date"]
+    assert dates == [expected]
+
+@pytest.mark.parametrize("text", [
+    "on 99999999999999999999-1-2020 ok",
+    "on 1-99999999999999999999-2020 ok",
+    "on 1-1-99999999999999999999 ok",
+])
+def test_structural_dates_long_digit_runs(nlp, structural_nlp, text):
+    # out of range for date(): left as dateparser leaves it, not raised
+    assert _normalised(structural_nlp(text)) == _normalised(nlp(text))
+
+def test_structural_date_order_and_fallback():
+    n = CaVaLang()
+    n.add_pipe("clinical_normalizer", config={"structural_dates": True, "date_order": "MDY"})
+    dates = n.get_pipe("clinical_normalizer").normalizers[0]
+    calls = []
+    parse = dates.parse
+    dates.parse = lambda text: calls.append(text) or parse(text)
+
+    doc = n("seen 03/25/2024 and 12/03/2024, review Sep-12")
+    # only the ambiguous span is handed to dateparser
+    assert calls == ["Sep-12"]
+    assert [t.norm_ for t in doc if t._.kind == "date"] == [
+        "2024-03-25", "2024-12-03", parse("Sep-12"),
+    ]
+
+@pytest.mark.parametrize("text,expected", [
+    ("7pm", "19:00"),
+    ("7 pm", "19:00"),
+    ("7:30 p.m.", "19:30"),
+    ("7.30am", "07:30"),
+    ("12am", "00:00"),
+    ("12:15pm", "12:15"),
+    ("0:05", "00:05"),
+    ("7:30:15", "07:30"),
+    ("1330 hrs", "13:30"),
+    ("0800hr", "08:00"),
+    ("19:30 hrs", "19:30"),
+    ("7 o'clock", "07:00"),
+    ("seven pm", "19:00"),
+    ("13 pm", None),
+    ("8 hrs", None),
+    ("24:00", None),
+    ("7.30", None),
+])
+def test_normalize_time(text, expected):
+    assert normalize_time(text) == expected
+
+@pytest.fixture(scope="session")
+def index_nlp():
+    n = CaVaLang()
+    n.add_pipe("clinical_normalizer", config={"norm_index": True})
+    return n
+
+def test_norm_index_matches_token_attributes(scenario, index_nlp):
+    doc = index_nlp(scenario.input)
+    index = doc._.norm_index
+    assert not doc.spans
+    expected_groups = {
+        label: [(s.start, s.end) for s in group]
+        for label, group in scenario.doc.spans.items()
+    }
+    assert {
+        label: [(s.start, s.end) for s in index.span_group(doc, label)]
+        for label in index.kinds if index.mask(label).any()
+    } == expected_groups
+    for (start, end, kind, value, unit, low, high), i in zip(index.rows(), index.tokens(doc)):
+        token = doc[i]
+        assert (token.idx, token.idx + len(token)) == (start, end)
+        assert kind == token._.kind
+        if isinstance(token._.value, float):
+            assert value == token._.value
+        assert unit == (token._.unit if kind == "unit_norm" else None)
+        assert (low, high) == ((token._.low, token._.high) if kind == "range" else (None, None))
+
+def test_norm_index_arrays(index_nlp):
+    doc = index_nlp("Wt 70.5kg, Hb 120 g/L, WCC 4.0-11.0 on 12/03/2024, T 36.9")
+    index = doc._.norm_index
+    assert index.units == ("kg", "g/l")
+    with_units = index.with_units()
+    assert index.value[with_units].tolist() == [70.5, 120.0]
+    assert [index.units[u] for u in index.unit[with_units]] == ["kg", "g/l"]
+    ranges = index.mask("range")
+    assert (index.low[ranges].tolist(), index.high[ranges].tolist()) == ([4.0], [11.0])
+    assert index.value[index.mask("decimal")].tolist() == [36.9]
+    assert [doc[i].text for i in index.tokens(doc, index.mask("date"))] == ["12/03/2024"]
+    assert [doc.text[s:e] for s, e in zip(index.start[ranges], index.end[ranges])] == ["4.0-11.0"]
+
+def test_norm_index_survives_merging_engine(tmp_path):
+    import yaml
+    import cava_nlp.rule_engine  # noqa: F401 (registers the rule_engine factory)
+
+    path = tmp_path / "stage.yaml"
+    path.write_text(yaml.safe_dump({"components": {"stage": {
+        "factory": "rule_engine",
+        "config": {
+            "span_label": "stage",
+            "merge_ents": True,
+            "patterns": {"stage": {
+                "token_patterns": [[{"LOWER": "stage"}, {"LOWER": "four"}, {"LOWER": "disease"}]],
+                "value": 4,
+            }},
+        },
+    }}}))
+    n = CaVaLang()
+    n.add_pipe("clinical_normalizer", config={"norm_index": True})
+    n.add_pipe(
+        "rule_engine",
+        name="stage",
+        config={"engine_config_path": str(path), "component_name": "stage"},
+    )
+    doc = n("stage four disease, weight 70.5 kg on 12/03/2024")
+    # the engine merged three tokens after the index was built
+    assert doc[0].text == "stage four disease"
+    index = doc._.norm_index
+    assert [s.text for s in index.span_group(doc, "date")] == ["12/03/2024"]
+    assert [s.text for s in index.span_group(doc, "unit_norm")] == ["70.5 kg"]
+    assert [doc[i].text for i in index.tokens(doc)] == [t.text for t in doc if t._.kind]
+
+def test_selected_normalizers(nlp):
+    n = CaVaLang()
+    n.add_pipe("clinical_normalizer", config={"normalizers": ["unit_norm"]})
+    doc = n("Weight 70 kg on 12/03/2024")
+    assert [t.text for t in doc.spans["unit_norm"]] == ["70 kg"]
+    assert "date" not in doc.spans
+    with pytest.raises(ValueError, match="Unknown normalizers"):
+        ClinicalNormalizer(nlp, normalizers=["date", "decimal"])
+
+@pytest.fixture(scope="session")
+def annotated_nlp():
+    n = CaVaLang()
+    n.add_pipe("clinical_normalizer", config={"merge": False})
+    return n
+
+def test_annotated_matches_merged(scenario, annotated_nlp):
+    doc = annotated_nlp(scenario.input)
+    assert doc._.norm_annotated
+    assert len(doc) == len(annotated_nlp.make_doc(annotated_nlp.preprocess(scenario.input)))
+    merged = {
+        label: [(s.text, s[0].norm_, s[0]._.kind, s[0]._.value, s[0]._.unit) for s in group]
+        for label, group in scenario.doc.spans.items()
+    }
+    assert {
+        label: [(s.text, s[0].norm_, s[0]._.kind, s[0]._.value, s[0]._.unit) for s in group]
+        for label, group in doc.spans.items()
+    } == merged
+
+def test_annotated_spans(annotated_nlp):
+    doc = annotated_nlp("WCC 4.0-11.0 x10^9/L on 12/03/2024")
+    assert [t.text for t in doc][:4] == ["WCC", "4.0", "-", "11.0"]
+    (span,) = doc.spans["range"]
+    assert span.text == "4.0-11.0"
+    assert (span._.low, span._.high) == (4.0, 11.0)
+    assert [t._.norm_part for t in span] == ["head", "inside", "inside"]
+    assert span[0]._.norm_text == "4.0-11.0"
+    with pytest.raises(ValueError, match="merge"):
+        ClinicalNormalizer(annotated_nlp, merge=False, norm_index=True)
+
+@pytest.mark.parametrize("pattern,expected", [
+    ([{"LOWER": "wcc"}, {"_": {"range": True}}], ["WCC 4.0-11.0"]),
+    ([{"_": {"kind": {"IN": ["range"]}}}], ["4.0-11.0"]),
+    ([{"LIKE_NUM": True}], ["3.5"]),
+    ([{"IS_PUNCT": True}], [","]),
+    ([{"LOWER": "4.0-11.0"}], ["4.0-11.0"]),
+    ([{"_": {"range": True}, "LENGTH": 8}], ["4.0-11.0"]),
+    ([{}, {"LOWER": "hb"}], [", Hb"]),
+    ([{"LOWER": "11.0"}], []),
+])
+def test_annotation_matcher(annotated_nlp, pattern, expected):
+    from cava_nlp.normalisation.annotation import AnnotationMatcher
+
+    text = "WCC 4.0-11.0, Hb 3.5"
+    matcher = AnnotationMatcher(annotated_nlp.vocab)
+    matcher.add("test", [pattern])
+    doc = annotated_nlp(text)
+    assert [doc[s:e].text for _, s, e in matcher(doc)] == expected
+    merged = CaVaLang()
+    merged.add_pipe("clinical_normalizer")
+    merged_doc = merged(text)
+    assert [merged_doc[s:e].text for _, s, e in matcher(merged_doc)] == expected
@@ -0,0 +1,263 @@
+import time
+
+import pytest
+import yaml
+from spacy.language import Language
+from cava_nlp import CaVaLang
+from cava_nlp.context.hooks import enable_context
+from cava_nlp.pipeline import (
+    KeywordTriage,
+    TimeBudget,
+    consumed_normalizers,
+    extract_columns,
+    prune_normalizers,
+    short_text_pipeline,
+)
+from cava_nlp.pipeline.pruning import token_consumers
+from cava_nlp.pipeline.triage import compile_trie, pattern_anchors
+from cava_nlp.rule_engine import RuleEngine
+from cava_nlp.structural.document_layout import DocumentLayout
+
+NOTE = "- Patient is currently ECOG 2 (stable)\nNo KRAS today, weight 70.5kg"
+
+
+@pytest.fixture(scope="module")
+def nlp():
+    n = CaVaLang()
+    n.add_pipe("clinical_normalizer")
+    n.add_pipe("document_layout")
+    n.add_pipe(
+        "rule_engine",
+        name="ecog_value",
+        config={"engine_config_path": None, "component_name": "ecog_status"},
+    )
+    n.add_pipe(
+        "rule_engine",
+        name="variants_of_interest",
+        config={"engine_config_path": None, "component_name": "variants_of_interest"},
+    )
+    enable_context(n)
+    n.add_pipe("resolve_closest_context", last=True)
+    return n
+
+
+def _spans(doc, name):
+    return [
+        (s.text, s._.value, s._.is_negated, s._.is_current)
+        for s in doc.spans.get(name, [])
+    ]
+
+
+def test_plan_keeps_only_dependencies(nlp):
+    plan = nlp.component_plan({"ecog"})
+    assert "variants_of_interest" not in plan.components
+    assert plan.components[:2] == ("medspacy_pysbd", "clinical_normalizer")
+    assert "medspacy_context" in plan.components
+    assert nlp.component_plan({"ECOG"}) == plan
+
+
+def test_selected_outputs_match_full_run(nlp):
+    full = nlp(NOTE)
+    for name, other in (("ecog", "variant"), ("variant", "ecog")):
+        doc = nlp(NOTE, outputs={name})
+        assert _spans(doc, name) == _spans(full, name)
+        assert other not in doc.spans
+
+
+def test_pipe_with_outputs(nlp):
+    docs = list(nlp.pipe([NOTE, "no findings"], outputs=["variant"]))
+    assert _spans(docs[0], "variant") == _spans(nlp(NOTE), "variant")
+    assert [(d.text, c) for d, c in nlp.pipe([(NOTE, 1)], as_tuples=True, outputs=["ecog"])] == [
+        (nlp(NOTE).text, 1)
+    ]
+
+
+def test_context_skipped_without_targets(nlp):
+    doc = nlp("No KRAS today", outputs={"ecog"})
+    assert not doc.ents
+    assert doc._.context_graph is None
+
+
+def test_unknown_output_raises(nlp):
+    with pytest.raises(ValueError, match="Unknown outputs"):
+        nlp("ECOG 1", outputs={"weight"})
+
+
+def test_trie_finds_overlapping_anchors():
+    scanner = compile_trie(["pd", "pdl", "dl1"])
+    assert {m.group(1) for m in scanner.finditer("xpdl1")} == {"pdl", "dl1"}
+
+
+def test_pattern_anchors_pick_required_literals():
+    pattern = [
+        {"LOWER": "g"},
+        {"TEXT": {"IN": ["12", "13"]}},
+        {"LOWER": "x", "OP": "?"},
+    ]
+    assert pattern_anchors(pattern) == {"12", "13"}
+    assert pattern_anchors([{"LIKE_NUM": True}]) is None
+
+
+def test_triage_skips_and_selects(nlp):
+    triage = KeywordTriage(nlp)
+    assert triage.outputs_for("ECOG 1 today") >= {"ecog"}
+    assert "ecog" not in triage.outputs_for("KRAS G12D")
+
+    skipped = triage("Reviewed in clinic, no change.")
+    assert skipped.text == "Reviewed in clinic, no change."
+    assert not skipped.spans
+    doc = triage(NOTE)
+    assert _spans(doc, "ecog") == _spans(nlp(NOTE), "ecog")
+    assert (triage.docs, triage.skipped_docs) == (2, 1)
+    assert triage.skipped_chars == len("Reviewed in clinic, no change.")
+
+
+@Language.component("test_slow_component")
+def _slow_component(doc):
+    doc.spans["slow"] = [doc[0:1]]
+    time.sleep(0.5)
+    return doc
+
+
+@pytest.fixture()
+def nlp_slow():
+    n = CaVaLang(sentencizer="clinical")
+    n.add_pipe("clinical_normalizer")
+    n.add_pipe("test_slow_component")
+    n.add_pipe(
+        "rule_engine",
+        name="ecog_value",
+        config={"engine_config_path": None, "component_name": "ecog_status"},
+    )
+    return n
+
+
+def test_budget_abandons_slow_component(nlp_slow):
+    budget = TimeBudget(nlp_slow, per_component={"test_slow_component": 0.05})
+    start = time.perf_counter()
+    doc = budget("ECOG 1 today")
+    assert time.perf_counter() - start < 0.4
+    assert doc._.degraded == ("test_slow_component",)
+    assert "slow" not in doc.spans
+    assert [s.text for s in doc.spans["ecog"]] == ["ECOG 1"]
+    assert budget.timeouts == {"test_slow_component": 1}
+    assert budget.degraded_docs == 1
+
+
+def test_budget_per_doc_skips_remaining(nlp_slow):
+    budget = TimeBudget(nlp_slow, per_doc=0.05)
+    doc = budget("ECOG 1 today")
+    assert doc._.degraded == ("test_slow_component", "ecog_value")
+    assert "ecog" not in doc.spans
+
+
+def test_budget_without_timeouts_matches_pipeline(nlp):
+    doc = TimeBudget(nlp, per_doc=30, per_component=10)(NOTE)
+    assert doc._.degraded == ()
+    assert _spans(doc, "ecog") == _spans(nlp(NOTE), "ecog")
+
+
+def test_budget_rejects_bad_limits(nlp):
+    with pytest.raises(ValueError):
+        TimeBudget(nlp, per_doc=0)
+    with pytest.raises(ValueError, match="Unknown components"):
+        TimeBudget(nlp, per_component={"missing": 1.0})
+
+
+def test_short_text_pipeline():
+    short = short_text_pipeline(["ecog_status"])
+    assert short.pipe_names == ["single_sentence", "clinical_normalizer", "ecog_status"]
+    doc = short("ecog 0-1")
+    assert [s.text for s in doc.spans["ecog"]] == ["ecog 0-1"]
+    # dates at the start of a field match the IS_SENT_START patterns
+    assert short("12/03/2024")[0]._.kind == "date"
+
+
+def test_extract_columns_collapses_duplicates(monkeypatch):
+    short = short_text_pipeline(["ecog_status"])
+    seen = []
+    pipe = short.pipe
+    monkeypatch.setattr(short, "pipe", lambda texts, **kw: pipe(seen.extend(texts) or seen, **kw))
+    column = ["ECOG 1", None, "ECOG 1", "no data", "ecog 2", float("nan"), "ECOG 1"]
+    out = extract_columns(short, column)
+    assert sorted(seen) == ["ECOG 1", "ecog 2", "no data"]
+    assert list(out) == ["ecog"]
+    assert out["ecog"] == [1, None, 1, None, 2, None, 1]
+
+
+NUMBERS = {"date", "time", "unit_norm", "range"}
+
+
+@pytest.mark.parametrize("token, expected", [
+    ({"_": {"range": True}}, {"range"}),
+    ({"_": {"is_bullet": True}}, {"bullet"}),
+    ({"_": {"kind": {"IN": ["date"]}}}, {"date"}),
+    # decimals come from the tokenizer and may be merged into a unit or range
+    ({"_": {"kind": "decimal"}}, NUMBERS),
+    ({"_": {"kind": {"NOT_IN": ["date"]}}}, NUMBERS),
+    ({"LIKE_NUM": True}, NUMBERS),
+    ({"NORM": "unit_num"}, NUMBERS),
+    ({"LOWER": "kras"}, set()),
+    ({"LOWER": {"IN": ["kg", "weight"]}, "OP": "?"}, {"unit_norm"}),
+    ({"LOWER": "to"}, {"range"}),
+])
+def test_token_consumers(nlp, token, expected):
+    assert token_consumers(token, nlp.vocab) == expected
+
+
+def _pipeline(components, engine_config_path=None, **normalizer_config):
+    n = CaVaLang()
+    n.add_pipe("clinical_normalizer", config=normalizer_config)
+    for component in components:
+        n.add_pipe(
+            "rule_engine",
+            name=component,
+            config={"engine_config_path": engine_config_path, "component_name": component},
+        )
+    return n
+
+
+def test_consumed_normalizers(nlp):
+    assert consumed_normalizers(nlp) == {"date", "time", "unit_norm", "range", "bullet"}
+    assert consumed_normalizers(_pipeline(["ecog_status"])) == NUMBERS
+
+
+def test_prune_normalizers_keeps_outputs():
+    full, pruned = _pipeline(["ecog_status"]), _pipeline(["ecog_status"])
+    assert prune_normalizers(pruned) == ("date", "time", "unit_norm", "range")
+    assert [n.NAME for n in pruned.get_pipe("clinical_normalizer").normalizers] == [
+        "date", "time", "unit_norm", "range",
+    ]
+    for text in (NOTE, "1. ECOG 0-1 on 4-11", "ecog 2 at 7pm"):
+        assert _spans(pruned(text), "ecog") == _spans(full(text), "ecog")
+
+
+def test_prune_normalizers_literal_engine(tmp_path):
+    path = tmp_path / "keywords.yaml"
+    path.write_text(yaml.safe_dump({"components": {"smoking_status": {
+        "factory": "rule_engine",
+        "config": {
+            "span_label": "smoking",
+            "patterns": {"smoker": {
+                "token_patterns": [[{"LOWER": {"IN": ["smoker", "smoking"]}}]],
+                "value": "yes",
+            }},
+        },
+    }}}))
+    n = _pipeline(["smoking_status"], engine_config_path=str(path))
+    assert prune_normalizers(n) == ()
+    doc = n("Ex-smoker, 70.5kg on 12/03/2024")
+    assert [s.text for s in doc.spans["smoking"]] == ["smoker"]
+    # the pruned normalisers' extensions are still registered
+    assert not any(t._.date or t._.unit for t in doc)
+    # decimals still come from the tokenizer
+    assert [s.text for s in doc.spans["decimal"]] == ["70.5"]
+
+
+def test_prune_normalizers_force():
+    n = _pipeline(["ecog_status"], force_normalizers=["bullet"])
+    assert prune_normalizers(n) == ("date", "time", "unit_norm", "range", "bullet")
+    n = _pipeline(["ecog_status"])
+    assert prune_normalizers(n, force=["bullet"])[-1] == "bullet"
+    with pytest.raises(ValueError, match="Unknown normalizers"):
+        prune_normalizers(n, force=["decimal"])
@@ -0,0 +1,115 @@
+import random
+import re
+import time
+import pytest
+from cava_nlp.tokenization.masking import MaskPattern, resolve_mask_patterns
+from cava_nlp.tokenization.preprocess import (
+    EMAIL_MASK,
+    OffsetMap,
+    preprocess_text,
+    whitespace_preprocess,
+)
+
+
+def _reference(text, chars=(' ', '\n')):
+    # original two-stage behaviour: per-char condensing, then email masking
+    for char in chars:
+        out, last = [], None
+        for c in text:
+            if c != char or last != char:
+                out.append(c)
+            last = c
+        text = "".join(out)
+    return re.sub(EMAIL_MASK, lambda m: "x" * len(m.group()), text)
+
+
+def test_preprocess_matches_reference():
+    rng = random.Random(7)
+    alphabet = ["a", "b", " ", "\n", "@", ".", "1", "c.org"]
+    for _ in range(500):
+        text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 40)))
+        assert preprocess_text(text)[0] == _reference(text)
+
+
+def test_whitespace_preprocess_condenses():
+    assert whitespace_preprocess("a   b\n\n\nc", (" ", "\n")) == "a b\nc"
+
+
+def test_offset_map_round_trip():
+    raw = "ECOG   1\n\n\nmail me@x.com  now"
+    text, offsets = preprocess_text(raw)
+    assert text == "ECOG 1\nmail xxxxxxxx now"
+    for i, ch in enumerate(text):
+        j = offsets.to_original(i)
+        if ch != "x":
+            assert raw[j] == ch
+        assert offsets.to_processed(j) == i
+    start = text.index("now")
+    assert raw[slice(*offsets.original_span(start, start + 3))] == "now"
+
+
+def test_offset_map_identity_without_changes():
+    text, offsets = preprocess_text("plain text")
+    assert offsets == OffsetMap()
+    assert offsets.to_original(3) == 3
+
+
+def test_doc_offset_map(nlp_cava):
+    raw = "Weight   70kg\n\n\nECOG 1"
+    doc = nlp_cava(raw)
+    ecog = doc[-2]
+    start, end = doc._.offset_map.original_span(ecog.idx, ecog.idx + len(ecog))
+    assert raw[start:end] == "ECOG"
+
+
+@pytest.mark.parametrize("name, text, masked", [
+    ("phone", "call 0412 345 678 today", "call xxxxxxxxxxxx today"),
+    ("phone", "ph (02) 9123 4567", "ph xxxxxxxxxxxxxx"),
+    ("mrn", "MRN: 1234567 seen", "xxxxxxxxxxxx seen"),
+    ("medicare", "card 2123 45670 1/2", "card xxxxxxxxxxxxxx"),
+])
+def test_named_masks(name, text, masked):
+    patterns = resolve_mask_patterns((name,))
+    assert preprocess_text(text, masks=patterns)[0] == masked
+
+
+@pytest.mark.parametrize("name, text", [
+    ("phone", "call 0412  345 678 now"),
+    ("phone", "call +61  412   345 678 now"),
+    ("medicare", "card 2123  45670   1 now"),
+])
+def test_named_masks_across_whitespace_runs(name, text):
+    # masks run on the raw text, before the spaces are condensed
+    from cava_nlp import CaVaLang
+    nlp = CaVaLang(masks=(name,))
+    masked = nlp(text).text
+    assert not any(c.isdigit() for c in masked)
+    assert masked.startswith(text.split()[0] + " x") and masked.endswith("x now")
+
+
+def test_named_masks_leave_clinical_values():
+    patterns = resolve_mask_patterns(("email", "phone", "mrn", "medicare"))
+    text = "ECOG 1, weight 70.5kg, c2d8, 12/03/2024"
+    assert preprocess_text(text, masks=patterns)[0] == text
+
+
+def test_unknown_mask_raises():
+    with pytest.raises(ValueError):
+        resolve_mask_patterns(("ssn",))
+
+
+def test_custom_mask_pattern():
+    from cava_nlp import CaVaLang
+    nlp = CaVaLang(masks=("email", MaskPattern("ward", r"Ward \d+")))
+    doc = nlp("seen on Ward 12 by a@b.com")
+    assert "Ward" not in doc.text
+    assert "a@b.com" not in doc.text
+
+
+def test_masks_linear_on_near_misses():
+    # the previous email regex took seconds on this input
+    patterns = resolve_mask_patterns(("email", "phone", "mrn", "medicare"))
+    text = ("a." * 10000 + " ") * 2
+    start = time.perf_counter()
+    preprocess_text(text, masks=patterns)
+    assert time.perf_counter() - start < 1.0
@@ -0,0 +1,46 @@
+import pytest
+from striprtf.striprtf import rtf_to_text as striprtf_to_text
+from cava_nlp.tokenization.rtf import rtf_to_text
+
+NOTE_RTF = (
+    r"{\rtf1\ansi\ansicpg1252\deff0{\fonttbl{\f0\fnil\fcharset0 Calibri;}"
+    r"{\f1\fcharset204 Arial;}}{\colortbl;\red0\green0\blue0;}"
+    r"{\*\generator Riched20;}\viewkind4\uc1\pard\f0\fs22 "
+    r"ECOG 1, weight 70.5kg\par Caf\'e9 \u33297? review\par"
+    r"\f1 \'c0\'c1\par {\b bold} \{x\} \\ end\tab c2d8\par}"
+)
+
+
+@pytest.mark.parametrize("rtf", [
+    NOTE_RTF,
+    r"{\rtf1 {\info{\title Note}{\author Dr X}}Patient seen.\line next{\*\bkmkstart a}text}trailing",
+    r"{\rtf1\uc2 a\u33298\'3f\'3fb \uc1\u-1000?c\cell\row}",
+    r"{\rtf1 {\pict\pngblip 89504e47}visible}",
+    r"plain text without groups",
+])
+def test_rtf_matches_striprtf(rtf):
+    assert rtf_to_text(rtf) == striprtf_to_text(rtf)
+
+
+def test_rtf_bytes_input():
+    assert rtf_to_text(NOTE_RTF.encode("ascii")) == rtf_to_text(NOTE_RTF)
+
+
+def test_rtf_skips_binary_payload():
+    rtf = r"{\rtf1 {\*\blob \bin4 }{}\}visible}"
+    assert rtf_to_text(rtf) == "visible"
+
+
+def test_from_rtf_matches_plain_text(nlp_cava):
+    doc = nlp_cava.from_rtf(NOTE_RTF)
+    plain = nlp_cava(striprtf_to_text(NOTE_RTF))
+    assert [t.text for t in doc] == [t.text for t in plain]
+    assert "weight" in [t.text for t in doc]
+
+
+def test_pipe_rtf(nlp_cava):
+    docs = list(nlp_cava.pipe([NOTE_RTF, NOTE_RTF], rtf=True))
+    expected = nlp_cava.from_rtf(NOTE_RTF)
+    assert all(doc.text == expected.text for doc in docs)
+    pairs = list(nlp_cava.pipe([(NOTE_RTF, 1)], rtf=True, as_tuples=True))
+    assert pairs[0][0].text == expected.text and pairs[0][1] == 1
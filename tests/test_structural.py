@@ -47,3 +47,43 @@ def test_nested_parentheticals(nlp_structural):
 
     spans = [doc[s:e].text for s, e in doc._.parentheticals]
     assert "(level (high))" in spans
+
+
+@pytest.fixture(scope="session")
+def nlp_clinical_sents():
+    n = CaVaLang(sentencizer="clinical")
+    n.add_pipe("clinical_normalizer")
+    n.add_pipe("document_layout")
+    return n
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("Reviewed today. Pt well, ECOG 1.\nPlan:\n- continue cisplatin",
+     ["Reviewed today.", "Pt well, ECOG 1.\n", "Plan:\n", "- continue cisplatin"]),
+    ("1. weight 70.5kg\n2) BP 120/80", ["1. weight 70.5kg\n", "2) BP 120/80"]),
+    ("Seen by Dr. Smith. Mr. Jones ok", ["Seen by Dr. Smith.", "Mr. Jones ok"]),
+    ("'Stop.' He said", ["'Stop.'", "He said"]),
+    ("see approx. five. Done.next step", ["see approx. five.", "Done.next step"]),
+    ("Great! and then", ["Great! and then"]),
+])
+def test_clinical_sentencizer_boundaries(nlp_clinical_sents, text, expected):
+    assert [s.text for s in nlp_clinical_sents(text).sents] == expected
+
+
+def test_clinical_sentencizer_list_items(nlp_clinical_sents):
+    doc = nlp_clinical_sents("Plan:\n- PDL1 (high)\n- EGFR negative")
+    assert len(doc._.list_items) == 2
+    assert len(doc._.parentheticals) == 1
+
+
+def test_unknown_sentencizer_raises():
+    with pytest.raises(ValueError):
+        CaVaLang(sentencizer="pyrush")
+
+
+def test_single_sentence_marks_whole_input():
+    n = CaVaLang(sentencizer="single")
+    doc = n("ECOG 1. Weight 70kg\nstable")
+    assert [s.text for s in doc.sents] == [doc.text]
+    assert doc[0].is_sent_start
+    assert len(n("")) == 0
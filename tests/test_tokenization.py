@@ -29,3 +29,73 @@ def test_tokenizer_from_csv(test_name, input_text, expected_raw):
         f"ACTUAL:     {actual}\n"
     )
 
+
+
+def _alnum_samples():
+    import random
+    import string
+
+    from cava_nlp.tokenization.alnum import ALNUM_UNITS
+
+    rng = random.Random(0)
+    chars = string.ascii_letters + string.digits
+    samples = ["70kg", "c1d1x2", "T2N0M0", "5mbar", "12hPa", "x12kg", "HER2", "kg", "42"]
+    samples += ["".join(rng.choice(chars) for _ in range(rng.randint(1, 10))) for _ in range(2000)]
+    samples += [f"{rng.randint(0, 999)}{unit}" for unit in ALNUM_UNITS for _ in range(5)]
+    return samples
+
+
+def test_alnum_fast_path_matches_full_patterns():
+    from cava_nlp.tokenization.alnum import AlnumFastPath
+
+    tokenizer = CaVaLang(sentencizer="clinical").tokenizer
+    suffix, infix = tokenizer.suffix_search, tokenizer.infix_finditer
+    assert isinstance(suffix, AlnumFastPath) and isinstance(infix, AlnumFastPath)
+
+    for text in _alnum_samples():
+        fast, full = suffix(text), suffix.method(text)
+        assert (fast and fast.span()) == (full and full.span()), text
+        assert [m.span() for m in infix(text)] == [m.span() for m in infix.method(text)], text
+
+
+def test_alnum_fast_path_serialises():
+    nlp = CaVaLang(sentencizer="clinical")
+    restored = CaVaLang(sentencizer="clinical")
+    restored.tokenizer.from_bytes(nlp.tokenizer.to_bytes())
+    text = "wt 70kg, T2N0M0, c1d1x2"
+    assert [t.text for t in restored(text)] == [t.text for t in nlp(text)]
+
+
+@pytest.mark.parametrize("text,kind,norm,value", [
+    ("36.9", "decimal", "36.9", 36.9),
+    ("x10^9", "scientific", "10.0^9", 1e9),
+    ("10**6", "scientific", "10.0^6", 1e6),
+    ("5e3", "scientific", "5.0e3", 5000.0),
+    ("1E+3", "scientific", "1.0e3", 1000.0),
+])
+def test_numeric_literal_tokens(text, kind, norm, value):
+    doc = CaVaLang().tokenizer(f"WCC {text}/L")
+    literal = doc[1]
+    assert [t.text for t in doc] == ["WCC", text, "/", "L"]
+    assert (literal._.kind, literal.norm_, literal._.value) == (kind, norm, value)
+    assert getattr(literal._, kind) is True
+
+
+@pytest.mark.parametrize("text", ["2E400", "10^400", "1e309", "x10^" + "9" * 5000], ids=["E", "power", "e", "long"])
+def test_numeric_literal_out_of_range(text):
+    # left as a plain token rather than raising OverflowError
+    doc = CaVaLang()(f"Bed {text} ok")
+    assert [t.text for t in doc] == ["Bed", text, "ok"]
+    assert (doc[1]._.kind, doc[1]._.value, doc[1]._.scientific) == (None, None, False)
+
+
+@pytest.mark.parametrize("text,expected", [
+    ("12.03.2024", ["12", ".", "03", ".", "2024"]),
+    ("1.2.3.4", ["1", ".", "2", ".", "3", ".", "4"]),
+    ("36.9.", ["36.9", "."]),
+    ("5.4x10^9", ["5.4", "x10^9"]),
+    ("210^9", ["210", "^", "9"]),
+])
+def test_numeric_literal_boundaries(text, expected):
+    doc = CaVaLang().tokenizer(text)
+    assert [t.text for t in doc] == expected
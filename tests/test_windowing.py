@@ -0,0 +1,53 @@
+import pytest
+from cava_nlp.windowing import WindowedProcessor, plan_windows
+from .conftest import doc_summary
+
+LINES = [
+    "- Patient is currently ECOG 2 (stable)",
+    "No KRAS today, weight 70.5kg on 12/03/2024",
+    "1. EGFR negative (exon 19)",
+    "Hb 120 g/L. Plan: review in 2 wks",
+]
+
+
+def test_plan_windows_tiles_text():
+    text = "\n".join(LINES * 20)
+    windows = list(plan_windows(text, 200, 50))
+    assert windows[0].core_start == 0 and windows[-1].core_end == len(text)
+    for prev, nxt in zip(windows, windows[1:]):
+        assert prev.core_end == nxt.core_start
+        # cores are cut at line starts
+        assert text[nxt.core_start - 1] == "\n"
+    assert all(w.start <= w.core_start < w.core_end <= w.end for w in windows)
+
+
+@pytest.mark.parametrize("window_chars, overlap_chars", [(150, 40), (300, 0)])
+def test_windowed_matches_full_run(nlp_full, window_chars, overlap_chars):
+    text = "\n".join(LINES * 12)
+    windowed = WindowedProcessor(nlp_full, window_chars=window_chars, overlap_chars=overlap_chars)
+    doc = windowed(text)
+    assert doc_summary(doc) == doc_summary(nlp_full(text))
+    # one value per entity, nothing duplicated at the seams
+    assert len(doc.spans["ecog"]) == 12
+
+
+def test_windowed_without_line_breaks(nlp_full):
+    text = " ".join(LINES * 10)
+    doc = WindowedProcessor(nlp_full, window_chars=120, overlap_chars=30)(text)
+    assert doc.text == nlp_full(text).text
+    assert len(doc.spans["ecog"]) == 10
+
+
+def test_windowed_long_token(nlp_full):
+    # a token longer than the cut slack (window_chars // 4) is not cut
+    text = "x" * 37 + " " + "seen on 12 Jan 2020 weight 70 kg " * 8
+    windows = list(plan_windows(text, 30, 10))
+    assert all(w.core_end == len(text) or text[w.core_end - 1].isspace() for w in windows)
+    assert not any(text[w.core_end].isspace() for w in windows if w.core_end < len(text))
+    doc = WindowedProcessor(nlp_full, window_chars=30, overlap_chars=10)(text)
+    assert doc.text == nlp_full(text).text
+
+
+def test_small_document_single_pass(nlp_full):
+    text = "\n".join(LINES)
+    assert doc_summary(WindowedProcessor(nlp_full)(text)) == doc_summary(nlp_full(text))